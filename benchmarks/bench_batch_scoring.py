@@ -0,0 +1,87 @@
+"""
+Benchmark du scoring vectorisé (NumPy) contre Scoring.
+L'équivalence des deux scorings est vérifiée par tests/test_batch_scoring.py.
+
+Usage:
+    python benchmarks/bench_batch_scoring.py [--games 40] [--sizes 1 100 100000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client import Strategy
+from game_ai_client.models import Deck
+from game_ai_client.scoring import batch
+from game_ai_client.scoring.scoring import Scoring
+from game_ai_client.simulation import GameEngine
+from game_ai_client.utils import Logger
+
+
+def collect_inputs(games: int):
+    """Arguments de Scoring rencontrés par 4 Strategy au fil de parties du moteur."""
+    rows = []
+    for seed in range(games):
+        engine = GameEngine(4, seed)
+        strategies = [Strategy() for _ in range(4)]
+        decks = [Deck() for _ in range(4)]
+        engine.start()
+        while not engine.is_over():
+            player = engine.joueur_courant
+            state = engine.snapshot(player)
+            if player == 0:
+                # Snapshot séparé : Deck.add_card modifie les pioches de l'état joué
+                seen = engine.snapshot(player)
+                rows.append((seen.get_monstres_vivants(), seen.pioches, seen.moi, decks[player].copy(),
+                             seen.degats, seen.sous_tour + 1, seen.get_autres_joueurs(player)))
+            for command, args in strategies[player].decide(state, decks[player], player):
+                ok, turn_over = engine.execute(player, command, args)
+                if turn_over:
+                    break
+            engine.advance()
+    return rows
+
+
+def bench(rows, sizes):
+    for size in sizes:
+        selection = [rows[index % len(rows)] for index in range(size)]
+
+        start = time.perf_counter()
+        for args in selection:
+            Scoring(*args)
+        objects = time.perf_counter() - start
+
+        start = time.perf_counter()
+        states = batch.pack_states(selection)
+        packing = time.perf_counter() - start
+
+        repeat = max(1, 1000 // size)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            batch.score_batch(states)
+        vectorized = (time.perf_counter() - start) / repeat
+
+        print(f"{size:>7} états   Scoring {objects * 1e6 / size:>8.2f} µs/état   "
+              f"score_batch {vectorized * 1e6 / size:>8.3f} µs/état ({objects / vectorized:>6.1f}x)   "
+              f"pack_states {packing * 1e6 / size:>6.2f} µs/état")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=40)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 100, 100000])
+    args = parser.parse_args()
+
+    Logger.set_level("WARNING")
+    if batch.np is None:
+        print("NumPy n'est pas installé : pip install numpy")
+        return 1
+    rows = collect_inputs(args.games)
+    bench(rows, args.sizes)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
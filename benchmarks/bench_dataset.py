@@ -0,0 +1,75 @@
+"""
+Benchmark de la conversion en jeu de données : les mêmes parties, journalisées dans un
+game_client.log et enregistrées dans un fichier d'enregistrement, doivent donner exactement
+les mêmes tours. Mesure ensuite le débit de conversion d'un gros journal.
+
+Usage:
+    python benchmarks/bench_dataset.py [--games 10] [--size 200] 2> /dev/null
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.ai_client import AIClient
+from game_ai_client.recording import MatchRecorder
+from game_ai_client.recording.dataset import convert, read_chunks
+from game_ai_client.server import LocalGame, LocalServer
+from game_ai_client.session import GameSession
+from game_ai_client.utils import Config, Logger
+
+
+def play_tcp_game(seed: int, recorder: MatchRecorder):
+    """Joue une partie contre un LocalServer TCP : Connection journalise chaque message échangé."""
+    server = LocalServer(LocalGame(4, seed), host="127.0.0.1")
+    thread = server.start()
+    config = Config(hostname_server="127.0.0.1", port_server=server.address[1])
+    AIClient(GameSession(config, recorder=recorder)).run_game_loop()
+    thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=10)
+    parser.add_argument('--size', type=int, default=200, help='Taille du gros journal, en Mo')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Le journal est écrit dans le répertoire courant
+        os.chdir(directory)
+        Logger.set_level("DEBUG")
+        recording = os.path.join(directory, "games.p24r")
+        recorder = MatchRecorder(recording)
+        for seed in range(args.games):
+            play_tcp_game(seed, recorder)
+        Logger.flush()
+        log = os.path.join(directory, "game_client.log")
+
+        from_log = os.path.join(directory, "log.p24d")
+        from_recording = os.path.join(directory, "recording.p24d")
+        stats = convert([log], from_log, chunk_turns=1000)
+        assert stats == {**convert([recording], from_recording, chunk_turns=1000), "bytes": stats["bytes"]}
+        assert list(read_chunks(from_log)) == list(read_chunks(from_recording))
+        assert stats["turns"] and not stats["incomplete"]
+        print(f"{args.games} parties : {stats['turns']} tours identiques depuis le journal et l'enregistrement")
+
+        big = os.path.join(directory, "big.log")
+        with open(log, 'rb') as stream:
+            data = stream.read()
+        with open(big, 'wb') as stream:
+            for _ in range(max(1, args.size * 1_000_000 // len(data))):
+                stream.write(data)
+        start = time.perf_counter()
+        stats = convert([big], from_log)
+        elapsed = time.perf_counter() - start
+        print(f"journal de {stats['bytes'] / 1e6:.0f} Mo (niveau DEBUG) : {stats['turns']} tours en {elapsed:.1f} s, "
+              f"{stats['bytes'] / elapsed / 1e6:.0f} Mo/s ({stats['bytes'] / elapsed * 60 / 1e9:.2f} Go/min), "
+              f"{stats['chunks']} paquets")
+        os.chdir(os.path.dirname(directory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark du Deck : lectures par type, ajout de carte, copie et photographie.
+
+Usage:
+    python benchmarks/bench_deck.py [--count 200000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.models import Deck, Pioche, TypeCarte
+from game_ai_client.utils import Logger
+
+
+def filled_deck(cards_per_type: int) -> Deck:
+    deck = Deck()
+    for index in range(cards_per_type):
+        for type_carte in TypeCarte:
+            deck.add_card(Pioche(type_carte, index % 5 + 1))
+    return deck
+
+
+def check_copies():
+    """Une copie et son original évoluent indépendamment, et les agrégats suivent les listes."""
+    deck = filled_deck(6)
+    copy = deck.copy()
+    copy.add_card(Pioche(TypeCarte.SAVOIR, 3))
+    copy.remove_cards_by_type(TypeCarte.DEFENSE)
+    deck.add_card(Pioche(TypeCarte.ATTAQUE, 1))
+    for current in (deck, copy):
+        for type_carte in TypeCarte:
+            cards = current.collections[type_carte]
+            assert current.count_cards_by_type(type_carte) == len(cards)
+            assert current.sum_values_by_type(type_carte) == sum(pioche.valeur for pioche in cards)
+    assert deck.count_cards_by_type(TypeCarte.DEFENSE) == 6 and copy.count_cards_by_type(TypeCarte.DEFENSE) == 0
+    assert deck.count_cards_by_type(TypeCarte.SAVOIR) == 6 and copy.count_cards_by_type(TypeCarte.SAVOIR) == 7
+    assert deck.snapshot() != copy.snapshot() and deck.snapshot() == deck.copy().snapshot()
+    print("copies indépendantes vérifiées")
+
+
+def bench(label: str, count: int, operation):
+    start = time.perf_counter()
+    for _ in range(count):
+        operation()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed / count * 1e9:>8.0f} ns")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=200000)
+    args = parser.parse_args()
+
+    Logger.set_level("WARNING")
+    check_copies()
+    deck = filled_deck(12)
+    bench("sum_values_by_type", args.count, lambda: deck.sum_values_by_type(TypeCarte.DEFENSE))
+    bench("count_cards_by_type", args.count, lambda: deck.count_cards_by_type(TypeCarte.DEFENSE))
+    bench("copy", args.count, deck.copy)
+    bench("snapshot", args.count, deck.snapshot)
+    bench("copy + add_card", args.count, lambda: deck.copy().add_card(Pioche(TypeCarte.SAVOIR, 2)))
+
+
+if __name__ == "__main__":
+    main()
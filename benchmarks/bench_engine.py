@@ -0,0 +1,55 @@
+"""
+Benchmark du moteur de simulation : coût par tour, par partie et par clone().
+
+Usage:
+    python benchmarks/bench_engine.py [--games 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client import Strategy
+from game_ai_client.simulation import GameEngine, play_game
+from game_ai_client.utils import Logger
+
+
+def bench_games(label: str, games: int, strategies):
+    turns = 0
+    start = time.perf_counter()
+    for seed in range(games):
+        turns += play_game(strategies, seed).nb_coups
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22} {elapsed / games * 1000:>8.2f} ms/partie {elapsed / turns * 1e6:>8.2f} µs/tour "
+          f"{games / elapsed * 3600:>10.0f} parties/heure")
+
+
+def bench_clone(count: int):
+    engine = GameEngine(4, 0)
+    start = time.perf_counter()
+    for _ in range(count):
+        engine.clone()
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    for seed in range(count):
+        engine.clone(seed)
+    elapsed_seed = time.perf_counter() - start
+    print(f"clone()                {elapsed / count * 1e6:>8.2f} µs   clone(seed) {elapsed_seed / count * 1e6:>8.2f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=200)
+    args = parser.parse_args()
+
+    Logger.set_level("WARNING")
+    bench_games("moteur seul", args.games, [None] * 4)
+    bench_games("1 Strategy + 3 moteur", args.games, [Strategy(), None, None, None])
+    bench_games("4 Strategy", args.games // 4 or 1, [Strategy() for _ in range(4)])
+    bench_clone(100000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark de la lecture indexée : construction de l'index d'un enregistrement et d'un journal,
+accès direct à un tour, complément de l'index après ajout de parties et parcours sans copie
+de tout le corpus. Les tours lus par l'index doivent être ceux de la lecture séquentielle.
+
+Usage:
+    python benchmarks/bench_index.py [--games 20] [--log game_client.log]
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.ai_client import AIClient
+from game_ai_client.recording import MatchRecorder
+from game_ai_client.recording.format import RECV, iter_records
+from game_ai_client.recording.index import MappedFile, iter_corpus
+from game_ai_client.recording.replay import read_games
+from game_ai_client.server.game import LocalGame
+from game_ai_client.server.transport import MemoryConnection
+from game_ai_client.session import GameSession
+from game_ai_client.utils import Logger
+
+
+def record(path: str, seeds):
+    recorder = MatchRecorder(path)
+    for seed in seeds:
+        session = GameSession(connection=MemoryConnection(LocalGame(4, seed), seed % 4), recorder=recorder)
+        AIClient(session).run_game_loop()
+
+
+def sequential_turns(path: str):
+    """Ouvertures des tours de chaque partie, par lecture séquentielle de tout le fichier."""
+    return [[record.text for record in game.records
+             if record.kind == RECV and record.text.startswith("DEBUT_TOUR|")]
+            for game in read_games(path)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--log', default=None, help='Journal à indexer (par défaut game_client.log du dépôt)')
+    args = parser.parse_args()
+
+    Logger.set_level("ERROR")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "games.p24r")
+        record(path, range(args.games))
+
+        start = time.perf_counter()
+        expected = sequential_turns(path)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with MappedFile(path) as mapped:
+            built = time.perf_counter() - start
+            assert mapped.games == args.games
+            for game, openings in enumerate(expected):
+                assert mapped.turn_count(game) == len(openings)
+                for number, opening in enumerate(openings):
+                    turn = mapped.turn(game, number)
+                    first = next(mapped.records(turn.data))
+                    assert first.text == opening == f"DEBUT_TOUR|{turn.tour}|{turn.sous_tour}"
+            samples = [(game, random.randrange(mapped.turn_count(game)))
+                       for game in (random.randrange(args.games) for _ in range(10000))]
+            start = time.perf_counter()
+            for game, number in samples:
+                mapped.turn(game, number)
+            jump = (time.perf_counter() - start) / len(samples)
+        print(f"enregistrement {os.path.getsize(path) / 1e6:.1f} Mo : lecture séquentielle {sequential * 1000:.0f} ms, "
+              f"index construit en {built * 1000:.0f} ms, accès à un tour {jump * 1e6:.1f} µs")
+
+        start = time.perf_counter()
+        MappedFile(path).close()
+        print(f"index rechargé en {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        record(path, [args.games])
+        start = time.perf_counter()
+        with MappedFile(path) as mapped:
+            completed = time.perf_counter() - start
+            assert mapped.games == args.games + 1
+            assert mapped.turn_count(args.games) == len(sequential_turns(path)[-1])
+        print(f"index complété après ajout d'une partie en {completed * 1000:.1f} ms")
+
+        start = time.perf_counter()
+        turns = records = 0
+        for turn in iter_corpus([path]):
+            turns += 1
+            records += sum(1 for _ in iter_records(turn.data))
+        print(f"corpus : {turns} tours, {records} enregistrements en {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        log = args.log or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                       "game_client.log")
+        if os.path.exists(log):
+            copy = os.path.join(directory, "game_client.log")
+            shutil.copyfile(log, copy)
+            start = time.perf_counter()
+            with MappedFile(copy) as mapped:
+                built = time.perf_counter() - start
+                total = sum(mapped.turn_count(game) for game in range(mapped.games))
+                assert all(bytes(turn.data).split(b"\n", 1)[0].rstrip().endswith(
+                    f"DEBUT_TOUR|{turn.tour}|{turn.sous_tour}".encode()) for turn in mapped.turns())
+            size = os.path.getsize(copy)
+            print(f"journal {size / 1e6:.1f} Mo : {mapped.games} parties, {total} tours, "
+                  f"index construit en {built * 1000:.0f} ms ({size / built / 1e6:.0f} Mo/s)")
+
+
+if __name__ == "__main__":
+    main()
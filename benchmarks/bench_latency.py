@@ -0,0 +1,81 @@
+"""
+Benchmark des latences par tour : centiles de chaque phase (demandes, analyse, décision, envoi)
+sur des parties en mémoire, puis effet de l'échéance par tour sur la recherche Monte Carlo et
+sur un serveur lent (action de repli).
+
+Usage:
+    python benchmarks/bench_latency.py [--games 5] [--deadline 10]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.ai_client import AIClient
+from game_ai_client.server.game import LocalGame
+from game_ai_client.server.transport import MemoryConnection
+from game_ai_client.session import GameSession
+from game_ai_client.simulation.search import MonteCarloStrategy
+from game_ai_client.utils import Config, Logger
+from game_ai_client.utils.latency import PHASES, LatencyStats
+
+
+class SlowConnection(MemoryConnection):
+    """MemoryConnection dont les réponses aux demandes du tour arrivent avec un retard fixe."""
+
+    def __init__(self, game: LocalGame, player: int, delay: float):
+        super().__init__(game, player)
+        self.delay = delay
+
+    def receive_messages(self, count: int):
+        time.sleep(self.delay)
+        return super().receive_messages(count)
+
+
+def play(games: int, deadline=None, strategy_factory=None, delay: float = 0.0) -> LatencyStats:
+    """Joue des parties et renvoie les durées de tous leurs tours."""
+    total = LatencyStats(deadline)
+    for seed in range(games):
+        game = LocalGame(4, seed)
+        connection = SlowConnection(game, seed % 4, delay) if delay else MemoryConnection(game, seed % 4)
+        strategy = strategy_factory() if strategy_factory else None
+        session = GameSession(Config(game_settings={"turn_deadline": deadline}), connection=connection,
+                              strategy=strategy)
+        AIClient(session).run_game_loop()
+        for phase in PHASES:
+            total.samples[phase].extend(session.latency.samples[phase])
+        total.fallbacks += session.latency.fallbacks
+        total.overruns += session.latency.overruns
+    return total
+
+
+def show(label: str, stats: LatencyStats):
+    print(label)
+    for phase in PHASES:
+        values = stats.percentiles(phase)
+        print(f"  {phase:<9} p50 {values['p50'] * 1000:8.3f} ms  p95 {values['p95'] * 1000:8.3f} ms  "
+              f"p99 {values['p99'] * 1000:8.3f} ms  max {values['max'] * 1000:8.3f} ms")
+    if stats.turn_deadline is not None:
+        print(f"  échéance {stats.turn_deadline * 1000:.0f} ms : {stats.fallbacks} replis, "
+              f"{stats.overruns} dépassements sur {stats.percentiles('tour')['count']} tours")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=5)
+    parser.add_argument('--deadline', type=float, default=10, help='Échéance par tour, en millisecondes')
+    args = parser.parse_args()
+
+    Logger.set_level("ERROR")
+    deadline = args.deadline / 1000
+    show("stratégie par défaut", play(args.games))
+    show(f"Monte Carlo, budget 50 ms, échéance {args.deadline:g} ms",
+         play(1, deadline, lambda: MonteCarloStrategy(budget=0.05, seed=0)))
+    show(f"serveur lent ({args.deadline * 1.5:g} ms par demande), échéance {args.deadline:g} ms",
+         play(1, deadline, delay=deadline * 1.5))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Micro-benchmark de la lecture des réponses serveur sur un socketpair local.
+Compare l'ancienne lecture octet par octet (recv(1)) au LineReader tamponné :
+nombre d'appels recv et latence moyenne par message.
+
+Usage:
+    python benchmarks/bench_line_reader.py [--messages 20000]
+"""
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.utils.line_reader import LineReader
+
+
+# Réponses typiques d'un tour, reprises de game_client.log
+SAMPLE_REPLIES = [
+    b"DEBUT_TOUR|7|11",
+    b"95|0|0|0",
+    b"95|0|0|0|95|0|0|0",
+    b"70|280|70|280|70|280",
+    b"DEFENSE|3|ATTAQUE|5|SAVOIR|4|DEFENSE|-21|ATTAQUE|-15|SAVOIR|-15",
+    b"112",
+    b"OK",
+]
+
+
+class CountingSocket:
+    """
+    Enveloppe un socket et compte les appels à recv.
+    """
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self.recv_calls = 0
+
+    def recv(self, size: int) -> bytes:
+        self.recv_calls += 1
+        return self._sock.recv(size)
+
+
+def read_byte_by_byte(sock) -> bytes:
+    """Reproduit l'ancienne implémentation de Connection.receive_message."""
+    data_bytes = bytearray()
+    while True:
+        byte_chunk = sock.recv(1)
+        if not byte_chunk:
+            raise ConnectionError("Connexion fermée par le serveur")
+        if byte_chunk == b'\n':
+            break
+        data_bytes.extend(byte_chunk)
+    return bytes(data_bytes)
+
+
+def writer(sock: socket.socket, count: int):
+    """Envoie `count` réponses, tour par tour, comme le ferait le serveur."""
+    payload = b"".join(line + b"\n" for line in SAMPLE_REPLIES)
+    sent = 0
+    while sent < count:
+        sock.sendall(payload)
+        sent += len(SAMPLE_REPLIES)
+
+
+def run(label: str, count: int, read_one):
+    """Mesure la lecture de `count` messages avec la fonction `read_one`."""
+    left, right = socket.socketpair()
+    counting = CountingSocket(left)
+    thread = threading.Thread(target=writer, args=(right, count), daemon=True)
+    read = read_one(counting)
+    thread.start()
+
+    start = time.perf_counter()
+    for _ in range(count):
+        read()
+    elapsed = time.perf_counter() - start
+
+    thread.join()
+    left.close()
+    right.close()
+    print(f"{label:<14} {counting.recv_calls / count:>10.3f} recv/msg "
+          f"{elapsed / count * 1e6:>10.2f} µs/msg")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--messages', type=int, default=20000)
+    args = parser.parse_args()
+    count = args.messages - args.messages % len(SAMPLE_REPLIES)
+
+    run("recv(1)", count, lambda sock: (lambda: read_byte_by_byte(sock)))
+    run("LineReader", count, lambda sock: LineReader(sock).read_line)
+
+
+if __name__ == "__main__":
+    main()
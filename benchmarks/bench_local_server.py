@@ -0,0 +1,56 @@
+"""
+Benchmark de charge du client contre le serveur local, en mémoire et en TCP.
+Mesure le nombre de parties complètes jouées par minute sur un seul cœur.
+
+Usage:
+    python benchmarks/bench_local_server.py [--games 200] [--tcp-games 20] [--players 4]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client import AIClient, GameSession
+from game_ai_client.server import LocalGame, LocalServer, play_memory_game
+from game_ai_client.utils import Config, Logger
+
+
+def play_tcp_game(seed: int, nb_joueurs: int) -> LocalGame:
+    """Joue une partie complète contre un LocalServer TCP sur un port libre."""
+    server = LocalServer(LocalGame(nb_joueurs, seed), host="127.0.0.1")
+    thread = server.start()
+    config = Config(hostname_server="127.0.0.1", port_server=server.address[1])
+    AIClient(GameSession(config)).run_game_loop()
+    thread.join()
+    return server.game
+
+
+def report(label: str, games: int, elapsed: float):
+    print(f"{label:<8} {games} parties en {elapsed:.2f} s : "
+          f"{games / elapsed * 60:.0f} parties/min, {elapsed / games * 1000:.1f} ms/partie")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--tcp-games', type=int, default=20)
+    parser.add_argument('--players', type=int, default=4)
+    args = parser.parse_args()
+
+    Logger.set_level("WARNING")
+
+    start = time.perf_counter()
+    for seed in range(args.games):
+        play_memory_game(seed, args.players)
+    report("mémoire", args.games, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for seed in range(args.tcp_games):
+        play_tcp_game(seed, args.players)
+    report("tcp", args.tcp_games, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark de la journalisation : coût d'un message pour le thread de jeu, gestionnaires synchrones
+(console + fichier, comme avant) contre file + thread d'écriture, et coût d'un niveau désactivé.
+
+Usage:
+    python benchmarks/bench_logging.py [--count 20000]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.utils import Config, Logger
+
+
+MESSAGE = "PIOCHES|DEFENSE|3|ATTAQUE|1|SAVOIR|5|DEFENSE|-4|ATTAQUE|-9|SAVOIR|-6"
+
+
+def sync_logger(path: str, console) -> logging.Logger:
+    """Logger aux gestionnaires synchrones, configuré comme l'était Logger."""
+    logger = logging.getLogger("bench.sync")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    for handler in (logging.StreamHandler(console), logging.FileHandler(path)):
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    return logger
+
+
+def timed(label: str, count: int, operation):
+    start = time.perf_counter()
+    for _ in range(count):
+        operation()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed / count * 1e6:>8.2f} µs/message")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args()
+    count = args.count
+
+    directory = tempfile.mkdtemp()
+    console = open(os.devnull, 'w')
+    stderr, sys.stderr = sys.stderr, console
+    Config.LOG_FILE = os.path.join(directory, "queue.log")
+    try:
+        logger = sync_logger(os.path.join(directory, "sync.log"), console)
+        timed("synchrone (console + fichier)", count, lambda: logger.log(25, f"--> Message envoyé: {MESSAGE}"))
+
+        Logger.set_level("ACTION")
+        elapsed = timed("file + thread d'écriture", count, lambda: Logger.action("--> Message envoyé: %s", MESSAGE))
+        start = time.perf_counter()
+        Logger.flush()
+        drained = time.perf_counter() - start
+        print(f"{'  écriture restante après la boucle':<44} {drained * 1e3:>8.1f} ms "
+              f"(boucle : {elapsed * 1e3:.1f} ms)")
+
+        Logger.set_level("WARNING")
+        timed("niveau désactivé, f-string", count, lambda: Logger.debug(f"--> Message envoyé: {MESSAGE}"))
+        timed("niveau désactivé, arguments", count, lambda: Logger.debug("--> Message envoyé: %s", MESSAGE))
+        Logger.shutdown()
+
+        with open(Config.LOG_FILE) as written:
+            lines = sum(1 for _ in written)
+        assert lines == count, f"{lines} lignes écrites au lieu de {count}"
+        print(f"{lines} messages écrits par le thread d'écriture")
+    finally:
+        sys.stderr = stderr
+        console.close()
+
+
+if __name__ == "__main__":
+    main()
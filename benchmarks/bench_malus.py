@@ -0,0 +1,107 @@
+"""
+Benchmark du choix de la victime des cartes négatives, sur les états de parties enregistrées.
+Rejoue chaque partie pour retrouver les états observés tour par tour, puis chronomètre le choix
+pour chaque carte négative proposée et le compare au choix naïf (l'adversaire de plus grand savoir actuel).
+
+Usage:
+    python benchmarks/bench_malus.py [--games 20] [--recording parties.p24r]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.ai_client import AIClient
+from game_ai_client.models import TurnState
+from game_ai_client.recording import MatchRecorder
+from game_ai_client.recording.replay import read_games, replay_game
+from game_ai_client.scoring.malus import MalusTargeting
+from game_ai_client.scoring.opponents import OpponentTracker
+from game_ai_client.server.game import LocalGame
+from game_ai_client.server.transport import MemoryConnection
+from game_ai_client.session import GameSession
+from game_ai_client.strategy import Strategy
+from game_ai_client.utils import Logger
+
+
+class CapturingStrategy(Strategy):
+    """Strategy qui garde chaque état observé pendant la relecture."""
+
+    def __init__(self):
+        super().__init__()
+        self.states: List[Tuple[TurnState, Optional[int]]] = []
+
+    def observe(self, state: TurnState, team_number: Optional[int]):
+        self.states.append((state, team_number))
+        super().observe(state, team_number)
+
+
+def record(path: str, games: int):
+    """Enregistre des parties jouées contre le serveur local en mémoire."""
+    recorder = MatchRecorder(path)
+    for seed in range(games):
+        session = GameSession(connection=MemoryConnection(LocalGame(4, seed), seed % 4), recorder=recorder)
+        AIClient(session).run_game_loop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=20, help='Parties à enregistrer sans --recording')
+    parser.add_argument('--recording', help='Fichier d\'enregistrement existant à utiliser')
+    parser.add_argument('--budget', type=float, default=50, help='Budget de décision par tour, en ms')
+    args = parser.parse_args()
+
+    Logger.set_level("ERROR")
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.recording
+        if path is None:
+            path = os.path.join(directory, "parties.p24r")
+            record(path, args.games)
+        games = []
+        for game in read_games(path):
+            strategy = CapturingStrategy()
+            replay_game(game, strategy)
+            games.append(strategy.states)
+
+    durations = []
+    differs = 0
+    gains = []
+    turns = 0
+    for states in games:
+        tracker = OpponentTracker()
+        targeting = MalusTargeting(tracker)
+        for state, team_number in states:
+            tracker.observe(state, team_number)
+            turns += 1
+            for pioche in state.pioches:
+                if pioche.valeur >= 0:
+                    continue
+                start = time.perf_counter()
+                victim = targeting.choose(pioche)
+                durations.append(time.perf_counter() - start)
+                if victim is None:
+                    continue
+                results = {player: top for player, top, _ in targeting.evaluate(pioche)}
+                naive = max((joueur for joueur in state.joueurs if joueur.index in results),
+                            key=lambda joueur: joueur.score_savoir).index
+                if naive != victim:
+                    differs += 1
+                gains.append(results[naive] - results[victim])
+
+    durations.sort()
+    print(f"{len(games)} parties, {turns} tours, {len(durations)} cartes négatives évaluées")
+    p99 = durations[int(len(durations) * 0.99)]
+    print(f"choix de la victime : p50 {statistics.median(durations) * 1e6:.1f} µs, "
+          f"p99 {p99 * 1e6:.1f} µs ({p99 * 1000 / args.budget:.2%} d'un budget de {args.budget:g} ms), "
+          f"max {durations[-1] * 1e6:.1f} µs")
+    print(f"victime différente du plus grand savoir actuel : {differs / max(len(gains), 1):.1%} ; "
+          f"savoir final du meilleur rival abaissé en plus de {statistics.fmean(gains):.1f} en moyenne")
+
+
+if __name__ == "__main__":
+    main()
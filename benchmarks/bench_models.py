@@ -0,0 +1,96 @@
+"""
+Benchmark des modèles : mémoire, allocations, construction, copie et accès, objets contre tables.
+Les classes « dict » reproduisent les modèles d'origine, sans __slots__.
+
+Usage:
+    python benchmarks/bench_models.py [--count 100000]
+"""
+import argparse
+import copy
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.models import Joueur, JoueurTable, Monstre, MonstreTable, Pioche, PiocheTable
+from game_ai_client.utils import Logger
+
+
+class DictJoueur:
+    def __init__(self, vie=0, score_defense=0, score_attaque=0, score_savoir=0):
+        self.vie = vie
+        self.score_defense = score_defense
+        self.score_attaque = score_attaque
+        self.score_savoir = score_savoir
+        self.index = None
+
+
+def check_tables():
+    joueurs = "100|4|0|12|0|0|0|0|87|12|3|250".split('|')
+    monstres = "10|40|0|40|7|40".split('|')
+    pioches = "DEFENSE|3|ATTAQUE|1|SAVOIR|5|DEFENSE|-4|ATTAQUE|-9|SAVOIR|-6".split('|')
+    assert [str(j) for j in JoueurTable.from_server_response(joueurs).to_list()] == \
+        [str(j) for j in Joueur.from_server_response(joueurs)]
+    assert [str(m) for m in MonstreTable.from_server_response(monstres).to_list()] == \
+        [str(m) for m in Monstre.from_server_response(monstres)]
+    assert [str(p) for p in PiocheTable.from_server_response(pioches).to_list()] == \
+        [str(p) for p in Pioche.from_server_response(pioches)]
+    table = MonstreTable.from_server_response(monstres)
+    assert MonstreTable.from_objects(table.to_list()) == table and table.copy() == table
+    print("tables équivalentes aux objets")
+
+
+def measure(label: str, build, count: int):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    built = build()
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    print(f"{label:<30} {size / count:>7.1f} octets/joueur {blocks / count:>6.2f} allocations/joueur "
+          f"{elapsed / count * 1e9:>7.0f} ns/joueur")
+    return built
+
+
+def timed(label: str, count: int, operation):
+    start = time.perf_counter()
+    operation()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<30} {elapsed / count * 1e9:>7.0f} ns/joueur")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+    count = args.count
+
+    Logger.set_level("WARNING")
+    check_tables()
+
+    values = [(100 - i % 100, i % 7, i % 11, i) for i in range(count)]
+    data = [str(v) for row in values for v in row]
+
+    dict_joueurs = measure("construction, dict", lambda: [DictJoueur(*row) for row in values], count)
+    joueurs = measure("construction, __slots__", lambda: [Joueur(*row) for row in values], count)
+    table = measure("construction, JoueurTable", lambda: JoueurTable(*zip(*values)), count)
+    measure("analyse réponse, objets", lambda: Joueur.from_server_response(data), count)
+    measure("analyse réponse, JoueurTable", lambda: JoueurTable.from_server_response(data), count)
+
+    timed("copie, dict (copy.copy)", count, lambda: [copy.copy(j) for j in dict_joueurs])
+    timed("copie, __slots__ (copy())", count, lambda: [j.copy() for j in joueurs])
+    timed("copie, JoueurTable", count, table.copy)
+
+    timed("accès vie, dict", count, lambda: sum(j.vie for j in dict_joueurs))
+    timed("accès vie, __slots__", count, lambda: sum(j.vie for j in joueurs))
+    timed("accès vie, JoueurTable", count, lambda: sum(table.vie))
+
+
+if __name__ == "__main__":
+    main()
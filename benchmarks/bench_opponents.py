@@ -0,0 +1,109 @@
+"""
+Benchmark du suivi des adversaires : coût de la mise à jour par tour et précision des projections.
+Compare le savoir et la défense attendus à la FIN, à chaque étape de la partie, aux valeurs finales
+réelles de parties auto-jouées, et à la projection naïve (valeurs courantes).
+
+Usage:
+    python benchmarks/bench_opponents.py [--games 100] [--updates 20000]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.models import Deck
+from game_ai_client.scoring.opponents import OpponentTracker
+from game_ai_client.simulation import GameEngine
+from game_ai_client.strategy import Strategy
+from game_ai_client.utils import Logger
+
+
+# Tours auxquels la précision est mesurée
+STAGES = (2, 5, 10, 15, 20)
+
+
+def play_tracked_game(seed: int, players: int) -> Tuple[GameEngine, Dict[int, List[Tuple[int, float, float, int, int]]]]:
+    """Joue une partie (Strategy en place 0, le moteur ailleurs) et relève les projections au début de chaque étape."""
+    engine = GameEngine(players, seed)
+    strategy = Strategy()
+    deck = Deck()
+    projections: Dict[int, List[Tuple[int, float, float, int, int]]] = {}
+    engine.start()
+    while not engine.is_over():
+        player = engine.joueur_courant
+        if player == 0:
+            state = engine.snapshot(0)
+            strategy.observe(state, 0)
+            if state.tour in STAGES and state.sous_tour == 0:
+                tracker = strategy.opponents
+                projections[state.tour] = [
+                    (opponent, *tracker.expected_at_fin(opponent), engine.savoir[opponent], engine.defense[opponent])
+                    for opponent in tracker.opponents()]
+            for command, args in strategy.decide(state, deck, 0):
+                ok, turn_over = engine.execute(0, command, args)
+                if turn_over:
+                    break
+        else:
+            engine.play_house_turn(player)
+        engine.advance()
+    return engine, projections
+
+
+def accuracy(games: int, players: int):
+    """Erreur absolue moyenne des projections à chaque étape, comparée à la projection naïve."""
+    errors = {stage: ([], [], [], []) for stage in STAGES}
+    for seed in range(games):
+        engine, projections = play_tracked_game(seed, players)
+        for stage, rows in projections.items():
+            savoir, naive_savoir, defense, naive_defense = errors[stage]
+            for opponent, expected_savoir, expected_defense, current_savoir, current_defense in rows:
+                if engine.vie[opponent] <= 0:
+                    continue
+                savoir.append(abs(expected_savoir - engine.savoir[opponent]))
+                naive_savoir.append(abs(current_savoir - engine.savoir[opponent]))
+                defense.append(abs(expected_defense - engine.defense[opponent]))
+                naive_defense.append(abs(current_defense - engine.defense[opponent]))
+    print(f"erreur absolue moyenne des projections à la FIN ({games} parties, adversaires survivants) :")
+    for stage in STAGES:
+        savoir, naive_savoir, defense, naive_defense = errors[stage]
+        if savoir:
+            print(f"  tour {stage:>2} : savoir {statistics.mean(savoir):7.1f} (naïf {statistics.mean(naive_savoir):7.1f}), "
+                  f"défense {statistics.mean(defense):6.1f} (naïf {statistics.mean(naive_defense):6.1f})")
+
+
+def update_cost(updates: int):
+    """Coût d'observe selon le nombre de joueurs : il doit croître linéairement."""
+    for players in (2, 4, 8, 16):
+        engine = GameEngine(players, 0)
+        states = []
+        for _ in range(64):
+            engine.play_house_turn(engine.joueur_courant)
+            engine.advance()
+            states.append(engine.snapshot(0))
+        tracker = OpponentTracker()
+        start = time.perf_counter()
+        for index in range(updates):
+            tracker.observe(states[index % len(states)], 0)
+        elapsed = time.perf_counter() - start
+        print(f"observe, {players:>2} joueurs : {elapsed / updates * 1e6:6.2f} µs/tour")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--updates', type=int, default=20000)
+    args = parser.parse_args()
+
+    Logger.set_level("ERROR")
+
+    update_cost(args.updates)
+    accuracy(args.games, args.players)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark de l'analyse des réponses du serveur : découpage + modèles d'origine contre fast_parser.
+Les réponses sont extraites du journal game_client.log (ligne reçue qui suit chaque requête envoyée).
+
+Usage:
+    python benchmarks/bench_parser.py [--log game_client.log] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game_ai_client.models import Joueur, Monstre, Pioche
+from game_ai_client.utils import Logger
+from game_ai_client.utils import fast_parser
+
+
+SENT = b"Message envoy"
+RECEIVED = b"<-- Message re"
+
+
+def old_parsers():
+    """Analyse d'origine, sur une réponse décodée."""
+    return {
+        b"MOI": lambda raw: Joueur.from_array(raw.strip().split('|')),
+        b"JOUEURS": lambda raw: Joueur.from_server_response(raw.strip().split('|')),
+        b"MONSTRES": lambda raw: Monstre.from_server_response(raw.strip().split('|')),
+        b"PIOCHES": lambda raw: Pioche.from_server_response(raw.strip().split('|')),
+    }
+
+
+def fast_parsers():
+    """Analyse rapide, renvoyant les mêmes objets que l'analyse d'origine."""
+    return {
+        b"MOI": fast_parser.parse_moi,
+        b"JOUEURS": lambda raw: fast_parser.parse_joueurs(raw).to_list(),
+        b"MONSTRES": lambda raw: fast_parser.parse_monstres(raw).to_list(),
+        b"PIOCHES": lambda raw: fast_parser.parse_pioches(raw).to_list(),
+    }
+
+
+def table_parsers():
+    """Analyse rapide, en restant sous forme compacte."""
+    return {
+        b"MOI": fast_parser.parse_moi,
+        b"JOUEURS": fast_parser.parse_joueurs,
+        b"MONSTRES": fast_parser.parse_monstres,
+        b"PIOCHES": fast_parser.parse_pioches,
+    }
+
+
+def load_replies(path: str):
+    """
+    Extrait du journal les réponses aux requêtes MOI, JOUEURS, MONSTRES et PIOCHES.
+
+    Returns:
+        List[Tuple[bytes, bytes]]: (requête, réponse brute)
+    """
+    replies = []
+    query = None
+    with open(path, 'rb') as log:
+        for line in log:
+            if SENT in line:
+                query = line.rsplit(b': ', 1)[-1].strip()
+            elif RECEIVED in line and query is not None:
+                if query in old_parsers():
+                    replies.append((query, line.split(b': ', 1)[1].rstrip(b'\r\n')))
+                query = None
+    return replies
+
+
+def check(replies):
+    """Les deux analyses donnent les mêmes modèles, index compris."""
+    old, fast = old_parsers(), fast_parsers()
+    for query, raw in replies:
+        text = raw.decode('utf-8', errors='replace')
+        expected = old[query](text)
+        for parsed in (fast[query](text), fast[query](raw)):
+            if query == b"MOI":
+                assert str(parsed) == str(expected) and parsed.index == expected.index, (query, raw)
+            else:
+                assert [(str(o), o.index) for o in parsed] == [(str(o), o.index) for o in expected], (query, raw)
+    print(f"{len(replies)} réponses identiques")
+
+
+def bench(label: str, parsers, messages, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query, raw in messages:
+            parsers[query](raw)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {len(messages) * repeat / elapsed:>12,.0f} messages/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--log', default=os.path.join(ROOT, 'game_client.log'))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    Logger.set_level("ERROR")
+    replies = load_replies(args.log)
+    if not replies:
+        sys.exit(f"aucune réponse trouvée dans {args.log}")
+    check(replies)
+    texts = [(query, raw.decode('utf-8', errors='replace')) for query, raw in replies]
+
+    bench("origine, str", old_parsers(), texts, args.repeat)
+    bench("fast_parser, str -> objets", fast_parsers(), texts, args.repeat)
+    bench("fast_parser, bytes -> objets", fast_parsers(), replies, args.repeat)
+    bench("fast_parser, str -> tables", table_parsers(), texts, args.repeat)
+    bench("fast_parser, bytes -> tables", table_parsers(), replies, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark de reprise du client après des coupures et des réponses lentes injectées.
+Chaque partie est jouée à travers un FaultyProxy puis comparée à la même partie jouée sans panne :
+la reprise ne doit ni perdre ni rejouer d'action, donc l'état final doit être identique.
+Le scénario « silences » fait taire le serveur plus longtemps que le délai d'attente alors que le client
+n'attend aucune réponse : le serveur n'est pas perdu, et aucune reconnexion ne doit avoir lieu.
+
+Usage:
+    python benchmarks/bench_reconnect.py [--games 5] [--drop-every 40] [--slow-every 60] [--delay 0.2] [--idle-every 25]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client import AIClient, GameSession
+from game_ai_client.server import FaultyProxy, LocalGame, LocalServer
+from game_ai_client.utils import Config, Logger
+
+
+def play(seed: int, players: int, timeout: float, proxy_args: Optional[dict] = None) -> Tuple[tuple, float, list, int]:
+    """Joue une partie, à travers un FaultyProxy si proxy_args est fourni."""
+    server = LocalServer(LocalGame(players, seed), host="127.0.0.1")
+    server_thread = server.start()
+    address = server.address
+    proxy = None
+    if proxy_args is not None:
+        proxy = FaultyProxy(address, seed=seed, host="127.0.0.1", **proxy_args)
+        proxy.start()
+        address = proxy.address
+    config = Config(hostname_server="127.0.0.1", port_server=address[1],
+                    game_settings={"timeout": timeout, "retry_attempts": 5, "retry_delay": 0.01})
+    session = GameSession(config)
+    start = time.perf_counter()
+    AIClient(session).run_game_loop()
+    elapsed = time.perf_counter() - start
+    server_thread.join()
+    engine = server.game.engine
+    outcome = (tuple(engine.vie), tuple(engine.savoir), engine.tour)
+    drops = proxy.drops + proxy.slow_replies + proxy.idle_gaps if proxy is not None else 0
+    return outcome, elapsed, session.connection.recovery_times, drops
+
+
+def run(label: str, args, proxy_args: dict, reconnections: bool = True):
+    """Joue les parties d'un scénario et vérifie qu'elles finissent comme sans panne (et sans reprise si demandé)."""
+    recoveries: List[float] = []
+    faults = 0
+    overhead = 0.0
+    for seed in range(args.games):
+        expected, reference, _, _ = play(seed, args.players, args.timeout)
+        outcome, elapsed, times, injected = play(seed, args.players, args.timeout, proxy_args)
+        assert outcome == expected, f"{label}, graine {seed} : {outcome} != {expected}"
+        assert reconnections or not times, f"{label}, graine {seed} : {len(times)} reconnexions inutiles"
+        recoveries.extend(times)
+        faults += injected
+        overhead += elapsed - reference
+    print(f"{label:<10} {args.games} parties identiques, {faults} pannes, {len(recoveries)} reprises", end="")
+    if recoveries:
+        recoveries.sort()
+        print(f", reprise p50 {statistics.median(recoveries) * 1000:.1f} ms, "
+              f"max {recoveries[-1] * 1000:.1f} ms, surcoût {overhead / args.games * 1000:.0f} ms/partie")
+    else:
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=5)
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--drop-every', type=int, default=40)
+    parser.add_argument('--slow-every', type=int, default=60)
+    parser.add_argument('--delay', type=float, default=0.2, help='Retard des réponses lentes, en secondes')
+    parser.add_argument('--idle-every', type=int, default=25, help='Messages spontanés entre deux silences du serveur')
+    parser.add_argument('--timeout', type=float, default=0.1, help='Délai d\'attente du client, en secondes')
+    args = parser.parse_args()
+
+    # Chaque coupure injectée est journalisée en ERROR par la connexion, avant sa reprise
+    Logger.set_level("CRITICAL")
+
+    run("coupures", args, {"drop_every": args.drop_every})
+    run("lenteurs", args, {"slow_every": args.slow_every, "delay": args.delay})
+    run("mixte", args, {"drop_every": args.drop_every, "slow_every": args.slow_every, "delay": args.delay})
+    run("silences", args, {"idle_every": args.idle_every, "idle": args.delay}, reconnections=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark de l'enregistrement et de la relecture des parties : taille des enregistrements,
+surcoût de l'enregistrement sur des parties en mémoire, puis vitesse de relecture.
+La relecture avec la stratégie enregistrée doit rejouer chaque tour à l'identique.
+
+Usage:
+    python benchmarks/bench_replay.py [--games 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.ai_client import AIClient
+from game_ai_client.recording import MatchRecorder
+from game_ai_client.recording.replay import read_games, replay_game
+from game_ai_client.server.game import LocalGame
+from game_ai_client.server.transport import MemoryConnection
+from game_ai_client.session import GameSession
+from game_ai_client.utils import Logger
+
+
+def play(seed: int, recorder=None) -> float:
+    game = LocalGame(4, seed)
+    session = GameSession(connection=MemoryConnection(game, seed % 4), recorder=recorder)
+    start = time.perf_counter()
+    AIClient(session).run_game_loop()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=20)
+    args = parser.parse_args()
+
+    Logger.set_level("ERROR")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "games.p24r")
+        recorder = MatchRecorder(path)
+        plain = sum(play(seed) for seed in range(args.games))
+        recorded = sum(play(seed, recorder) for seed in range(args.games))
+        size = os.path.getsize(path)
+        print(f"{args.games} parties : {plain:.2f} s sans enregistrement, {recorded:.2f} s avec "
+              f"({recorded / plain - 1:+.1%}), {size / args.games / 1024:.1f} Kio par partie")
+
+        start = time.perf_counter()
+        games = list(read_games(path))
+        loaded = time.perf_counter() - start
+        assert len(games) == args.games, f"{len(games)} parties lues sur {args.games}"
+
+        turns = 0
+        turn_times = []
+        start = time.perf_counter()
+        for game in games:
+            result = replay_game(game)
+            assert not result.divergences, f"divergence : {result.divergences[0]}"
+            turns += result.turns
+            turn_times.extend(result.turn_times)
+        elapsed = time.perf_counter() - start
+
+    print(f"lecture du fichier : {loaded * 1000:.1f} ms")
+    print(f"{turns} tours rejoués sans divergence en {elapsed:.2f} s ({turns / elapsed:.0f} tours/s)")
+    print(f"durée d'un tour rejoué : moyenne {statistics.fmean(turn_times) * 1e6:.0f} µs, "
+          f"p95 {statistics.quantiles(turn_times, n=20)[-1] * 1e6:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
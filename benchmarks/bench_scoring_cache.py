@@ -0,0 +1,83 @@
+"""
+Benchmark du cache de scoring : exactitude et taux de succès sur une partie Monte Carlo complète,
+puis taux de succès et simulations par décision selon la taille du cache, sur les mêmes positions.
+
+Usage:
+    python benchmarks/bench_scoring_cache.py [--budget 20] [--decisions 60] [--sizes 0 256 1024 4096 16384]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.models import Deck
+from game_ai_client.scoring.cache import ScoringCache
+from game_ai_client.scoring.scoring import Scoring
+from game_ai_client.simulation import GameEngine, MonteCarloStrategy, play_game
+from game_ai_client.strategy import Strategy
+from game_ai_client.utils import Logger
+
+
+class CheckingCache(ScoringCache):
+    """Cache qui vérifie chaque réponse contre un Scoring recalculé."""
+
+    def get(self, *inputs):
+        scoring = super().get(*inputs)
+        fresh = Scoring(*inputs)
+        assert scoring.get_scored_monstres() == fresh.get_scored_monstres()
+        assert scoring.get_scored_cartes() == fresh.get_scored_cartes()
+        return scoring
+
+
+def check(budget: float):
+    policy = Strategy()
+    policy.scoring_cache = CheckingCache(1024)
+    play_game([MonteCarloStrategy(budget=budget, policy=policy, seed=0), Strategy(), Strategy(), Strategy()], seed=0)
+    stats = policy.scoring_cache.stats()
+    assert stats["hits"] > 0
+    print(f"{stats['hits'] + stats['misses']} scorings identiques avec et sans cache ({stats['hits']} servis par le cache)")
+
+
+def sample_states(count: int):
+    """Positions prises régulièrement dans des parties du moteur, au tour du joueur 0."""
+    engines = []
+    seed = 0
+    while len(engines) < count:
+        engine = GameEngine(4, seed)
+        engine.start()
+        while not engine.is_over() and len(engines) < count:
+            if engine.joueur_courant == 0 and engine.nb_coups % 23 == 0:
+                engines.append(engine.clone())
+            engine.play_house_turn(engine.joueur_courant)
+            engine.advance()
+        seed += 1
+    return engines
+
+
+def run(size: int, engines, budget: float):
+    """Simulations par décision sur les mêmes positions, avec un cache de taille `size`."""
+    strategy = MonteCarloStrategy(budget=budget, policy=Strategy(scoring_cache_size=size), seed=0)
+    for engine in engines:
+        strategy.decide(engine.snapshot(0), Deck(), 0)
+    cache = strategy.policy.scoring_cache
+    hit_rate = cache.hit_rate if cache is not None else 0.0
+    print(f"taille {size:>6} : succès {hit_rate:>6.1%}, {strategy.rollouts / len(engines):>6.1f} simulations par décision")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget', type=float, default=20, help="budget par décision, en millisecondes")
+    parser.add_argument('--decisions', type=int, default=60)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[0, 256, 1024, 4096, 16384])
+    args = parser.parse_args()
+
+    Logger.set_level("ERROR")
+    check(args.budget / 1000)
+    engines = sample_states(args.decisions)
+    for size in args.sizes:
+        run(size, engines, args.budget / 1000)
+
+
+if __name__ == "__main__":
+    main()
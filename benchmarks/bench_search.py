@@ -0,0 +1,86 @@
+"""
+Benchmark de la recherche Monte Carlo : simulations par décision et latence, avec et sans pool de processus.
+
+Usage:
+    python benchmarks/bench_search.py [--budget 50] [--decisions 40] [--workers 0 1 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.models import Deck
+from game_ai_client.simulation import GameEngine, MonteCarloStrategy, ParallelMonteCarloStrategy
+from game_ai_client.simulation.parallel import pack_deck, unpack_deck
+from game_ai_client.utils import Logger
+
+
+def sample_states(count: int):
+    """Positions prises régulièrement dans des parties du moteur, vues par le joueur 0."""
+    states = []
+    seed = 0
+    while len(states) < count:
+        engine = GameEngine(4, seed)
+        engine.start()
+        while not engine.is_over() and len(states) < count:
+            if engine.joueur_courant == 0 and engine.nb_coups % 23 == 0:
+                states.append(engine.snapshot(0))
+            engine.play_house_turn(engine.joueur_courant)
+            engine.advance()
+        seed += 1
+    return states
+
+
+def check_packing():
+    engine = GameEngine(4, 7)
+    for _ in range(50):
+        engine.play_house_turn(engine.joueur_courant)
+        engine.advance()
+    assert GameEngine.unpack(engine.pack()).pack() == engine.pack(), "pack/unpack du moteur incohérent"
+    deck = Deck()
+    for pioche in engine.get_pioches()[:3] * 4:
+        deck.add_card(pioche)
+    assert pack_deck(unpack_deck(pack_deck(deck))) == pack_deck(deck), "pack/unpack du deck incohérent"
+    print(f"état compact : {len(repr(engine.pack()))} caractères")
+
+
+def bench(label: str, strategy: MonteCarloStrategy, states):
+    latencies = []
+    for state in states:
+        start = time.perf_counter()
+        strategy.decide(state, Deck(), 0)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    print(f"{label:<14} {strategy.rollouts / len(states):>8.0f} simulations/décision   "
+          f"p50 {latencies[len(latencies) // 2] * 1000:6.1f} ms   max {latencies[-1] * 1000:6.1f} ms", end="")
+    if isinstance(strategy, ParallelMonteCarloStrategy):
+        received = strategy.merged_results + strategy.late_results
+        print(f"   résultats des processus reçus à temps {strategy.merged_results}/{received}", end="")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget', type=float, default=50, help='Budget par décision, en millisecondes')
+    parser.add_argument('--decisions', type=int, default=40)
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 1, max((os.cpu_count() or 1) - 1, 1)])
+    args = parser.parse_args()
+
+    Logger.set_level("WARNING")
+    check_packing()
+    states = sample_states(args.decisions)
+    for workers in dict.fromkeys(args.workers):
+        if workers == 0:
+            bench("local", MonteCarloStrategy(budget=args.budget / 1000, seed=0), states)
+            continue
+        start = time.perf_counter()
+        strategy = ParallelMonteCarloStrategy(budget=args.budget / 1000, seed=0, workers=workers)
+        print(f"pool de {workers} processus prêt en {(time.perf_counter() - start) * 1000:.0f} ms")
+        bench(f"{workers} processus", strategy, states)
+        strategy.close()
+
+
+if __name__ == "__main__":
+    main()
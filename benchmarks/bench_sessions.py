@@ -0,0 +1,116 @@
+"""
+Benchmark de sessions de jeu concurrentes dans un seul processus.
+Lance un serveur de substitution local, puis N sessions en parallèle (threads ou asyncio).
+
+Usage:
+    python benchmarks/bench_sessions.py [--sessions 32] [--turns 64] [--mode threads|asyncio]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client import AIClient, AsyncAIClient, GameSession
+from game_ai_client.utils import Config, Logger
+
+
+# Réponses fixes aux demandes d'information, reprises de game_client.log
+REPLIES = {
+    "MOI": "95|0|0|0",
+    "JOUEURS": "95|0|0|0",
+    "MONSTRES": "70|280|70|280|70|280",
+    "PIOCHES": "DEFENSE|3|ATTAQUE|5|SAVOIR|4|DEFENSE|-21|ATTAQUE|-15|SAVOIR|-15",
+    "DEGATS": "112",
+}
+
+
+class StandInHandler(socketserver.StreamRequestHandler):
+    """
+    Joue une partie scriptée d'un seul joueur : NOM_EQUIPE, `turns` tours, puis FIN.
+    """
+    turns = 64
+
+    def setup(self):
+        super().setup()
+        # Le serveur répond par petits messages successifs : éviter l'attente de Nagle
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def send(self, message: str):
+        self.wfile.write((message + "\n").encode('utf-8'))
+
+    def handle(self):
+        self.send("NOM_EQUIPE")
+        self.rfile.readline()
+        self.send("Bonjour vous êtes l'équipe |0")
+        for turn in range(self.turns):
+            self.send(f"DEBUT_TOUR|{turn // 16 + 1}|{turn % 16}")
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                command = line.decode('utf-8').strip().split('|')[0]
+                if command in REPLIES:
+                    self.send(REPLIES[command])
+                    continue
+                self.send("OK")
+                if command in ("PIOCHER", "ATTAQUER"):
+                    break
+        self.send("FIN")
+
+
+class StandInServer(socketserver.ThreadingTCPServer):
+    """Serveur de substitution, un thread par connexion."""
+    daemon_threads = True
+    # Toutes les sessions se connectent en même temps
+    request_queue_size = 256
+
+
+def run_threads(sessions: int, port: int):
+    """Lance les sessions bloquantes, une par thread."""
+    def play(_):
+        AIClient(GameSession(Config(hostname_server="127.0.0.1", port_server=port))).run_game_loop()
+
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        list(pool.map(play, range(sessions)))
+
+
+def run_asyncio(sessions: int, port: int):
+    """Lance les sessions asynchrones dans une seule boucle d'événements."""
+    asyncio.run(AsyncAIClient.run_many(sessions, "127.0.0.1", port))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=32)
+    parser.add_argument('--turns', type=int, default=64)
+    parser.add_argument('--mode', choices=['threads', 'asyncio'], default='threads')
+    args = parser.parse_args()
+
+    Logger.set_level("WARNING")
+    StandInHandler.turns = args.turns
+    server = StandInServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    start = time.perf_counter()
+    if args.mode == 'threads':
+        run_threads(args.sessions, port)
+    else:
+        run_asyncio(args.sessions, port)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    total_turns = args.sessions * args.turns
+    print(f"{args.mode}: {args.sessions} sessions x {args.turns} tours en {elapsed:.3f} s "
+          f"({total_turns / elapsed:.0f} tours/s, {elapsed / args.turns * 1000:.2f} ms/tour par session)")
+
+
+if __name__ == "__main__":
+    main()
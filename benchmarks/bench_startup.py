@@ -0,0 +1,88 @@
+"""
+Benchmark du démarrage du client : temps entre le lancement de `python main.py` et sa réponse à
+NOM_EQUIPE, contre un serveur minimal qui termine la partie aussitôt après.
+Vérifie aussi, avec `python -X importtime`, le coût des imports du client par défaut et
+qu'aucun sous-système optionnel (asyncio, recherche, enregistrement, NumPy) n'est chargé.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--target 150] [--import-budget 120]
+"""
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules qu'un client par défaut ne doit pas importer
+OPTIONAL_MODULES = ("asyncio", "multiprocessing", "concurrent.futures", "json", "numpy",
+                    "game_ai_client.simulation", "game_ai_client.recording", "game_ai_client.async_client")
+
+# Imports du chemin de démarrage de main.py
+STARTUP_IMPORTS = "import main; from game_ai_client import AIClient"
+
+
+def cold_start(directory: str) -> float:
+    """Lance main.py et renvoie le temps écoulé jusqu'à sa réponse à NOM_EQUIPE."""
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        port = server.getsockname()[1]
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, os.path.join(ROOT, "main.py"), "--host", "127.0.0.1",
+                                    "--port", str(port), "--log-level", "WARNING"],
+                                   cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        client, _ = server.accept()
+        with client:
+            client.sendall(b"NOM_EQUIPE\n")
+            reader = client.makefile('rb')
+            reader.readline()
+            elapsed = time.perf_counter() - start
+            client.sendall(b"FIN\n")
+        process.wait(timeout=10)
+    return elapsed
+
+
+def import_profile():
+    """Renvoie la durée cumulée des imports du démarrage (µs) et les modules importés."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", STARTUP_IMPORTS],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)", line)
+        if match:
+            modules[match.group(3)] = (int(match.group(1)), len(match.group(2)))
+    total = sum(cumulative for cumulative, depth in modules.values() if depth == 1)
+    return total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--target', type=float, default=150, help='Démarrage maximal (médiane), en ms')
+    parser.add_argument('--import-budget', type=float, default=120, help='Imports maximaux, en ms')
+    args = parser.parse_args()
+
+    total, modules = import_profile()
+    loaded = [name for name in OPTIONAL_MODULES if name in modules]
+    heaviest = sorted(((cumulative, name) for name, (cumulative, depth) in modules.items() if depth == 1),
+                      reverse=True)[:5]
+    print(f"imports du démarrage : {total / 1000:.1f} ms (budget {args.import_budget:g} ms), "
+          f"{len(modules)} modules ; les plus lourds : "
+          + ", ".join(f"{name} {cumulative / 1000:.1f} ms" for cumulative, name in heaviest))
+    assert not loaded, f"modules optionnels importés au démarrage : {loaded}"
+    assert total / 1000 <= args.import_budget, "budget d'import dépassé"
+
+    with tempfile.TemporaryDirectory() as directory:
+        times = [cold_start(directory) for _ in range(args.runs)]
+    median = statistics.median(times) * 1000
+    print(f"démarrage jusqu'à la réponse à NOM_EQUIPE : médiane {median:.0f} ms, "
+          f"min {min(times) * 1000:.0f} ms, max {max(times) * 1000:.0f} ms ({args.runs} lancements)")
+    assert median <= args.target, f"démarrage de {median:.0f} ms, au-delà de {args.target:g} ms"
+
+
+if __name__ == "__main__":
+    main()
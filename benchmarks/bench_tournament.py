@@ -0,0 +1,42 @@
+"""
+Benchmark de passage à l'échelle du tournoi : parties par seconde selon le nombre de processus.
+Le débit doit croître à peu près linéairement jusqu'au nombre de cœurs.
+
+Usage:
+    python benchmarks/bench_tournament.py [--games 400]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.tournament import run_tournament
+from game_ai_client.utils import Logger
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=400)
+    parser.add_argument('--strategies', nargs='+', default=['default', 'house', 'house', 'house'])
+    args = parser.parse_args()
+
+    Logger.set_level("WARNING")
+    cores = os.cpu_count() or 1
+    workers = 1
+    baseline = None
+    while True:
+        start = time.perf_counter()
+        for _ in run_tournament(args.strategies, args.games, workers):
+            pass
+        rate = args.games / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"{workers:>3} processus : {rate:8.1f} parties/s (x{rate / baseline:.2f}, idéal x{workers})")
+        if workers >= cores:
+            break
+        workers = min(workers * 2, cores)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark du cache des demandes d'Action : demandes et allers-retours envoyés au serveur local,
+avec et sans cache, sur les mêmes parties. Les parties doivent se dérouler à l'identique.
+
+Usage:
+    python benchmarks/bench_turn_cache.py [--games 20]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_ai_client.ai_client import AIClient
+from game_ai_client.server.game import LocalGame
+from game_ai_client.server.transport import MemoryConnection
+from game_ai_client.session import GameSession
+from game_ai_client.utils import Config, Logger
+
+
+class CountingConnection(MemoryConnection):
+    """MemoryConnection qui compte les messages et les écritures envoyés par le client."""
+
+    def __init__(self, game: LocalGame, player: int = 0):
+        super().__init__(game, player)
+        self.messages = 0
+        self.writes = 0
+
+    def send_message(self, message: str):
+        self.messages += 1
+        self.writes += 1
+        super().send_message(message)
+
+    def send_messages(self, messages):
+        self.messages += len(messages)
+        self.writes += 1
+        super().send_messages(messages)
+
+
+def play(seed: int, cache: bool):
+    game = LocalGame(4, seed)
+    connection = CountingConnection(game, seed % 4)
+    session = GameSession(Config(game_settings={"turn_cache": cache}), connection=connection)
+    client = AIClient(session)
+    client.run_game_loop()
+    engine = game.engine
+    return (engine.savoir, engine.vie, engine.tour), connection, client.action.cache_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=20)
+    args = parser.parse_args()
+
+    Logger.set_level("ERROR")
+    totals = {False: [0, 0], True: [0, 0]}
+    hits = misses = 0
+    for seed in range(args.games):
+        results = {}
+        for cache in (False, True):
+            results[cache], connection, stats = play(seed, cache)
+            totals[cache][0] += connection.messages
+            totals[cache][1] += connection.writes
+            if cache:
+                hits += stats["hits"]
+                misses += stats["misses"]
+        assert results[False] == results[True], f"partie {seed} différente avec le cache"
+    print(f"{args.games} parties identiques avec et sans cache")
+
+    for cache in (False, True):
+        messages, writes = totals[cache]
+        print(f"cache {'activé' if cache else 'désactivé':<10} {messages:>8} messages {writes:>7} écritures")
+    saved = totals[False][0] - totals[True][0]
+    print(f"demandes servies localement : {hits} / {hits + misses} ({hits / (hits + misses):.1%}), "
+          f"{saved} messages en moins")
+
+
+if __name__ == "__main__":
+    main()
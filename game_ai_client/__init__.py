@@ -1,8 +1,34 @@
 """
 Game AI Client package.
 Provides functionality for connecting to a game server and implementing AI logic.
+
+Exports are imported on first access, so that a client process only pays for the
+subsystems it actually uses (the asyncio client, for instance, is never imported by main.py).
 """
-from .connection import Connection
-from .ai_client import AIClient
+import importlib
+
+# Exported name -> module defining it
+_EXPORTS = {
+    'Connection': '.connection',
+    'SupervisedConnection': '.supervisor',
+    'GameSession': '.session',
+    'AIClient': '.ai_client',
+    'AsyncConnection': '.async_connection',
+    'AsyncAIClient': '.async_client',
+    'Strategy': '.strategy',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Imports an exported name on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['Connection', 'AIClient']
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
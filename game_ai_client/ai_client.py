@@ -2,50 +2,51 @@
 Module client IA pour le jeu.
 Gère la logique du jeu et la prise de décision basée sur la communication avec le serveur.
 """
-from typing import Dict, Any, List
+from typing import List, Optional
 
-from .connection import Connection
+from .session import GameSession
+from .utils.config import Config
 from .utils.logger import Logger
-from .utils.action import Action
-from .models.deck import Deck
-from .scoring.scoring import Scoring
-from .models import TypeCarte
 
 
 class AIClient:
     """
     Client IA pour le jeu.
     Gère la logique du jeu et la prise de décision basée sur la communication avec le serveur.
+    Chaque client pilote une GameSession qui lui est propre.
     """
-    # Instance singleton
-    _instance = None
     
-    def __new__(cls, *args, **kwargs):
-        """
-        Implémente le modèle singleton.
-        """
-        if cls._instance is None:
-            cls._instance = super(AIClient, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
-    
-    def _initialize(self):
+    def __init__(self, session: Optional[GameSession] = None):
         """
         Initialise le client IA.
+        
+        Args:
+            session: Session de jeu à piloter (par défaut une nouvelle GameSession)
         """
-        self.connection = Connection.get_instance()
-        self.action = Action(self.connection)
-        self.game_state: List[str] = []
-        self.team_number: int = None
-        self.deck = Deck()
+        self.session = session if session is not None else GameSession()
+        self.connection = self.session.connection
+        self.action = self.session.action
+        self.deck = self.session.deck
+        self.strategy = self.session.strategy
         Logger.info("Client IA initialisé")
-  
-    def __init__(self):
-        """
-        Initialise le client IA si ce n'est pas déjà fait.
-        """
-        if not hasattr(self, 'game_state'):
-            self._initialize()
+    
+    @property
+    def game_state(self) -> List[str]:
+        """Dernier message du serveur, analysé."""
+        return self.session.game_state
+    
+    @game_state.setter
+    def game_state(self, value: List[str]):
+        self.session.game_state = value
+    
+    @property
+    def team_number(self) -> Optional[int]:
+        """Numéro d'équipe attribué par le serveur."""
+        return self.session.team_number
+    
+    @team_number.setter
+    def team_number(self, value: Optional[int]):
+        self.session.team_number = value
     
     def process_message(self, message: str) -> List[str]:
         """
@@ -67,7 +68,7 @@ class AIClient:
             state_update: Les nouvelles informations d'état
         """
         self.game_state = state_update
-        Logger.debug(f"État du jeu mis à jour: {self.game_state}")
+        Logger.debug("État du jeu mis à jour: %s", self.game_state)
     
     def make_decision(self):
         """
@@ -82,79 +83,30 @@ class AIClient:
         Logger.info("Prise de décision basée sur l'état actuel du jeu")
 
         if self.game_state[0] == "NOM_EQUIPE":
-            self.team_number = self.action.send_team_name("BUTiChat")
+            self.team_number = self.action.send_team_name(self.session.team_name)
 
         if self.game_state[0] == "DEBUT_TOUR":
-            me = self.action.get_moi()
-            other_players = [player for player in self.action.get_joueurs() if int(player.index) != int(self.team_number)]
-            monstres = [monstre for monstre in self.action.get_monstres() if int(monstre.vie) > 0]
-            pioches = self.action.get_pioches()
-            degats = self.action.get_degats()
-            scoring = Scoring(monstres, pioches, me, self.deck, degats, int(self.game_state[2]) + 1, other_players)
-
-            if int(self.game_state[1]) == 20 and int(self.game_state[2]) == 15:
-                self.action.utiliser(TypeCarte.SAVOIR)
-                self.deck.remove_cards_by_type(TypeCarte.SAVOIR)
-
-            if me.score_savoir + self.deck.sum_values_by_type(TypeCarte.SAVOIR) >= 2000 and (int(self.game_state[2]) + 1) % 4 == 0:
-                self.action.utiliser(TypeCarte.SAVOIR)
-                self.deck.remove_cards_by_type(TypeCarte.SAVOIR)
-
-            if int(self.game_state[2]) == 15:
-                self.action.utiliser(TypeCarte.DEFENSE)
-                self.deck.remove_cards_by_type(TypeCarte.DEFENSE)
-
-            print()
-            print()
-            print()
-            print()
-            print()
-            print()
-            Logger.debug(f"Vie: {me.vie}")
-            Logger.debug(f"Score defense: {me.score_defense}")
-            Logger.debug(f"Card defense values: {self.deck.sum_values_by_type(TypeCarte.DEFENSE)}")
-            Logger.debug(f"Degats: {degats}")
-            print()
-
-            if int(self.game_state[2]) == 15 and me.vie + me.score_defense + self.deck.sum_values_by_type(TypeCarte.DEFENSE) <= degats:
-                self.action.utiliser(TypeCarte.SAVOIR)
-                self.deck.remove_cards_by_type(TypeCarte.SAVOIR)
-
-            if (int(self.game_state[2]) + 1) % 4 != 0:
-                card = scoring.get_scored_cartes()[0]
-                for scored_carte in scoring.get_scored_cartes():
-                    if scored_carte["score"] > card["score"]:
-                        card = scored_carte
-                
-                self.action.piocher(card["index"])
-                for p in pioches:
-                    if p.index == card["index"]:
-                        self.deck.add_card(p)
-                        break
-            
-            elif (self.deck.sum_values_by_type(TypeCarte.ATTAQUE) <= 0 and me.score_attaque <= 0) or len(monstres) == 0:
-                card = scoring.get_scored_cartes()[0]
-                for scored_carte in scoring.get_scored_cartes():
-                    if scored_carte["score"] > card["score"]:
-                        card = scored_carte
-                
-                self.action.piocher(card["index"])
-                for p in pioches:
-                    if p.index == card["index"]:
-                        self.deck.add_card(p)
-                        break
-
+            latency = self.session.latency
+            latency.start_turn()
+            tour, sous_tour = int(self.game_state[1]), int(self.game_state[2])
+            responses = self.action.fetch_snapshot(tour, sous_tour)
+            latency.lap("requetes")
+            state = self.action.build_turn_state(responses, tour, sous_tour)
+            latency.lap("analyse")
+            self.strategy.observe(state, self.team_number)
+            if latency.expired():
+                latency.fallbacks += 1
+                commands = self.strategy.fallback(state, self.deck)
             else:
-                self.action.utiliser(TypeCarte.ATTAQUE)
-                self.deck.remove_cards_by_type(TypeCarte.ATTAQUE)
-                monster = scoring.get_scored_monstres()[0]
-                for scored_monster in scoring.get_scored_monstres():
-                    if scored_monster["score"] > monster["score"]:
-                        monster = scored_monster
-                
-                self.action.attaquer(monster["index"])
-
-            
+                self.strategy.deadline = latency.deadline()
+                commands = self.strategy.decide(state, self.deck, self.team_number)
+            duration = latency.lap("decision")
+            if self.session.recorder is not None:
+                self.session.recorder.decision(commands, duration)
+            for command, args in commands:
+                self.action.execute(command, args)
+            latency.lap("envoi")
+            latency.end_turn()
     
     def run_game_loop(self):
         """
@@ -162,6 +114,10 @@ class AIClient:
         Reçoit continuellement des messages, met à jour l'état du jeu, prend des décisions et envoie des réponses.
         """
         Logger.info("Démarrage de la boucle de jeu")
+        recorder = self.session.recorder
+        if recorder is not None:
+            recorder.start_game({"team_name": self.session.team_name,
+                                 "strategy": type(self.strategy).__name__})
         try:
             while True:
                 # Recevoir un message du serveur
@@ -176,7 +132,7 @@ class AIClient:
                 # Mettre à jour l'état du jeu
                 self.update_game_state(parsed_message)
 
-                Logger.info(f"État du jeu mis à jour: {self.game_state}")
+                Logger.info("État du jeu mis à jour: %s", self.game_state)
                 
                 # Prendre une décision
                 self.make_decision()
@@ -187,13 +143,21 @@ class AIClient:
             Logger.critical(f"Erreur inattendue: {e}")
         finally:
             self.connection.stop()
+            self.strategy.close()
+            if recorder is not None:
+                recorder.end_game({"team_number": self.team_number, "latency": self.session.latency.report()})
+            Logger.info(f"Cache des demandes : {self.action.cache_stats()}")
+            self.session.latency.log_report()
             Logger.info("Boucle de jeu terminée")
     
     @classmethod
-    def start(cls):
+    def start(cls, config: Optional[Config] = None):
         """
         Démarre le client IA.
+        
+        Args:
+            config: Configuration de la session (par défaut une nouvelle instance de Config)
         """
-        instance = cls()
+        instance = cls(GameSession(config))
         Logger.info("Démarrage du client IA")
         instance.run_game_loop()
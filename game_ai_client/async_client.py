@@ -0,0 +1,116 @@
+"""
+Module client IA asynchrone pour le jeu.
+Permet de faire tourner plusieurs parties en parallèle dans une seule boucle asyncio.
+"""
+import asyncio
+from typing import List, Optional
+
+from .async_connection import AsyncConnection
+from .utils.async_action import AsyncAction
+from .utils.config import Config
+from .utils.latency import LatencyStats
+from .utils.logger import Logger
+from .models.deck import Deck
+from .strategy import Strategy
+
+
+class AsyncAIClient:
+    """
+    Client IA asynchrone pour le jeu.
+    Chaque instance possède sa propre connexion, son propre deck et sa propre stratégie.
+    """
+
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None,
+                 team_name: str = "BUTiChat", strategy: Optional[Strategy] = None,
+                 config: Optional[Config] = None):
+        """
+        Initialise le client IA asynchrone.
+
+        Args:
+            host: Nom d'hôte du serveur (par défaut config.HOSTNAME_SERVER)
+            port: Port du serveur (par défaut config.PORT_SERVER)
+            team_name: Nom d'équipe envoyé en réponse à NOM_EQUIPE
+            strategy: Stratégie de décision (par défaut Strategy)
+            config: Configuration de la session (par défaut une nouvelle instance de Config)
+        """
+        self.config = config if config is not None else Config()
+        self.connection = AsyncConnection(host, port, config=self.config)
+        self.action = AsyncAction(self.connection)
+        self.team_name = team_name
+        self.strategy = strategy if strategy is not None else Strategy()
+        self.game_state: List[str] = []
+        self.team_number: int = None
+        self.deck = Deck()
+        self.latency = LatencyStats(self.config.GAME_SETTINGS.get("turn_deadline"))
+
+    async def make_decision(self):
+        """
+        Prend une décision basée sur l'état actuel du jeu et envoie les commandes correspondantes.
+        """
+        if self.game_state[0] == "NOM_EQUIPE":
+            self.team_number = await self.action.send_team_name(self.team_name)
+
+        if self.game_state[0] == "DEBUT_TOUR":
+            latency = self.latency
+            latency.start_turn()
+            tour, sous_tour = int(self.game_state[1]), int(self.game_state[2])
+            responses = await self.action.fetch_snapshot(tour, sous_tour)
+            latency.lap("requetes")
+            state = self.action.build_turn_state(responses, tour, sous_tour)
+            latency.lap("analyse")
+            self.strategy.observe(state, self.team_number)
+            if latency.expired():
+                latency.fallbacks += 1
+                commands = self.strategy.fallback(state, self.deck)
+            else:
+                self.strategy.deadline = latency.deadline()
+                commands = self.strategy.decide(state, self.deck, self.team_number)
+            latency.lap("decision")
+            for command, args in commands:
+                await self.action.execute(command, args)
+            latency.lap("envoi")
+            latency.end_turn()
+
+    async def run_game_loop(self):
+        """
+        Exécute la boucle principale du jeu jusqu'au message FIN.
+        """
+        Logger.info("Démarrage de la boucle de jeu asynchrone")
+        try:
+            await self.connection.connect()
+            while True:
+                message = await self.connection.receive_message()
+                parsed_message = self.action.parse_response(message)
+
+                if parsed_message[0] == "FIN":
+                    break
+
+                self.game_state = parsed_message
+                Logger.info("État du jeu mis à jour: %s", self.game_state)
+
+                await self.make_decision()
+
+        except ConnectionError as e:
+            Logger.error(f"Erreur de connexion: {e}")
+        except Exception as e:
+            Logger.critical(f"Erreur inattendue: {e}")
+        finally:
+            await self.connection.stop()
+            self.strategy.close()
+            Logger.info(f"Cache des demandes : {self.action.cache_stats()}")
+            self.latency.log_report()
+            Logger.info("Boucle de jeu terminée")
+
+    @classmethod
+    async def run_many(cls, count: int, host: Optional[str] = None, port: Optional[int] = None,
+                       config: Optional[Config] = None):
+        """
+        Lance `count` clients en parallèle dans la boucle d'événements courante.
+
+        Args:
+            count: Nombre de clients à lancer
+            host: Nom d'hôte du serveur
+            port: Port du serveur
+            config: Configuration des sessions (par défaut une nouvelle instance de Config par client)
+        """
+        await asyncio.gather(*(cls(host, port, config=config).run_game_loop() for _ in range(count)))
@@ -0,0 +1,144 @@
+"""
+Module de connexion asynchrone pour le client IA du jeu.
+Gère la connexion avec le serveur via asyncio (StreamReader/StreamWriter).
+"""
+import asyncio
+from typing import List, Optional
+
+from .utils.config import Config
+from .utils.logger import Logger
+
+
+class AsyncConnection:
+    """
+    Gère une connexion TCP asynchrone avec le serveur de jeu.
+    Contrairement à Connection, chaque instance possède son propre socket, ce qui permet
+    de faire tourner plusieurs parties dans une même boucle d'événements.
+    """
+
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None,
+                 wire_logging: Optional[bool] = None, config: Optional[Config] = None):
+        """
+        Initialise la connexion sans l'ouvrir.
+
+        Args:
+            host: Nom d'hôte du serveur (par défaut config.HOSTNAME_SERVER)
+            port: Port du serveur (par défaut config.PORT_SERVER)
+            wire_logging: Journalise chaque message échangé (par défaut config.GAME_SETTINGS["wire_logging"])
+            config: Configuration de la session (par défaut une nouvelle instance de Config)
+        """
+        self.config = config if config is not None else Config()
+        self.host = host if host is not None else self.config.HOSTNAME_SERVER
+        self.port = port if port is not None else self.config.PORT_SERVER
+        self.wire_logging = (wire_logging if wire_logging is not None
+                             else self.config.GAME_SETTINGS.get("wire_logging", True))
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self):
+        """
+        Établit la connexion au serveur.
+        """
+        try:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            Logger.info(f"Connecté au serveur à {self.host}:{self.port}")
+        except OSError as e:
+            Logger.error(f"Échec de la connexion au serveur: {e}")
+            raise ConnectionError(f"Impossible de se connecter au serveur: {e}")
+
+    def _decode(self, data_bytes: bytes) -> str:
+        """
+        Décode une ligne reçue du serveur.
+
+        Args:
+            data_bytes: Les octets de la ligne, saut de ligne compris
+
+        Returns:
+            str: Le message décodé
+        """
+        data_bytes = data_bytes.rstrip(b'\n')
+        try:
+            message = data_bytes.decode('utf-8')
+        except UnicodeDecodeError:
+            # En cas d'échec avec UTF-8, essayer avec Latin-1 (ISO-8859-1) qui peut décoder n'importe quel octet
+            Logger.warning("Échec du décodage UTF-8, tentative avec Latin-1")
+            message = data_bytes.decode('latin-1')
+
+        if self.wire_logging:
+            Logger.action("<-- Message reçu: %s", message)
+        return message
+
+    async def receive_message(self) -> str:
+        """
+        Reçoit un message du serveur.
+
+        Returns:
+            str: Le message reçu
+        """
+        if self._reader is None:
+            await self.connect()
+
+        try:
+            data_bytes = await self._reader.readuntil(b'\n')
+        except asyncio.IncompleteReadError:
+            raise ConnectionError("Connexion fermée par le serveur")
+        except OSError as e:
+            Logger.error(f"Erreur lors de la réception du message: {e}")
+            raise ConnectionError(f"Erreur lors de la réception du message: {e}")
+        return self._decode(data_bytes)
+
+    async def receive_messages(self, count: int) -> List[str]:
+        """
+        Reçoit exactement `count` messages du serveur, dans l'ordre.
+
+        Args:
+            count: Nombre de messages attendus
+
+        Returns:
+            List[str]: Les messages reçus
+        """
+        return [await self.receive_message() for _ in range(count)]
+
+    async def send_message(self, message: str):
+        """
+        Envoie un message au serveur.
+
+        Args:
+            message: Le message à envoyer
+        """
+        await self.send_messages([message])
+
+    async def send_messages(self, messages: List[str]):
+        """
+        Envoie plusieurs messages au serveur en une seule écriture.
+
+        Args:
+            messages: Les messages à envoyer, dans l'ordre
+        """
+        if self._writer is None:
+            await self.connect()
+
+        try:
+            self._writer.write(''.join(message + '\n' for message in messages).encode('utf-8'))
+            await self._writer.drain()
+            if self.wire_logging:
+                for message in messages:
+                    Logger.action("--> Message envoyé: %s", message)
+        except OSError as e:
+            Logger.error(f"Erreur lors de l'envoi du message: {e}")
+            raise ConnectionError(f"Erreur lors de l'envoi du message: {e}")
+
+    async def stop(self):
+        """
+        Ferme la connexion avec le serveur.
+        """
+        if self._writer:
+            try:
+                self._writer.close()
+                await self._writer.wait_closed()
+                Logger.info("Connexion fermée")
+            except OSError as e:
+                Logger.error(f"Erreur lors de la fermeture de la connexion: {e}")
+            finally:
+                self._reader = None
+                self._writer = None
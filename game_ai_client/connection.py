@@ -3,32 +3,31 @@ Module de connexion pour le client IA du jeu.
 Gère l'établissement de la connexion avec le serveur et l'échange de messages.
 """
 import socket
-from typing import Optional
+from typing import List, Optional
 
 from .utils.config import Config
-from .utils.logger import Logger, LogLevel
+from .utils.logger import Logger
+from .utils.line_reader import LineReader
 
 
 class Connection:
     """
     Gère la connexion TCP avec le serveur de jeu.
-    Implémente le modèle singleton pour assurer une instance unique de connexion.
+    Chaque session de jeu possède sa propre instance, configurée par son propre Config.
     """
-    # Instance singleton
-    _instance: Optional['Connection'] = None
     
-    # Attributs de connexion
-    _client: Optional[socket.socket] = None
-    
-    def __new__(cls, *args, **kwargs):
-        """Implémente le modèle singleton."""
-        if cls._instance is None:
-            cls._instance = super(Connection, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
-    
-    def _initialize(self):
-        """Initialise la connexion en créant des flux de communication."""
+    def __init__(self, config: Optional[Config] = None, client: Optional[socket.socket] = None):
+        """
+        Initialise la connexion et se connecte au serveur.
+        
+        Args:
+            config: Configuration de la session (par défaut une nouvelle instance de Config)
+            client: Socket déjà connecté à utiliser à la place d'une connexion TCP (optionnel)
+        """
+        self.config = config if config is not None else Config()
+        self.wire_logging = self.config.GAME_SETTINGS.get("wire_logging", True)
+        self._client: Optional[socket.socket] = client
+        self._reader: Optional[LineReader] = LineReader(client) if client is not None else None
         self._create_streams()
     
     def _connect_to_server(self):
@@ -37,8 +36,9 @@ class Connection:
         """
         try:
             self._client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._client.connect(Config.get_server_address())
-            Logger.info(f"Connecté au serveur à {Config.HOSTNAME_SERVER}:{Config.PORT_SERVER}")
+            self._client.connect(self.config.get_server_address())
+            self._reader = LineReader(self._client)
+            Logger.info(f"Connecté au serveur à {self.config.HOSTNAME_SERVER}:{self.config.PORT_SERVER}")
         except socket.error as e:
             Logger.error(f"Échec de la connexion au serveur: {e}")
             raise ConnectionError(f"Impossible de se connecter au serveur: {e}")
@@ -50,6 +50,38 @@ class Connection:
         if self._client is None:
             self._connect_to_server()
     
+    def _get_reader(self) -> LineReader:
+        """
+        Renvoie le lecteur tamponné associé au socket courant, en se connectant si nécessaire.
+
+        Returns:
+            LineReader: Le lecteur de lignes
+        """
+        if self._client is None:
+            self._connect_to_server()
+        return self._reader
+
+    def _decode(self, data_bytes: bytes) -> str:
+        """
+        Décode une ligne reçue du serveur.
+
+        Args:
+            data_bytes: Les octets de la ligne, sans le saut de ligne
+
+        Returns:
+            str: Le message décodé
+        """
+        try:
+            message = data_bytes.decode('utf-8')
+        except UnicodeDecodeError:
+            # En cas d'échec avec UTF-8, essayer avec Latin-1 (ISO-8859-1) qui peut décoder n'importe quel octet
+            Logger.warning("Échec du décodage UTF-8, tentative avec Latin-1")
+            message = data_bytes.decode('latin-1')
+
+        if self.wire_logging:
+            Logger.action("<-- Message reçu: %s", message)
+        return message
+
     def receive_message(self) -> str:
         """
         Reçoit un message du serveur.
@@ -57,38 +89,42 @@ class Connection:
         Returns:
             str: Le message reçu
         """
-        if self._client is None:
-            self._connect_to_server()
-            
+        reader = self._get_reader()
+
         try:
-            # Recevoir des données jusqu'au caractère de nouvelle ligne
-            data_bytes = bytearray()
-            while True:
-                byte_chunk = self._client.recv(1)
-                if not byte_chunk:
-                    # Connexion fermée par le serveur
-                    raise ConnectionError("Connexion fermée par le serveur")
-                
-                # Si on trouve un saut de ligne, on arrête la lecture
-                if byte_chunk == b'\n':
-                    break
-                    
-                # Sinon on ajoute l'octet au buffer
-                data_bytes.extend(byte_chunk)
-            
-            # Décoder les données complètes en UTF-8
-            try:
-                message = data_bytes.decode('utf-8')
-            except UnicodeDecodeError:
-                # En cas d'échec avec UTF-8, essayer avec Latin-1 (ISO-8859-1) qui peut décoder n'importe quel octet
-                Logger.warning("Échec du décodage UTF-8, tentative avec Latin-1")
-                message = data_bytes.decode('latin-1')
-                
-            Logger.action(f"<-- Message reçu: {message}")
-            return message
+            return self._decode(reader.read_line())
         except socket.error as e:
             Logger.error(f"Erreur lors de la réception du message: {e}")
             raise ConnectionError(f"Erreur lors de la réception du message: {e}")
+
+    def receive_messages(self, count: int) -> List[str]:
+        """
+        Reçoit exactement `count` messages du serveur, dans l'ordre.
+
+        Args:
+            count: Nombre de messages attendus
+
+        Returns:
+            List[str]: Les messages reçus
+        """
+        reader = self._get_reader()
+
+        try:
+            return [self._decode(line) for line in reader.read_lines(count)]
+        except socket.error as e:
+            Logger.error(f"Erreur lors de la réception des messages: {e}")
+            raise ConnectionError(f"Erreur lors de la réception des messages: {e}")
+
+    def receive_pending(self) -> List[str]:
+        """
+        Renvoie les messages déjà reçus et mis en file, sans attendre le serveur.
+
+        Returns:
+            List[str]: Les messages en attente (éventuellement vide)
+        """
+        if self._reader is None:
+            return []
+        return [self._decode(line) for line in self._reader.pending_lines()]
     
     def send_message(self, message: str):
         """
@@ -104,11 +140,32 @@ class Connection:
             # Ajouter un caractère de nouvelle ligne à la fin du message
             full_message = message + '\n'
             self._client.sendall(full_message.encode('utf-8'))
-            Logger.action(f"--> Message envoyé: {message}")
+            if self.wire_logging:
+                Logger.action("--> Message envoyé: %s", message)
         except socket.error as e:
             Logger.error(f"Erreur lors de l'envoi du message: {e}")
             raise ConnectionError(f"Erreur lors de l'envoi du message: {e}")
     
+    def send_messages(self, messages: List[str]):
+        """
+        Envoie plusieurs messages au serveur en un seul appel à sendall.
+        
+        Args:
+            messages: Les messages à envoyer, dans l'ordre
+        """
+        if self._client is None:
+            self._connect_to_server()
+            
+        try:
+            full_message = ''.join(message + '\n' for message in messages)
+            self._client.sendall(full_message.encode('utf-8'))
+            if self.wire_logging:
+                for message in messages:
+                    Logger.action("--> Message envoyé: %s", message)
+        except socket.error as e:
+            Logger.error(f"Erreur lors de l'envoi des messages: {e}")
+            raise ConnectionError(f"Erreur lors de l'envoi des messages: {e}")
+    
     def stop(self):
         """
         Ferme la connexion avec le serveur.
@@ -118,17 +175,6 @@ class Connection:
                 self._client.close()
                 Logger.info("Connexion fermée")
                 self._client = None
+                self._reader = None
             except socket.error as e:
                 Logger.error(f"Erreur lors de la fermeture de la connexion: {e}")
-    
-    @classmethod
-    def get_instance(cls) -> 'Connection':
-        """
-        Obtient l'instance singleton de la classe Connection.
-        
-        Returns:
-            Connection: L'instance singleton
-        """
-        if cls._instance is None:
-            cls._instance = Connection()
-        return cls._instance
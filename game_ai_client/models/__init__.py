@@ -6,4 +6,7 @@ Contient les classes pour stocker et manipuler les données du jeu.
 from .joueur import Joueur
 from .monstre import Monstre
 from .pioche import Pioche, TypeCarte
-from .deck import Deck
\ No newline at end of file
+from .deck import Deck, DeckSnapshot
+from .turn_state import TurnState
+from .rules import GameRules
+from .tables import JoueurTable, MonstreTable, PiocheTable
@@ -1,17 +1,40 @@
 """
 Module contenant la classe Deck pour gérer les pioches organisées par type.
 """
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Tuple
 from collections import defaultdict
 
 from .pioche import Pioche, TypeCarte
-from ..utils.logger import Logger
+from ..utils.logger import Logger, LogLevel
+
+
+# Ordre des types dans un DeckSnapshot : celui de TypeCarte
+_INDEX_TYPE = {type_carte: index for index, type_carte in enumerate(TypeCarte)}
+
+
+class DeckSnapshot(NamedTuple):
+    """
+    Photographie immuable d'un deck : nombre de cartes et somme des valeurs par type, sans les cartes.
+    Offre les mêmes lectures que Deck ; hachable, elle peut servir de clé de cache.
+    """
+    counts: Tuple[int, ...]
+    sums: Tuple[int, ...]
+
+    def count_cards_by_type(self, type_carte: TypeCarte) -> int:
+        """Nombre de cartes du type donné."""
+        return self.counts[_INDEX_TYPE[type_carte]]
+
+    def sum_values_by_type(self, type_carte: TypeCarte) -> int:
+        """Somme des valeurs des cartes du type donné."""
+        return self.sums[_INDEX_TYPE[type_carte]]
 
 
 class Deck:
     """
     Classe représentant un deck de cartes organisé par type.
     Permet de gérer et d'analyser les collections de pioches par type (DEFENSE, ATTAQUE, SAVOIR).
+    Le nombre de cartes et la somme des valeurs de chaque type sont tenus à jour à chaque modification ;
+    les listes de `collections` ne doivent donc être modifiées qu'à travers les méthodes du deck.
     """
     
     def __init__(self):
@@ -23,7 +46,57 @@ class Deck:
             TypeCarte.ATTAQUE: [],
             TypeCarte.SAVOIR: []
         }
-    
+        self._counts: Dict[TypeCarte, int] = {type_carte: 0 for type_carte in self.collections}
+        self._sums: Dict[TypeCarte, int] = {type_carte: 0 for type_carte in self.collections}
+        # Types dont la liste appartient à ce deck seul ; les autres sont partagées avec une copie
+        self._owned = set(self.collections)
+
+    def copy(self) -> 'Deck':
+        """
+        Copie le deck en temps constant : les listes de cartes sont partagées
+        et ne sont recopiées que lorsque l'un des deux decks modifie un type.
+
+        Returns:
+            Deck: Une copie indépendante du deck
+        """
+        copy = Deck.__new__(Deck)
+        copy.collections = dict(self.collections)
+        copy._counts = dict(self._counts)
+        copy._sums = dict(self._sums)
+        copy._owned = set()
+        self._owned = set()
+        return copy
+
+    def snapshot(self) -> DeckSnapshot:
+        """
+        Renvoie une photographie immuable du deck (nombres et sommes par type).
+
+        Returns:
+            DeckSnapshot: La photographie
+        """
+        # Les dictionnaires d'agrégats sont créés dans l'ordre de TypeCarte et ne changent pas de clés
+        return DeckSnapshot(tuple(self._counts.values()), tuple(self._sums.values()))
+
+    def _writable(self, type_carte: TypeCarte) -> List[Pioche]:
+        """Renvoie la liste des cartes d'un type, recopiée d'abord si elle est partagée."""
+        if type_carte not in self._owned:
+            self.collections[type_carte] = list(self.collections[type_carte])
+            self._owned.add(type_carte)
+        return self.collections[type_carte]
+
+    def set_cards(self, type_carte: TypeCarte, pioches: List[Pioche]):
+        """
+        Remplace les cartes d'un type, sans appliquer de multiplicateur (valeurs déjà en deck).
+
+        Args:
+            type_carte: Type des cartes
+            pioches: Les cartes
+        """
+        self.collections[type_carte] = list(pioches)
+        self._owned.add(type_carte)
+        self._counts[type_carte] = len(pioches)
+        self._sums[type_carte] = sum(pioche.valeur for pioche in pioches)
+
     def add_card(self, pioche: Pioche):
         """
         Ajoute une seule pioche au deck.
@@ -35,9 +108,11 @@ class Deck:
             bool: True si la pioche a été ajoutée, False sinon
         """
         card_count = self.count_cards_by_type(pioche.type_carte)
-        Logger.debug(f"Card count: {card_count}")
-        Logger.debug(f"Card values: {self.sum_values_by_type(pioche.type_carte)}")
-        Logger.debug(f"Card value: {pioche.valeur}")
+        debug = Logger.is_enabled(LogLevel.DEBUG)
+        if debug:
+            Logger.debug("Card count: %s", card_count)
+            Logger.debug("Card values: %s", self.sum_values_by_type(pioche.type_carte))
+            Logger.debug("Card value: %s", pioche.valeur)
 
         # Ajuster la valeur selon le nombre de cartes du même type
         if card_count > 8:
@@ -45,9 +120,12 @@ class Deck:
         elif card_count >= 5:
             pioche.valeur = int(pioche.valeur * 1.5)
 
-        self.collections[pioche.type_carte].append(pioche)
-        Logger.debug(f"Card count: {self.count_cards_by_type(pioche.type_carte)}")
-        Logger.debug(f"Card values: {self.sum_values_by_type(pioche.type_carte)}")
+        self._writable(pioche.type_carte).append(pioche)
+        self._counts[pioche.type_carte] += 1
+        self._sums[pioche.type_carte] += pioche.valeur
+        if debug:
+            Logger.debug("Card count: %s", self.count_cards_by_type(pioche.type_carte))
+            Logger.debug("Card values: %s", self.sum_values_by_type(pioche.type_carte))
 
     def remove_cards_by_type(self, type_carte: TypeCarte):
         """
@@ -57,6 +135,9 @@ class Deck:
             type_carte: Type de carte à supprimer
         """
         self.collections[type_carte] = []
+        self._owned.add(type_carte)
+        self._counts[type_carte] = 0
+        self._sums[type_carte] = 0
     
     def count_cards_by_type(self, type_carte: TypeCarte) -> int:
         """
@@ -68,7 +149,7 @@ class Deck:
         Returns:
             int: Nombre de pioches du type spécifié
         """
-        return len(self.collections.get(type_carte, []))
+        return self._counts.get(type_carte, 0)
     
     def sum_values_by_type(self, type_carte: TypeCarte) -> int:
         """
@@ -80,7 +161,25 @@ class Deck:
         Returns:
             int: Somme des valeurs des pioches du type spécifié
         """
-        return sum(pioche.valeur for pioche in self.collections.get(type_carte, []))
+        return self._sums.get(type_carte, 0)
+
+    def get_total_count(self) -> int:
+        """
+        Compte le nombre total de pioches du deck.
+
+        Returns:
+            int: Nombre de pioches, tous types confondus
+        """
+        return sum(self._counts.values())
+
+    def get_total_value(self) -> int:
+        """
+        Calcule la somme des valeurs de toutes les pioches du deck.
+
+        Returns:
+            int: Somme des valeurs, tous types confondus
+        """
+        return sum(self._sums.values())
     
     def get_summary(self) -> Dict[str, Tuple[int, int]]:
         """
@@ -10,6 +10,8 @@ class Joueur:
     Classe représentant un joueur dans le jeu.
     Contient les informations sur la vie et les scores.
     """
+    __slots__ = ('vie', 'score_defense', 'score_attaque', 'score_savoir', 'index')
+
     def __init__(self, vie: int = 0, score_defense: int = 0, score_attaque: int = 0, score_savoir: int = 0):
         """
         Initialise un joueur avec ses statistiques.
@@ -26,6 +28,21 @@ class Joueur:
         self.score_savoir = score_savoir
         self.index = None
 
+    def copy(self) -> 'Joueur':
+        """
+        Copie le joueur.
+
+        Returns:
+            Joueur: Une copie indépendante
+        """
+        copy = Joueur.__new__(Joueur)
+        copy.vie = self.vie
+        copy.score_defense = self.score_defense
+        copy.score_attaque = self.score_attaque
+        copy.score_savoir = self.score_savoir
+        copy.index = self.index
+        return copy
+
     def set_index(self, index: int):
         """
         Définit l'index du joueur.
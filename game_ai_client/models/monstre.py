@@ -10,6 +10,8 @@ class Monstre:
     Classe représentant un monstre dans le jeu.
     Contient les informations sur la vie et le gain de savoir.
     """
+    __slots__ = ('vie', 'gain_savoir', 'index')
+
     def __init__(self, vie: int = 0, gain_savoir: int = 0):
         """
         Initialise un monstre avec ses statistiques.
@@ -22,6 +24,19 @@ class Monstre:
         self.gain_savoir = gain_savoir
         self.index = 0
 
+    def copy(self) -> 'Monstre':
+        """
+        Copie le monstre.
+
+        Returns:
+            Monstre: Une copie indépendante
+        """
+        copy = Monstre.__new__(Monstre)
+        copy.vie = self.vie
+        copy.gain_savoir = self.gain_savoir
+        copy.index = self.index
+        return copy
+
     def set_index(self, index: int):
         """
         Définit l'index du monstre.
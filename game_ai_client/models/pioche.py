@@ -14,12 +14,22 @@ class TypeCarte(Enum):
     ATTAQUE = "ATTAQUE"
     SAVOIR = "SAVOIR"
 
+    # Chaque membre est unique : un hachage par identité (en C) remplace Enum.__hash__,
+    # écrit en Python, pour les dictionnaires du Deck et les clés du cache de scoring
+    __hash__ = object.__hash__
+
+
+# Noms des types de carte, calculés une fois pour l'analyse des réponses
+NOMS_TYPES = frozenset(type_carte.value for type_carte in TypeCarte)
+
 
 class Pioche:
     """
     Classe représentant une pioche (expédition) dans le jeu.
     Contient les informations sur le type de carte et sa valeur.
     """
+    __slots__ = ('type_carte', 'valeur', 'index')
+
     def __init__(self, type_carte: Optional[TypeCarte] = None, valeur: int = 0):
         """
         Initialise une pioche avec son type et sa valeur.
@@ -32,6 +42,19 @@ class Pioche:
         self.valeur = valeur
         self.index = 0
 
+    def copy(self) -> 'Pioche':
+        """
+        Copie la pioche (Deck.add_card modifie la valeur de la pioche ajoutée).
+
+        Returns:
+            Pioche: Une copie indépendante
+        """
+        copy = Pioche.__new__(Pioche)
+        copy.type_carte = self.type_carte
+        copy.valeur = self.valeur
+        copy.index = self.index
+        return copy
+
     def set_index(self, index: int):
         """
         Définit l'index de la pioche.
@@ -58,7 +81,7 @@ class Pioche:
         
         try:
             type_carte = None
-            if data[0] in [t.value for t in TypeCarte]:
+            if data[0] in NOMS_TYPES:
                 type_carte = TypeCarte(data[0])
             
             return cls(
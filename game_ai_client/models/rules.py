@@ -0,0 +1,51 @@
+"""
+Module contenant les paramètres des règles du jeu, partagés par le moteur de simulation,
+le serveur local et le suivi des adversaires de la stratégie.
+"""
+
+
+class GameRules:
+    """
+    Paramètres des règles du jeu.
+    Les attributs de classe servent de valeurs par défaut, comme pour Config.
+    """
+    NB_TOURS: int = 20
+    NB_SOUS_TOURS: int = 16
+    NB_MONSTRES: int = 3
+    VIE_INITIALE: int = 100
+
+    # Vie des monstres : VIE_MONSTRE_BASE + VIE_MONSTRE_PALIER * ((tour - 1) // TOURS_PAR_PALIER)
+    VIE_MONSTRE_BASE: int = 10
+    VIE_MONSTRE_PALIER: int = 30
+    TOURS_PAR_PALIER: int = 3
+    # Savoir gagné en achevant un monstre, proportionnel à sa vie maximale
+    MULTIPLICATEUR_SAVOIR_MONSTRE: int = 4
+
+    # Dégâts de fin de tour : DEGATS_PAR_TOUR * tour
+    DEGATS_PAR_TOUR: int = 16
+
+    # Valeurs des cartes positives : randint(1, VALEUR_POSITIVE_MAX)
+    VALEUR_POSITIVE_MAX: int = 5
+    # Valeurs des cartes négatives : -(randint(1, VALEUR_NEGATIVE_MAX) + MALUS_PAR_TOUR * tour)
+    VALEUR_NEGATIVE_MAX: int = 10
+    MALUS_PAR_TOUR: int = 2
+
+    # Nombre maximal de commandes acceptées pendant un tour avant de passer au joueur suivant
+    MAX_COMMANDES_PAR_TOUR: int = 64
+
+    @classmethod
+    def multiplicateur_deck(cls, card_count: int) -> float:
+        """
+        Renvoie le multiplicateur appliqué à une carte selon le nombre de cartes du même type déjà en deck.
+
+        Args:
+            card_count: Nombre de cartes du même type dans le deck
+
+        Returns:
+            float: Le multiplicateur de valeur
+        """
+        if card_count > 8:
+            return 2
+        if card_count >= 5:
+            return 1.5
+        return 1
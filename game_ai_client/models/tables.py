@@ -0,0 +1,300 @@
+"""
+Module contenant les formes en colonnes (tables) des joueurs, des monstres et des pioches.
+Chaque champ est un tableau d'entiers (array) ; la ligne i correspond à l'élément d'index i.
+Une table se construit directement depuis une réponse du serveur et se copie en une recopie
+mémoire par champ, sans créer d'objet par élément.
+"""
+from array import array
+from typing import Iterable, List, Sequence, Tuple
+
+from .joueur import Joueur
+from .monstre import Monstre
+from .pioche import Pioche, TypeCarte
+from ..utils.logger import Logger
+
+
+# Code d'un type de carte dans PiocheTable.type_carte (-1 pour un type inconnu)
+TYPES_CARTE = list(TypeCarte)
+CODE_TYPE = {type_carte.value: code for code, type_carte in enumerate(TYPES_CARTE)}
+TYPE_INCONNU = -1
+
+
+class _Table:
+    """
+    Base des tables : un array d'entiers par champ, tous de même longueur.
+    """
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+    TYPECODES: Tuple[str, ...] = ()
+
+    def __init__(self, *columns: Iterable[int]):
+        """
+        Initialise la table à partir de ses colonnes (vides si aucune n'est donnée).
+
+        Args:
+            columns: Une séquence d'entiers par champ, dans l'ordre de FIELDS
+        """
+        columns = columns or ((),) * len(self.FIELDS)
+        for name, typecode, column in zip(self.FIELDS, self.TYPECODES, columns):
+            setattr(self, name, array(typecode, column))
+
+    @classmethod
+    def _parse(cls, data: Sequence[str], label: str) -> List[List[int]]:
+        """
+        Découpe une réponse plate du serveur en colonnes d'entiers.
+        Comme from_server_response, un bloc incomplet est ignoré et un bloc invalide vaut zéro.
+        """
+        width = len(cls.FIELDS)
+        if len(data) % width != 0:
+            Logger.warning(f"Format de données {label} invalide: {len(data)} éléments n'est pas un multiple de {width}")
+        count = len(data) // width
+        try:
+            values = list(map(int, data[:count * width]))
+        except ValueError:
+            values = []
+            for start in range(0, count * width, width):
+                try:
+                    values.extend(map(int, data[start:start + width]))
+                except ValueError as e:
+                    Logger.warning(f"Erreur de conversion des données {label}: {e}")
+                    values.extend([0] * width)
+        return [values[field::width] for field in range(width)]
+
+    def copy(self):
+        """
+        Copie la table.
+
+        Returns:
+            La copie, de même classe
+        """
+        copy = self.__class__.__new__(self.__class__)
+        for name in self.FIELDS:
+            setattr(copy, name, getattr(self, name)[:])
+        return copy
+
+    def __len__(self) -> int:
+        """Nombre de lignes."""
+        return len(getattr(self, self.FIELDS[0]))
+
+    def __eq__(self, other) -> bool:
+        """Deux tables sont égales si elles sont de même classe et ont les mêmes colonnes."""
+        return type(self) is type(other) and all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    def __str__(self) -> str:
+        """Retourne une représentation textuelle de la table."""
+        columns = ", ".join(f"{name}={list(getattr(self, name))}" for name in self.FIELDS)
+        return f"{self.__class__.__name__}({columns})"
+
+
+class JoueurTable(_Table):
+    """
+    Joueurs en colonnes : vie, score_defense, score_attaque, score_savoir.
+    """
+    __slots__ = ('vie', 'score_defense', 'score_attaque', 'score_savoir')
+    FIELDS = __slots__
+    TYPECODES = ('q', 'q', 'q', 'q')
+
+    @classmethod
+    def from_server_response(cls, data: Sequence[str]) -> 'JoueurTable':
+        """
+        Crée la table à partir de la réponse JOUEURS découpée (4 éléments par joueur).
+
+        Args:
+            data: Tableau contenant toutes les données des joueurs à la suite
+
+        Returns:
+            JoueurTable: La table
+        """
+        return cls(*cls._parse(data, "joueurs"))
+
+    @classmethod
+    def from_objects(cls, joueurs: Iterable[Joueur]) -> 'JoueurTable':
+        """
+        Crée la table à partir de joueurs, dans l'ordre donné.
+
+        Args:
+            joueurs: Les joueurs
+
+        Returns:
+            JoueurTable: La table
+        """
+        joueurs = list(joueurs)
+        return cls([j.vie for j in joueurs], [j.score_defense for j in joueurs],
+                   [j.score_attaque for j in joueurs], [j.score_savoir for j in joueurs])
+
+    def get(self, index: int) -> Joueur:
+        """
+        Renvoie la ligne `index` sous forme de Joueur indexé.
+
+        Args:
+            index: Index du joueur
+
+        Returns:
+            Joueur: Le joueur
+        """
+        joueur = Joueur(self.vie[index], self.score_defense[index], self.score_attaque[index], self.score_savoir[index])
+        joueur.set_index(index)
+        return joueur
+
+    def to_list(self) -> List[Joueur]:
+        """
+        Renvoie tous les joueurs, comme Joueur.from_server_response.
+
+        Returns:
+            List[Joueur]: Les joueurs, indexés
+        """
+        joueurs = list(map(Joueur, self.vie, self.score_defense, self.score_attaque, self.score_savoir))
+        for index, joueur in enumerate(joueurs):
+            joueur.index = index
+        return joueurs
+
+
+class MonstreTable(_Table):
+    """
+    Monstres en colonnes : vie, gain_savoir.
+    """
+    __slots__ = ('vie', 'gain_savoir')
+    FIELDS = __slots__
+    TYPECODES = ('q', 'q')
+
+    @classmethod
+    def from_server_response(cls, data: Sequence[str]) -> 'MonstreTable':
+        """
+        Crée la table à partir de la réponse MONSTRES découpée (2 éléments par monstre).
+
+        Args:
+            data: Tableau contenant toutes les données des monstres à la suite
+
+        Returns:
+            MonstreTable: La table
+        """
+        return cls(*cls._parse(data, "monstres"))
+
+    @classmethod
+    def from_objects(cls, monstres: Iterable[Monstre]) -> 'MonstreTable':
+        """
+        Crée la table à partir de monstres, dans l'ordre donné.
+
+        Args:
+            monstres: Les monstres
+
+        Returns:
+            MonstreTable: La table
+        """
+        monstres = list(monstres)
+        return cls([m.vie for m in monstres], [m.gain_savoir for m in monstres])
+
+    def get(self, index: int) -> Monstre:
+        """
+        Renvoie la ligne `index` sous forme de Monstre indexé.
+
+        Args:
+            index: Index du monstre
+
+        Returns:
+            Monstre: Le monstre
+        """
+        monstre = Monstre(self.vie[index], self.gain_savoir[index])
+        monstre.set_index(index)
+        return monstre
+
+    def to_list(self) -> List[Monstre]:
+        """
+        Renvoie tous les monstres, comme Monstre.from_server_response.
+
+        Returns:
+            List[Monstre]: Les monstres, indexés
+        """
+        monstres = list(map(Monstre, self.vie, self.gain_savoir))
+        for index, monstre in enumerate(monstres):
+            monstre.index = index
+        return monstres
+
+    def vivants(self) -> List[int]:
+        """
+        Renvoie les index des monstres encore en vie.
+
+        Returns:
+            List[int]: Les index
+        """
+        return [index for index, vie in enumerate(self.vie) if vie > 0]
+
+
+class PiocheTable(_Table):
+    """
+    Pioches en colonnes : type_carte (code dans TYPES_CARTE, TYPE_INCONNU sinon), valeur.
+    """
+    __slots__ = ('type_carte', 'valeur')
+    FIELDS = __slots__
+    TYPECODES = ('b', 'q')
+
+    @classmethod
+    def from_server_response(cls, data: Sequence[str]) -> 'PiocheTable':
+        """
+        Crée la table à partir de la réponse PIOCHES découpée (2 éléments par pioche).
+
+        Args:
+            data: Tableau contenant toutes les données des pioches à la suite
+
+        Returns:
+            PiocheTable: La table
+        """
+        if len(data) % 2 != 0:
+            Logger.warning(f"Format de données pioches invalide: {len(data)} éléments n'est pas un multiple de 2")
+        count = len(data) // 2
+        types = [CODE_TYPE.get(name, TYPE_INCONNU) for name in data[0:count * 2:2]]
+        try:
+            valeurs = list(map(int, data[1:count * 2:2]))
+        except ValueError as e:
+            Logger.warning(f"Erreur de conversion des données pioches: {e}")
+            valeurs = []
+            for index, valeur in enumerate(data[1:count * 2:2]):
+                try:
+                    valeurs.append(int(valeur))
+                except ValueError:
+                    types[index] = TYPE_INCONNU
+                    valeurs.append(0)
+        return cls(types, valeurs)
+
+    @classmethod
+    def from_objects(cls, pioches: Iterable[Pioche]) -> 'PiocheTable':
+        """
+        Crée la table à partir de pioches, dans l'ordre donné.
+
+        Args:
+            pioches: Les pioches
+
+        Returns:
+            PiocheTable: La table
+        """
+        pioches = list(pioches)
+        return cls([CODE_TYPE[p.type_carte.value] if p.type_carte else TYPE_INCONNU for p in pioches],
+                   [p.valeur for p in pioches])
+
+    def get(self, index: int) -> Pioche:
+        """
+        Renvoie la ligne `index` sous forme de Pioche indexée.
+
+        Args:
+            index: Index de la pioche
+
+        Returns:
+            Pioche: La pioche
+        """
+        code = self.type_carte[index]
+        pioche = Pioche(TYPES_CARTE[code] if code != TYPE_INCONNU else None, self.valeur[index])
+        pioche.set_index(index)
+        return pioche
+
+    def to_list(self) -> List[Pioche]:
+        """
+        Renvoie toutes les pioches, comme Pioche.from_server_response.
+
+        Returns:
+            List[Pioche]: Les pioches, indexées
+        """
+        types = [TYPES_CARTE[code] if code != TYPE_INCONNU else None for code in self.type_carte]
+        pioches = list(map(Pioche, types, self.valeur))
+        for index, pioche in enumerate(pioches):
+            pioche.index = index
+        return pioches
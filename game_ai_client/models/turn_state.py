@@ -0,0 +1,63 @@
+"""
+Module contenant la classe pour représenter l'état du jeu au début d'un tour.
+"""
+from typing import List, Optional
+
+from .joueur import Joueur
+from .monstre import Monstre
+from .pioche import Pioche
+
+
+class TurnState:
+    """
+    Classe représentant l'état du jeu vu par le joueur au début d'un tour.
+    Regroupe les réponses aux demandes MOI, JOUEURS, MONSTRES, PIOCHES et DEGATS.
+    """
+    def __init__(self, moi: Joueur, joueurs: List[Joueur], monstres: List[Monstre],
+                 pioches: List[Pioche], degats: int, tour: int = 0, sous_tour: int = 0):
+        """
+        Initialise l'état du tour.
+
+        Args:
+            moi: Statistiques du joueur actuel
+            joueurs: Statistiques de tous les joueurs
+            monstres: Liste des monstres
+            pioches: Liste des pioches (expéditions)
+            degats: Dégâts infligés à la fin de la manche
+            tour: Numéro du tour (premier argument de DEBUT_TOUR)
+            sous_tour: Numéro du sous-tour (second argument de DEBUT_TOUR)
+        """
+        self.moi = moi
+        self.joueurs = joueurs
+        self.monstres = monstres
+        self.pioches = pioches
+        self.degats = degats
+        self.tour = tour
+        self.sous_tour = sous_tour
+
+    def get_autres_joueurs(self, team_number: Optional[int]) -> List[Joueur]:
+        """
+        Renvoie les joueurs adverses.
+
+        Args:
+            team_number: Numéro de notre équipe
+
+        Returns:
+            List[Joueur]: Les joueurs dont l'index diffère du nôtre
+        """
+        return [joueur for joueur in self.joueurs if joueur.index != team_number]
+
+    def get_monstres_vivants(self) -> List[Monstre]:
+        """
+        Renvoie les monstres encore en vie.
+
+        Returns:
+            List[Monstre]: Les monstres dont la vie est strictement positive
+        """
+        return [monstre for monstre in self.monstres if monstre.vie > 0]
+
+    def __str__(self) -> str:
+        """Retourne une représentation textuelle de l'état du tour."""
+        return (f"TurnState(tour={self.tour}, sous_tour={self.sous_tour}, moi={self.moi}, "
+                f"joueurs={len(self.joueurs)}, monstres={len(self.monstres)}, "
+                f"pioches={len(self.pioches)}, degats={self.degats})")
@@ -0,0 +1,10 @@
+"""
+Enregistrement et relecture des parties.
+MatchRecorder enregistre chaque échange avec le serveur et chaque décision dans un fichier binaire
+en ajout seul ; le module replay rejoue ces parties avec un AIClient, sans serveur, pour comparer
+et mesurer des stratégies (python -m game_ai_client.recording).
+"""
+from .format import Record, read_records
+from .recorder import MatchRecorder, RecordingConnection
+
+__all__ = ['MatchRecorder', 'Record', 'RecordingConnection', 'read_records']
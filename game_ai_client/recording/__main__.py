@@ -0,0 +1,53 @@
+"""
+Relecture de parties enregistrées.
+
+Usage:
+    python -m game_ai_client.recording parties.p24r --strategy default
+"""
+import argparse
+import statistics
+import sys
+import time
+
+from ..tournament import STRATEGIES
+from ..utils import Logger
+from .replay import replay_file
+
+
+def main() -> int:
+    """
+    Rejoue les parties d'un fichier et affiche les divergences et les durées des tours.
+    """
+    parser = argparse.ArgumentParser(description='Relecture de parties enregistrées')
+    parser.add_argument('file', help="Fichier d'enregistrement")
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES), default="default", help='Stratégie rejouée')
+    parser.add_argument('--show', type=int, default=5, help='Nombre de divergences affichées par partie')
+    args = parser.parse_args()
+    if STRATEGIES[args.strategy]() is None:
+        parser.error(f"la variante {args.strategy} est jouée par le serveur, elle ne peut pas être rejouée")
+    Logger.set_level("WARNING")
+
+    turns = 0
+    divergences = 0
+    turn_times = []
+    start = time.perf_counter()
+    for number, result in enumerate(replay_file(args.file, STRATEGIES[args.strategy]), start=1):
+        turns += result.turns
+        divergences += len(result.divergences)
+        turn_times.extend(result.turn_times)
+        print(f"Partie {number} : {result.turns} tours, {len(result.divergences)} divergence(s)")
+        for divergence in result.divergences[:args.show]:
+            print(f"  {divergence.opening} : attendu {divergence.expected}, joué {divergence.actual}")
+    elapsed = time.perf_counter() - start
+
+    print(f"{turns} tours rejoués en {elapsed:.2f} s ({turns / elapsed if elapsed else 0:.0f} tours/s), "
+          f"{divergences} divergence(s)")
+    if len(turn_times) >= 2:
+        p95 = statistics.quantiles(turn_times, n=20)[-1]
+        print(f"Durée d'un tour : moyenne {statistics.fmean(turn_times) * 1000:.3f} ms, "
+              f"p95 {p95 * 1000:.3f} ms")
+    return 1 if divergences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
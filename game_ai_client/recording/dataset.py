@@ -0,0 +1,465 @@
+"""
+Conversion des journaux et des enregistrements en jeu de données de tours, en colonnes.
+
+Chaque tour est reconstruit à partir des messages échangés avec le serveur : lignes ACTION
+(`<--` reçu, `-->` envoyé) d'un game_client.log, ou enregistrements RECV/SEND d'un fichier
+d'enregistrement. Un tour réunit les arguments de DEBUT_TOUR, les réponses à MOI, JOUEURS,
+MONSTRES, PIOCHES et DEGATS (la dernière réponse connue de la partie quand la demande a été
+servie par le cache du tour), les cartes utilisées et l'action qui termine le tour.
+
+Le journal est lu par blocs et en octets : les lignes DEBUG, les lignes vides des print() et les
+accents mal encodés (Latin-1 ou UTF-8) n'ont pas à être décodés, seules les lignes ACTION sont lues.
+Les tours sont écrits par paquets de taille fixe, en mémoire constante quelle que soit la taille du journal.
+
+Format du fichier produit : DATASET_MAGIC, puis des paquets
+    nombre de tours (u32) | nombre de colonnes (u16) | colonnes
+et pour chaque colonne
+    longueur du nom (u8) | nom | type de l'array (1 octet) | nombre de valeurs (u64) | valeurs (little-endian)
+Les colonnes de longueur variable (joueurs, monstres, pioches) ont une colonne `<nom>_offsets` :
+les valeurs du tour i vont de offsets[i] à offsets[i + 1].
+
+Usage:
+    python -m game_ai_client.recording.dataset game_client.log -o tours.p24d
+"""
+import argparse
+import re
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : seul to_numpy en a besoin
+    np = None
+
+from ..models.tables import CODE_TYPE, TYPE_INCONNU
+from ..utils.logger import Logger
+from .format import HEADER, MAGIC, RECV, SEND, iter_records
+
+
+# Début d'un fichier de jeu de données : signature et version
+DATASET_MAGIC = b"P24D\x01"
+
+# Nombre de tours par paquet
+CHUNK_TURNS = 8192
+
+# Taille des blocs lus dans un journal
+READ_SIZE = 1 << 22
+
+# Colonnes d'un paquet, avec le type de leur array
+COLUMNS = (
+    ("game", 'I'), ("team", 'i'), ("tour", 'I'), ("sous_tour", 'I'),
+    ("vie", 'q'), ("score_defense", 'q'), ("score_attaque", 'q'), ("score_savoir", 'q'), ("degats", 'q'),
+    ("joueurs", 'q'), ("joueurs_offsets", 'Q'),
+    ("monstres", 'q'), ("monstres_offsets", 'Q'),
+    ("pioches_type", 'b'), ("pioches_valeur", 'q'), ("pioches_offsets", 'Q'),
+    ("utiliser", 'B'), ("action", 'b'), ("action_arg", 'i'), ("malus", 'i'), ("action_ok", 'b'),
+)
+
+# Codes de la colonne action
+ACTION_AUCUNE = 0
+ACTION_PIOCHER = 1
+ACTION_ATTAQUER = 2
+
+_CHUNK = struct.Struct('<IH')
+_COLUMN = struct.Struct('<cQ')
+
+# Ligne ACTION d'un journal : sens (« <-- » reçu, « --> » envoyé) et message
+_LOG_MESSAGE = re.compile(rb" - ACTION - (<|-)-[->] [^:\n]*: ([^\r\n]*)")
+
+_TYPE_CODES = {name.encode('ascii'): code for name, code in CODE_TYPE.items()}
+_QUERIES = (b"MOI", b"JOUEURS", b"MONSTRES", b"PIOCHES", b"DEGATS")
+_ACTIONS = {b"PIOCHER": ACTION_PIOCHER, b"ATTAQUER": ACTION_ATTAQUER}
+
+
+def _ints(raw: bytes) -> Optional[array]:
+    """Valeurs entières d'une réponse, None si elle n'en contient pas que."""
+    try:
+        return array('q', map(int, raw.split(b'|')))
+    except ValueError:
+        return None
+
+
+class DatasetWriter:
+    """
+    Écrit les tours par paquets de colonnes (voir le format en tête du module).
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_turns: int = CHUNK_TURNS):
+        """
+        Initialise l'écrivain et écrit la signature du fichier.
+
+        Args:
+            stream: Fichier ouvert en écriture binaire
+            chunk_turns: Nombre de tours par paquet
+        """
+        self.stream = stream
+        self.chunk_turns = chunk_turns
+        self.turns = 0
+        self.chunks = 0
+        stream.write(DATASET_MAGIC)
+        self._reset()
+
+    def _reset(self):
+        """Commence un nouveau paquet."""
+        self.columns: Dict[str, array] = {name: array(typecode) for name, typecode in COLUMNS}
+        for name in ("joueurs_offsets", "monstres_offsets", "pioches_offsets"):
+            self.columns[name].append(0)
+        self.pending = 0
+
+    def end_turn(self):
+        """
+        Termine le tour dont les colonnes viennent d'être remplies, et écrit le paquet s'il est plein.
+        """
+        columns = self.columns
+        columns["joueurs_offsets"].append(len(columns["joueurs"]))
+        columns["monstres_offsets"].append(len(columns["monstres"]))
+        columns["pioches_offsets"].append(len(columns["pioches_valeur"]))
+        self.pending += 1
+        self.turns += 1
+        if self.pending >= self.chunk_turns:
+            self.flush()
+
+    def flush(self):
+        """
+        Écrit le paquet en cours, s'il contient des tours.
+        """
+        if not self.pending:
+            return
+        write = self.stream.write
+        write(_CHUNK.pack(self.pending, len(COLUMNS)))
+        for name, typecode in COLUMNS:
+            column = self.columns[name]
+            if sys.byteorder == 'big':
+                column.byteswap()
+            encoded = name.encode('ascii')
+            write(bytes((len(encoded),)) + encoded)
+            write(_COLUMN.pack(typecode.encode('ascii'), len(column)))
+            column.tofile(self.stream)
+        self.chunks += 1
+        self._reset()
+
+
+class TurnAssembler:
+    """
+    Reconstruit les tours à partir des messages échangés, dans l'ordre, et les confie à un DatasetWriter.
+    Chaque réponse est associée à la plus ancienne demande en attente ; un message du serveur qui
+    ouvre une partie ou un tour (NOM_EQUIPE, DEBUT_TOUR, FIN) resynchronise les demandes en attente.
+    """
+
+    def __init__(self, writer: DatasetWriter):
+        """
+        Initialise l'assembleur.
+
+        Args:
+            writer: Destination des tours complets
+        """
+        self.writer = writer
+        self.games = 0
+        self.incomplete = 0
+        self._pending: deque = deque()
+        self._known: Dict[bytes, object] = {}
+        self._team = -1
+        self._turn: Optional[tuple] = None
+        self._action = ACTION_AUCUNE
+        self._action_arg = -1
+        self._malus = -1
+        self._action_ok = 0
+        self._utiliser = 0
+
+    def _finish_turn(self):
+        """Écrit le tour en cours s'il est complet."""
+        if self._turn is None:
+            return
+        known = self._known
+        if self._action == ACTION_AUCUNE or any(query not in known for query in _QUERIES):
+            self.incomplete += 1
+        else:
+            columns = self.writer.columns
+            columns["game"].append(self.games - 1)
+            columns["team"].append(self._team)
+            columns["tour"].append(self._turn[0])
+            columns["sous_tour"].append(self._turn[1])
+            vie, score_defense, score_attaque, score_savoir = known[b"MOI"]
+            columns["vie"].append(vie)
+            columns["score_defense"].append(score_defense)
+            columns["score_attaque"].append(score_attaque)
+            columns["score_savoir"].append(score_savoir)
+            columns["degats"].append(known[b"DEGATS"])
+            columns["joueurs"].extend(known[b"JOUEURS"])
+            columns["monstres"].extend(known[b"MONSTRES"])
+            types, valeurs = known[b"PIOCHES"]
+            columns["pioches_type"].extend(types)
+            columns["pioches_valeur"].extend(valeurs)
+            columns["utiliser"].append(self._utiliser)
+            columns["action"].append(self._action)
+            columns["action_arg"].append(self._action_arg)
+            columns["malus"].append(self._malus)
+            columns["action_ok"].append(self._action_ok)
+            self.writer.end_turn()
+        self._turn = None
+
+    def _reply(self, request: bytes, reply: bytes):
+        """Enregistre la réponse à une demande."""
+        if reply.startswith(b"NOK"):
+            return
+        if request in _ACTIONS:
+            self._action_ok = int(reply == b"OK")
+        elif request == b"PIOCHES":
+            fields = reply.split(b'|')
+            if len(fields) % 2:
+                return
+            try:
+                valeurs = array('q', map(int, fields[1::2]))
+            except ValueError:
+                return
+            self._known[request] = ([_TYPE_CODES.get(name, TYPE_INCONNU) for name in fields[0::2]], valeurs)
+        elif request in _QUERIES:
+            values = _ints(reply)
+            if values is None:
+                return
+            if request == b"DEGATS":
+                self._known[request] = values[0]
+            elif request != b"MOI" or len(values) == 4:
+                self._known[request] = values
+        elif b"|" in reply:
+            # Réponse au nom d'équipe : « Bonjour ... |numéro »
+            team = reply.rsplit(b"|", 1)[1].strip()
+            if team.isdigit():
+                self._team = int(team)
+
+    def received(self, message: bytes):
+        """
+        Traite un message reçu du serveur.
+
+        Args:
+            message: Le message, sans fin de ligne
+        """
+        if message.startswith(b"DEBUT_TOUR|"):
+            self._finish_turn()
+            self._pending.clear()
+            fields = message.split(b'|')
+            try:
+                self._turn = (int(fields[1]), int(fields[2]))
+            except (IndexError, ValueError):
+                return
+            # Journal commencé en cours de partie
+            self.games = self.games or 1
+            self._action = ACTION_AUCUNE
+            self._action_arg = self._malus = -1
+            self._action_ok = self._utiliser = 0
+        elif message == b"NOM_EQUIPE":
+            self._finish_turn()
+            self._pending.clear()
+            self._known = {}
+            self._team = -1
+            self.games += 1
+        elif message == b"FIN":
+            self._finish_turn()
+            self._pending.clear()
+        elif self._pending:
+            self._reply(self._pending.popleft(), message)
+
+    def sent(self, message: bytes):
+        """
+        Traite un message envoyé au serveur.
+
+        Args:
+            message: Le message, sans fin de ligne
+        """
+        fields = message.split(b'|')
+        command = fields[0]
+        self._pending.append(command)
+        if self._turn is None:
+            return
+        action = _ACTIONS.get(command)
+        try:
+            if action is not None:
+                self._action = action
+                self._action_arg = int(fields[1])
+                self._malus = int(fields[2]) if len(fields) > 2 else -1
+            elif command == b"UTILISER":
+                code = _TYPE_CODES.get(fields[1], TYPE_INCONNU)
+                if code != TYPE_INCONNU:
+                    self._utiliser |= 1 << code
+        except (IndexError, ValueError):
+            pass
+
+    def close(self):
+        """
+        Termine le dernier tour.
+        """
+        self._finish_turn()
+
+
+def feed_log(stream: BinaryIO, assembler: TurnAssembler) -> int:
+    """
+    Lit un journal par blocs et transmet ses lignes ACTION à l'assembleur.
+
+    Args:
+        stream: Le journal, ouvert en lecture binaire
+        assembler: L'assembleur des tours
+
+    Returns:
+        int: Nombre d'octets lus
+    """
+    size = 0
+    rest = b""
+    received = assembler.received
+    sent = assembler.sent
+    findall = _LOG_MESSAGE.findall
+    while True:
+        block = stream.read(READ_SIZE)
+        size += len(block)
+        if not block:
+            block, rest = rest, b""
+        else:
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            block, rest = block[:cut], block[cut:]
+        if not block:
+            return size
+        for direction, message in findall(block):
+            if direction == b"<":
+                received(message)
+            else:
+                sent(message)
+
+
+def feed_recording(stream: BinaryIO, assembler: TurnAssembler) -> int:
+    """
+    Lit un fichier d'enregistrement par blocs et transmet ses messages à l'assembleur.
+
+    Args:
+        stream: Le fichier, ouvert en lecture binaire et positionné après MAGIC
+        assembler: L'assembleur des tours
+
+    Returns:
+        int: Nombre d'octets lus
+    """
+    size = len(MAGIC)
+    rest = b""
+    received = assembler.received
+    sent = assembler.sent
+    header_size = HEADER.size
+    while True:
+        block = stream.read(READ_SIZE)
+        if not block:
+            return size
+        size += len(block)
+        data = rest + block
+        # Un enregistrement coupé par la fin du bloc est complété par le bloc suivant
+        position = 0
+        for record in iter_records(data):
+            position += header_size + len(record.payload)
+            if record.kind == RECV:
+                received(bytes(record.payload))
+            elif record.kind == SEND:
+                sent(bytes(record.payload))
+        rest = data[position:]
+
+
+def convert(paths: Iterable[str], output: str, chunk_turns: int = CHUNK_TURNS) -> Dict[str, int]:
+    """
+    Convertit des journaux et des enregistrements en un jeu de données de tours.
+
+    Args:
+        paths: Chemins des journaux ou des fichiers d'enregistrement (reconnus à leur signature)
+        output: Chemin du fichier produit
+        chunk_turns: Nombre de tours par paquet
+
+    Returns:
+        Dict[str, int]: Octets lus, parties, tours écrits, tours incomplets ignorés et paquets écrits
+    """
+    size = 0
+    with open(output, 'wb') as out:
+        writer = DatasetWriter(out, chunk_turns)
+        assembler = TurnAssembler(writer)
+        for path in paths:
+            with open(path, 'rb') as stream:
+                if stream.read(len(MAGIC)) == MAGIC:
+                    size += feed_recording(stream, assembler)
+                else:
+                    stream.seek(0)
+                    size += feed_log(stream, assembler)
+            assembler.close()
+        writer.flush()
+    return {
+        "bytes": size,
+        "games": assembler.games,
+        "turns": writer.turns,
+        "incomplete": assembler.incomplete,
+        "chunks": writer.chunks,
+    }
+
+
+def read_chunks(path: str) -> Iterator[Dict[str, array]]:
+    """
+    Lit un jeu de données paquet par paquet.
+
+    Args:
+        path: Chemin du fichier
+
+    Yields:
+        Dict[str, array]: Les colonnes de chaque paquet
+    """
+    with open(path, 'rb') as stream:
+        if stream.read(len(DATASET_MAGIC)) != DATASET_MAGIC:
+            raise ValueError("Jeu de données invalide : signature absente")
+        while True:
+            header = stream.read(_CHUNK.size)
+            if len(header) < _CHUNK.size:
+                return
+            _, count = _CHUNK.unpack(header)
+            chunk = {}
+            for _ in range(count):
+                name = stream.read(stream.read(1)[0]).decode('ascii')
+                typecode, length = _COLUMN.unpack(stream.read(_COLUMN.size))
+                column = array(typecode.decode('ascii'))
+                column.fromfile(stream, length)
+                if sys.byteorder == 'big':
+                    column.byteswap()
+                chunk[name] = column
+            yield chunk
+
+
+def to_numpy(chunk: Dict[str, array]) -> Dict[str, 'np.ndarray']:
+    """
+    Convertit les colonnes d'un paquet en tableaux NumPy, sans copie.
+
+    Args:
+        chunk: Un paquet renvoyé par read_chunks
+
+    Returns:
+        Dict[str, np.ndarray]: Les colonnes
+    """
+    if np is None:
+        raise ImportError("La conversion en tableaux nécessite NumPy (pip install numpy)")
+    return {name: np.frombuffer(column, dtype=column.typecode) for name, column in chunk.items()}
+
+
+def main() -> int:
+    """
+    Convertit les fichiers donnés en jeu de données.
+    """
+    parser = argparse.ArgumentParser(description='Conversion des journaux en jeu de données de tours')
+    parser.add_argument('files', nargs='+', help="Journaux ou fichiers d'enregistrement")
+    parser.add_argument('-o', '--output', required=True, help='Fichier produit')
+    parser.add_argument('--chunk', type=int, default=CHUNK_TURNS, help='Nombre de tours par paquet')
+    args = parser.parse_args()
+    Logger.set_level("WARNING")
+
+    start = time.perf_counter()
+    stats = convert(args.files, args.output, args.chunk)
+    elapsed = time.perf_counter() - start
+    print(f"{stats['bytes'] / 1e6:.1f} Mo lus en {elapsed:.2f} s ({stats['bytes'] / elapsed / 1e6:.0f} Mo/s) : "
+          f"{stats['games']} parties, {stats['turns']} tours écrits en {stats['chunks']} paquets, "
+          f"{stats['incomplete']} tours incomplets ignorés")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Format binaire des enregistrements de parties.
+
+Un fichier commence par MAGIC puis enchaîne des enregistrements, sans fin de fichier
+particulière : on peut y ajouter des parties à tout moment (ajout seul).
+Chaque enregistrement est un en-tête de taille fixe suivi de sa charge utile :
+
+    type (u8) | instant en µs depuis le début de la partie (u64) | longueur (u32) | charge utile
+
+Types d'enregistrement :
+    GAME_START  métadonnées JSON de la partie (équipe, stratégie, date)
+    RECV        ligne reçue du serveur (UTF-8)
+    SEND        ligne envoyée au serveur (UTF-8)
+    DECISION    durée de la décision en µs (u32) puis les commandes décidées, une par ligne
+    GAME_END    résumé JSON de la partie
+"""
+import json
+import mmap
+import os
+import struct
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Tuple, Union
+
+from ..utils.logger import Logger
+
+
+# Début de fichier : signature et version du format
+MAGIC = b"P24R\x01"
+
+# Types d'enregistrement
+GAME_START = 1
+RECV = 2
+SEND = 3
+DECISION = 4
+GAME_END = 5
+
+# En-tête d'un enregistrement : type, instant (µs), longueur de la charge utile
+HEADER = struct.Struct('<BQI')
+
+# Début de la charge utile d'un enregistrement DECISION : durée de la décision (µs)
+DURATION = struct.Struct('<I')
+
+# Charge utile d'un enregistrement : copiée (bytes) ou vue sur le fichier (memoryview)
+Payload = Union[bytes, memoryview]
+
+
+class Record(NamedTuple):
+    """
+    Un enregistrement : son type, son instant en µs depuis le début de la partie et sa charge utile.
+    La charge utile est un bytes, ou une memoryview sur le fichier projeté en mémoire (voir recording.index).
+    """
+    kind: int
+    time_us: int
+    payload: Payload
+
+    @property
+    def text(self) -> str:
+        """Charge utile d'un RECV ou d'un SEND, décodée."""
+        return str(self.payload, 'utf-8')
+
+    def json(self) -> Dict[str, Any]:
+        """Charge utile d'un GAME_START ou d'un GAME_END, décodée."""
+        return json.loads(str(self.payload, 'utf-8')) if len(self.payload) else {}
+
+    def decision(self) -> Tuple[int, List[str]]:
+        """
+        Décode un enregistrement DECISION.
+
+        Returns:
+            Tuple[int, List[str]]: La durée de la décision en µs et les commandes décidées
+        """
+        (duration,) = DURATION.unpack_from(self.payload)
+        commands = str(self.payload[DURATION.size:], 'utf-8')
+        return duration, commands.split('\n') if commands else []
+
+
+def encode_record(kind: int, time_us: int, payload: bytes) -> bytes:
+    """
+    Encode un enregistrement.
+
+    Args:
+        kind: Type d'enregistrement
+        time_us: Instant en µs depuis le début de la partie
+        payload: Charge utile
+
+    Returns:
+        bytes: L'en-tête suivi de la charge utile
+    """
+    return HEADER.pack(kind, time_us, len(payload)) + payload
+
+
+def encode_decision(duration_us: int, commands: List[str]) -> bytes:
+    """
+    Encode la charge utile d'un enregistrement DECISION.
+
+    Args:
+        duration_us: Durée de la décision en µs
+        commands: Les commandes décidées, au format du protocole
+
+    Returns:
+        bytes: La charge utile
+    """
+    return DURATION.pack(min(duration_us, 0xFFFFFFFF)) + '\n'.join(commands).encode('utf-8')
+
+
+def complete_length(stream: BinaryIO) -> int:
+    """
+    Renvoie la longueur de la partie intègre d'un fichier d'enregistrement : la signature et les
+    enregistrements complets qui la suivent. Le fichier est projeté en mémoire et seuls les en-têtes sont lus.
+
+    Args:
+        stream: Le fichier, ouvert en lecture binaire
+
+    Returns:
+        int: Position de la fin du dernier enregistrement complet (0 si la signature elle-même est incomplète)
+
+    Raises:
+        ValueError: Si le fichier ne commence pas par la signature
+    """
+    size = os.fstat(stream.fileno()).st_size
+    if size == 0:
+        return 0
+    with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        signature = buffer[:len(MAGIC)]
+        if signature != MAGIC[:len(signature)]:
+            raise ValueError("Fichier d'enregistrement invalide : signature absente")
+        if len(signature) < len(MAGIC):
+            return 0
+        unpack_from = HEADER.unpack_from
+        header_size = HEADER.size
+        position = len(MAGIC)
+        while position + header_size <= size:
+            end = position + header_size + unpack_from(buffer, position)[2]
+            if end > size:
+                break
+            position = end
+        return position
+
+
+def read_records(stream: BinaryIO) -> Iterator[Record]:
+    """
+    Lit les enregistrements d'un fichier ouvert en binaire, depuis son début.
+    Un dernier enregistrement tronqué (programme interrompu pendant l'écriture) est ignoré ;
+    MatchRecorder le retire avant d'ajouter une partie.
+
+    Args:
+        stream: Le fichier
+
+    Yields:
+        Record: Les enregistrements, dans l'ordre
+    """
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Fichier d'enregistrement invalide : signature absente")
+    header_size = HEADER.size
+    position = len(MAGIC)
+    while True:
+        header = stream.read(header_size)
+        if not header:
+            return
+        if len(header) < header_size:
+            Logger.warning(f"Enregistrement tronqué à l'octet {position} : la suite du fichier est ignorée")
+            return
+        kind, time_us, length = HEADER.unpack(header)
+        payload = stream.read(length)
+        if len(payload) < length:
+            Logger.warning(f"Enregistrement tronqué à l'octet {position} : la suite du fichier est ignorée")
+            return
+        position += header_size + length
+        yield Record(kind, time_us, payload)
+
+
+def iter_records(buffer: Payload, start: int = 0, end: int = -1) -> Iterator[Record]:
+    """
+    Lit les enregistrements d'un tampon sans copie : les charges utiles sont des vues sur le tampon.
+    Un dernier enregistrement tronqué est ignoré.
+
+    Args:
+        buffer: Le tampon (par exemple un fichier projeté en mémoire), positionné après MAGIC
+        start: Position du premier enregistrement
+        end: Position de fin de lecture (-1 : fin du tampon)
+
+    Yields:
+        Record: Les enregistrements, dans l'ordre
+    """
+    view = memoryview(buffer)
+    end = len(view) if end < 0 else end
+    unpack_from = HEADER.unpack_from
+    header_size = HEADER.size
+    position = start
+    while position + header_size <= end:
+        kind, time_us, length = unpack_from(view, position)
+        position += header_size
+        if position + length > end:
+            return
+        yield Record(kind, time_us, view[position:position + length])
+        position += length
@@ -0,0 +1,428 @@
+"""
+Lecture indexée des enregistrements de parties et des journaux, projetés en mémoire.
+
+Un fichier (enregistrement binaire ou game_client.log) est projeté en mémoire avec mmap et
+parcouru une seule fois pour construire un index : pour chaque partie, la position de son début
+et celle de chacun de ses tours (message DEBUT_TOUR reçu). L'index est conservé dans un fichier
+voisin (`<fichier>.idx`) et complété, sans tout relire, quand des parties sont ajoutées au fichier.
+
+Aller au tour N de la partie M est alors un accès direct, et un corpus entier se parcourt tour
+par tour sous forme de vues sur les fichiers projetés, sans copie.
+"""
+import mmap
+import os
+import re
+import struct
+from array import array
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from ..utils.logger import Logger
+from .format import MAGIC, HEADER, GAME_START, RECV, Record, iter_records
+from .replay import RecordedGame
+
+
+# Types de fichiers indexés
+RECORDING = 1
+LOG = 2
+
+# Début d'un fichier d'index : signature et version
+INDEX_MAGIC = b"P24I\x01"
+
+# En-tête d'un fichier d'index : type du fichier indexé, position de fin de l'indexation,
+# nombre de parties et de tours, puis les derniers octets indexés (pour détecter un fichier remplacé)
+INDEX_HEADER = struct.Struct('<BQII16s')
+
+# Message DEBUT_TOUR reçu, dans un enregistrement
+_DEBUT_TOUR = b"DEBUT_TOUR|"
+
+# Message reçu journalisé par Connection, qui ouvre une partie (NOM_EQUIPE) ou un tour (DEBUT_TOUR).
+# Le « ç » de « reçu » peut avoir été écrit en UTF-8 ou en Latin-1 selon la version du client.
+_LOG_OPENING = re.compile(rb"<-- [^:\n]*: (?:(NOM_EQUIPE)|DEBUT_TOUR\|(\d+)\|(\d+))")
+
+
+class Turn(NamedTuple):
+    """
+    Un tour indexé : sa partie, son rang dans la partie, ses numéros de tour et de sous-tour,
+    et une vue sur ses octets dans le fichier (enregistrements ou lignes de journal).
+    """
+    game: int
+    number: int
+    tour: int
+    sous_tour: int
+    data: memoryview
+
+
+class TurnIndex:
+    """
+    Index des parties et des tours d'un fichier, en colonnes :
+        - game_offsets[m] : position du début de la partie m
+        - game_turns[m] : rang, dans les colonnes des tours, du premier tour de la partie m
+        - turn_offsets[t], turn_tours[t], turn_sous_tours[t] : position et numéros du tour t
+    `scanned` est la position jusqu'où le fichier a été indexé.
+    """
+
+    def __init__(self, kind: int):
+        """
+        Initialise un index vide.
+
+        Args:
+            kind: Type du fichier indexé (RECORDING ou LOG)
+        """
+        self.kind = kind
+        self.scanned = 0
+        self.game_offsets = array('Q')
+        self.game_turns = array('Q')
+        self.turn_offsets = array('Q')
+        self.turn_tours = array('I')
+        self.turn_sous_tours = array('I')
+
+    @property
+    def games(self) -> int:
+        """Nombre de parties indexées."""
+        return len(self.game_offsets)
+
+    def turn_count(self, game: int) -> int:
+        """
+        Renvoie le nombre de tours d'une partie.
+
+        Args:
+            game: Rang de la partie
+
+        Returns:
+            int: Le nombre de tours
+        """
+        end = self.game_turns[game + 1] if game + 1 < self.games else len(self.turn_offsets)
+        return end - self.game_turns[game]
+
+    def game_span(self, game: int) -> Tuple[int, int]:
+        """
+        Renvoie les positions de début et de fin d'une partie.
+
+        Args:
+            game: Rang de la partie
+
+        Returns:
+            Tuple[int, int]: Début et fin (exclue) de la partie dans le fichier
+        """
+        end = self.game_offsets[game + 1] if game + 1 < self.games else self.scanned
+        return self.game_offsets[game], end
+
+    def turn_span(self, game: int, number: int) -> Tuple[int, int, int]:
+        """
+        Renvoie la position d'un tour, en temps constant.
+
+        Args:
+            game: Rang de la partie
+            number: Rang du tour dans la partie
+
+        Returns:
+            Tuple[int, int, int]: Rang du tour dans l'index, début et fin (exclue) du tour dans le fichier
+        """
+        if not 0 <= number < self.turn_count(game):
+            raise IndexError(f"La partie {game} n'a pas de tour {number}")
+        turn = self.game_turns[game] + number
+        if number + 1 < self.turn_count(game):
+            end = self.turn_offsets[turn + 1]
+        else:
+            end = self.game_span(game)[1]
+        return turn, self.turn_offsets[turn], end
+
+    def add_game(self, offset: int):
+        """Ajoute une partie commençant à cette position."""
+        self.game_offsets.append(offset)
+        self.game_turns.append(len(self.turn_offsets))
+
+    def add_turn(self, offset: int, tour: int, sous_tour: int):
+        """Ajoute un tour commençant à cette position, à la dernière partie."""
+        self.turn_offsets.append(offset)
+        self.turn_tours.append(tour)
+        self.turn_sous_tours.append(sous_tour)
+
+    def save(self, stream: BinaryIO, tail: bytes):
+        """
+        Écrit l'index.
+
+        Args:
+            stream: Fichier ouvert en écriture binaire
+            tail: Les 16 derniers octets indexés du fichier
+        """
+        stream.write(INDEX_MAGIC)
+        stream.write(INDEX_HEADER.pack(self.kind, self.scanned, self.games, len(self.turn_offsets), tail))
+        for column in (self.game_offsets, self.game_turns, self.turn_offsets,
+                       self.turn_tours, self.turn_sous_tours):
+            column.tofile(stream)
+
+    @classmethod
+    def load(cls, stream: BinaryIO) -> Tuple['TurnIndex', bytes]:
+        """
+        Lit un index.
+
+        Args:
+            stream: Fichier ouvert en lecture binaire
+
+        Returns:
+            Tuple[TurnIndex, bytes]: L'index et les 16 derniers octets indexés du fichier
+
+        Raises:
+            ValueError: Si le fichier n'est pas un index valide
+        """
+        if stream.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+            raise ValueError("Fichier d'index invalide : signature absente")
+        header = stream.read(INDEX_HEADER.size)
+        if len(header) < INDEX_HEADER.size:
+            raise ValueError("Fichier d'index tronqué")
+        kind, scanned, games, turns, tail = INDEX_HEADER.unpack(header)
+        index = cls(kind)
+        index.scanned = scanned
+        try:
+            index.game_offsets.fromfile(stream, games)
+            index.game_turns.fromfile(stream, games)
+            index.turn_offsets.fromfile(stream, turns)
+            index.turn_tours.fromfile(stream, turns)
+            index.turn_sous_tours.fromfile(stream, turns)
+        except EOFError as e:
+            raise ValueError("Fichier d'index tronqué") from e
+        return index, tail
+
+
+def scan_recording(buffer, index: TurnIndex):
+    """
+    Complète l'index d'un enregistrement, depuis index.scanned jusqu'au dernier enregistrement complet.
+    Seuls les en-têtes sont lus, et le début des charges utiles des messages reçus.
+
+    Args:
+        buffer: Le fichier projeté en mémoire
+        index: L'index à compléter
+    """
+    if index.scanned == 0:
+        if buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError("Fichier d'enregistrement invalide : signature absente")
+        index.scanned = len(MAGIC)
+    unpack_from = HEADER.unpack_from
+    header_size = HEADER.size
+    opening = len(_DEBUT_TOUR)
+    size = len(buffer)
+    position = index.scanned
+    while position + header_size <= size:
+        kind, _, length = unpack_from(buffer, position)
+        payload = position + header_size
+        end = payload + length
+        if end > size:
+            break
+        if kind == GAME_START:
+            index.add_game(position)
+        elif kind == RECV and index.games and buffer[payload:payload + opening] == _DEBUT_TOUR:
+            _, tour, sous_tour = bytes(buffer[payload:end]).split(b'|')
+            index.add_turn(position, int(tour), int(sous_tour))
+        position = end
+    index.scanned = position
+
+
+def scan_log(buffer, index: TurnIndex):
+    """
+    Complète l'index d'un journal game_client.log, depuis index.scanned jusqu'à la dernière ligne complète.
+    Une partie commence à la réception de NOM_EQUIPE, un tour à la réception de DEBUT_TOUR.
+
+    Args:
+        buffer: Le fichier projeté en mémoire
+        index: L'index à compléter
+    """
+    end = buffer.rfind(b"\n", index.scanned) + 1
+    if end <= index.scanned:
+        return
+    rfind = buffer.rfind
+    for match in _LOG_OPENING.finditer(buffer, index.scanned, end):
+        line = rfind(b"\n", 0, match.start()) + 1
+        if match.group(1) is not None:
+            index.add_game(line)
+        elif index.games:
+            index.add_turn(line, int(match.group(2)), int(match.group(3)))
+    index.scanned = end
+
+
+class MappedFile:
+    """
+    Fichier d'enregistrement ou journal projeté en mémoire, avec son index de parties et de tours.
+    Les tours renvoyés sont des vues sur la projection : après close(), la projection n'est libérée
+    qu'une fois la dernière vue abandonnée.
+    """
+
+    def __init__(self, path: str, kind: Optional[int] = None, index_path: Optional[str] = None):
+        """
+        Projette le fichier en mémoire et charge son index, en le construisant ou en le complétant au besoin.
+
+        Args:
+            path: Chemin du fichier
+            kind: RECORDING ou LOG (par défaut selon le début du fichier)
+            index_path: Chemin de l'index (par défaut `<path>.idx`)
+        """
+        self.path = path
+        self.index_path = index_path if index_path is not None else path + ".idx"
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.buffer = self._mmap if self._mmap is not None else b""
+        if kind is None:
+            kind = RECORDING if self.buffer[:len(MAGIC)] == MAGIC else LOG
+        self.index = self._load_index(kind)
+
+    def _tail(self, position: int) -> bytes:
+        """Les 16 octets précédant une position du fichier."""
+        return bytes(self.buffer[max(0, position - 16):position]).rjust(16, b"\0")
+
+    def _load_index(self, kind: int) -> TurnIndex:
+        """Charge l'index, le complète si le fichier a grandi, le reconstruit s'il ne correspond plus."""
+        index = None
+        try:
+            with open(self.index_path, 'rb') as stream:
+                index, tail = TurnIndex.load(stream)
+            if index.kind != kind or index.scanned > len(self.buffer) or tail != self._tail(index.scanned):
+                Logger.info("Index %s périmé, reconstruction", self.index_path)
+                index = None
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            Logger.warning("Index %s illisible (%s), reconstruction", self.index_path, e)
+        if index is None:
+            index = TurnIndex(kind)
+
+        scanned = index.scanned
+        if scanned < len(self.buffer):
+            if kind == RECORDING:
+                scan_recording(self.buffer, index)
+            else:
+                scan_log(self.buffer, index)
+        if index.scanned != scanned or not os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'wb') as stream:
+                    index.save(stream, self._tail(index.scanned))
+            except OSError as e:
+                Logger.warning("Impossible d'écrire l'index %s: %s", self.index_path, e)
+        return index
+
+    @property
+    def games(self) -> int:
+        """Nombre de parties du fichier."""
+        return self.index.games
+
+    def turn_count(self, game: int) -> int:
+        """
+        Renvoie le nombre de tours d'une partie.
+
+        Args:
+            game: Rang de la partie
+
+        Returns:
+            int: Le nombre de tours
+        """
+        return self.index.turn_count(game)
+
+    def turn(self, game: int, number: int) -> Turn:
+        """
+        Renvoie un tour, en temps constant et sans copie.
+
+        Args:
+            game: Rang de la partie
+            number: Rang du tour dans la partie
+
+        Returns:
+            Turn: Le tour, dont `data` est une vue sur le fichier
+        """
+        index = self.index
+        turn, start, end = index.turn_span(game, number)
+        return Turn(game, number, index.turn_tours[turn], index.turn_sous_tours[turn],
+                    memoryview(self.buffer)[start:end])
+
+    def turns(self, game: Optional[int] = None) -> Iterator[Turn]:
+        """
+        Parcourt les tours d'une partie, ou de tout le fichier.
+
+        Args:
+            game: Rang de la partie (None : toutes les parties)
+
+        Yields:
+            Turn: Les tours, dans l'ordre
+        """
+        games = range(self.games) if game is None else (game,)
+        for current in games:
+            for number in range(self.turn_count(current)):
+                yield self.turn(current, number)
+
+    def records(self, data: memoryview) -> Iterator[Record]:
+        """
+        Parcourt les enregistrements d'un tour ou d'une partie d'un fichier d'enregistrement.
+
+        Args:
+            data: Vue renvoyée par turn() ou game_data()
+
+        Yields:
+            Record: Les enregistrements, dont les charges utiles sont des vues sur le fichier
+        """
+        if self.index.kind != RECORDING:
+            raise ValueError(f"{self.path} n'est pas un fichier d'enregistrement")
+        return iter_records(data)
+
+    def game_data(self, game: int) -> memoryview:
+        """
+        Renvoie une vue sur les octets d'une partie.
+
+        Args:
+            game: Rang de la partie
+
+        Returns:
+            memoryview: La partie, de son début (GAME_START ou NOM_EQUIPE) au début de la suivante
+        """
+        start, end = self.index.game_span(game)
+        return memoryview(self.buffer)[start:end]
+
+    def game(self, game: int) -> RecordedGame:
+        """
+        Renvoie une partie d'un fichier d'enregistrement, prête à être rejouée.
+
+        Args:
+            game: Rang de la partie
+
+        Returns:
+            RecordedGame: La partie
+        """
+        records = self.records(self.game_data(game))
+        return RecordedGame(next(records).json(), list(records))
+
+    def close(self):
+        """
+        Libère la projection et ferme le fichier.
+        """
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Des vues sont encore utilisées : la projection sera libérée avec la dernière
+                pass
+            self._mmap = None
+            self.buffer = b""
+        self._file.close()
+
+    def __enter__(self) -> 'MappedFile':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def iter_corpus(paths: Iterable[str]) -> Iterator[Turn]:
+    """
+    Parcourt tous les tours d'un corpus de fichiers, un fichier projeté à la fois.
+    Chaque projection est libérée quand plus aucun de ses tours n'est référencé.
+
+    Args:
+        paths: Chemins des fichiers d'enregistrement ou des journaux
+
+    Yields:
+        Turn: Les tours de chaque fichier, dans l'ordre
+    """
+    for path in paths:
+        mapped = MappedFile(path)
+        try:
+            yield from mapped.turns()
+        finally:
+            mapped.close()
@@ -0,0 +1,216 @@
+"""
+Module contenant l'enregistreur de parties et la connexion qui lui transmet chaque échange.
+"""
+import json
+import os
+import time
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from ..strategy import Command
+from ..utils.action import Action
+from ..utils.logger import Logger
+from .format import (MAGIC, GAME_START, RECV, SEND, DECISION, GAME_END,
+                     complete_length, encode_record, encode_decision)
+
+
+# Formatage des commandes décidées, comme elles sont envoyées au serveur
+_action = Action()
+
+
+class MatchRecorder:
+    """
+    Enregistre les parties dans un fichier binaire en ajout seul (voir recording.format).
+    Le fichier n'est ouvert que pendant une partie ; plusieurs parties, successives,
+    peuvent être ajoutées au même fichier.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialise l'enregistreur.
+
+        Args:
+            path: Chemin du fichier d'enregistrement (créé s'il n'existe pas)
+        """
+        self.path = path
+        self._file: Optional[BinaryIO] = None
+        self._start = 0
+        # Longueur du fichier à la fin de la dernière partie enregistrée, qui finit par un enregistrement complet
+        self._length = -1
+
+    def _complete_length(self) -> int:
+        """
+        Renvoie la longueur de la partie intègre du fichier (0 s'il n'existe pas encore).
+        Le fichier n'est relu que s'il a changé depuis la dernière partie enregistrée.
+        """
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+        if size != self._length:
+            with open(self.path, 'rb') as stream:
+                self._length = complete_length(stream)
+        return self._length
+
+    def _now(self) -> int:
+        """Instant courant, en µs depuis le début de la partie."""
+        return (time.perf_counter_ns() - self._start) // 1000
+
+    def _write(self, kind: int, payload: bytes):
+        """Ajoute un enregistrement à la partie en cours (ignoré hors partie)."""
+        if self._file is not None:
+            self._file.write(encode_record(kind, self._now(), payload))
+
+    def start_game(self, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Commence l'enregistrement d'une partie.
+
+        Args:
+            metadata: Informations sur la partie (équipe, stratégie...), enregistrées en JSON
+        """
+        if self._file is not None:
+            self.end_game()
+        length = self._complete_length()
+        self._file = open(self.path, 'ab', buffering=1 << 16)
+        if length == 0:
+            self._file.truncate(0)
+            self._file.write(MAGIC)
+        elif length < os.path.getsize(self.path):
+            # Programme interrompu pendant l'écriture : la partie ajoutée doit suivre un enregistrement complet
+            Logger.warning(f"Enregistrement tronqué retiré de la fin de {self.path} "
+                           f"({os.path.getsize(self.path) - length} octets)")
+            self._file.truncate(length)
+        self._start = time.perf_counter_ns()
+        metadata = dict(metadata or {})
+        metadata.setdefault("date", time.time())
+        self._write(GAME_START, json.dumps(metadata).encode('utf-8'))
+
+    def received(self, message: str):
+        """
+        Enregistre une ligne reçue du serveur.
+
+        Args:
+            message: La ligne reçue
+        """
+        self._write(RECV, message.encode('utf-8'))
+
+    def sent(self, message: str):
+        """
+        Enregistre une ligne envoyée au serveur.
+
+        Args:
+            message: La ligne envoyée
+        """
+        self._write(SEND, message.encode('utf-8'))
+
+    def decision(self, commands: List[Command], duration: float):
+        """
+        Enregistre une décision de la stratégie.
+
+        Args:
+            commands: Les commandes décidées
+            duration: Durée de la décision, en secondes
+        """
+        self._write(DECISION, encode_decision(int(duration * 1e6),
+                                              [_action.format_command(command.value, args)
+                                               for command, args in commands]))
+
+    def end_game(self, summary: Optional[Dict[str, Any]] = None):
+        """
+        Termine l'enregistrement de la partie et ferme le fichier.
+
+        Args:
+            summary: Résumé de la partie, enregistré en JSON
+        """
+        if self._file is None:
+            return
+        self._write(GAME_END, json.dumps(summary or {}).encode('utf-8'))
+        self._file.close()
+        self._file = None
+        self._length = os.path.getsize(self.path)
+
+
+class RecordingConnection:
+    """
+    Connexion qui transmet chaque ligne échangée à un MatchRecorder.
+    Enveloppe n'importe quelle connexion offrant l'interface de Connection.
+    """
+
+    def __init__(self, connection, recorder: MatchRecorder):
+        """
+        Initialise la connexion.
+
+        Args:
+            connection: La connexion enveloppée
+            recorder: L'enregistreur
+        """
+        self.connection = connection
+        self.recorder = recorder
+
+    def receive_message(self) -> str:
+        """
+        Reçoit et enregistre le prochain message du serveur.
+
+        Returns:
+            str: Le message reçu
+        """
+        message = self.connection.receive_message()
+        self.recorder.received(message)
+        return message
+
+    def receive_messages(self, count: int) -> List[str]:
+        """
+        Reçoit et enregistre exactement `count` messages du serveur.
+
+        Args:
+            count: Nombre de messages attendus
+
+        Returns:
+            List[str]: Les messages reçus
+        """
+        messages = self.connection.receive_messages(count)
+        for message in messages:
+            self.recorder.received(message)
+        return messages
+
+    def receive_pending(self) -> List[str]:
+        """
+        Renvoie et enregistre les messages déjà reçus.
+
+        Returns:
+            List[str]: Les messages en attente
+        """
+        messages = self.connection.receive_pending()
+        for message in messages:
+            self.recorder.received(message)
+        return messages
+
+    def send_message(self, message: str):
+        """
+        Enregistre et envoie un message au serveur.
+
+        Args:
+            message: Le message à envoyer
+        """
+        self.recorder.sent(message)
+        self.connection.send_message(message)
+
+    def send_messages(self, messages: List[str]):
+        """
+        Enregistre et envoie plusieurs messages au serveur.
+
+        Args:
+            messages: Les messages à envoyer, dans l'ordre
+        """
+        for message in messages:
+            self.recorder.sent(message)
+        self.connection.send_messages(messages)
+
+    def stop(self):
+        """
+        Ferme la connexion enveloppée.
+        """
+        self.connection.stop()
+
+    def __getattr__(self, name: str):
+        """Donne accès aux autres attributs de la connexion enveloppée."""
+        return getattr(self.connection, name)
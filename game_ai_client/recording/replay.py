@@ -0,0 +1,307 @@
+"""
+Module contenant la relecture des parties enregistrées.
+Une partie enregistrée est rejouée par un AIClient sans serveur : ReplayConnection rejoue les
+messages du serveur et répond aux demandes du client avec les réponses enregistrées.
+Les actions du client sont comparées à celles de l'enregistrement, tour par tour.
+"""
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from ..ai_client import AIClient
+from ..session import GameSession
+from ..strategy import Strategy
+from ..utils.action import CommandType
+from ..utils.config import Config
+from .format import GAME_START, RECV, SEND, DECISION, GAME_END, Record, read_records
+
+
+# Commandes qui agissent sur la partie ; PIOCHER et ATTAQUER terminent le tour
+ACTIONS = {CommandType.PIOCHER.value, CommandType.UTILISER.value, CommandType.ATTAQUER.value}
+TURN_ENDING = {CommandType.PIOCHER.value, CommandType.ATTAQUER.value}
+
+# Demandes dont la réponse ne dépend pas de la commande exacte (nom d'équipe, par exemple)
+_FREE_TEXT = ""
+
+
+class RecordedGame(NamedTuple):
+    """
+    Une partie enregistrée : ses métadonnées et ses enregistrements, de GAME_START à GAME_END.
+    """
+    metadata: Dict[str, Any]
+    records: List[Record]
+
+
+def split_games(records: Iterable[Record]) -> Iterator[RecordedGame]:
+    """
+    Regroupe une suite d'enregistrements en parties.
+
+    Args:
+        records: Les enregistrements, dans l'ordre du fichier
+
+    Yields:
+        RecordedGame: Les parties
+    """
+    game: Optional[RecordedGame] = None
+    for record in records:
+        if record.kind == GAME_START:
+            if game is not None:
+                yield game
+            game = RecordedGame(record.json(), [])
+        elif game is not None:
+            game.records.append(record)
+            if record.kind == GAME_END:
+                yield game
+                game = None
+    if game is not None:
+        yield game
+
+
+def read_games(path: str) -> Iterator[RecordedGame]:
+    """
+    Lit les parties d'un fichier d'enregistrement.
+
+    Args:
+        path: Chemin du fichier
+
+    Yields:
+        RecordedGame: Les parties, dans l'ordre du fichier
+    """
+    with open(path, 'rb') as stream:
+        yield from split_games(read_records(stream))
+
+
+def _command(message: str) -> str:
+    """Nom de la commande d'une demande du client (_FREE_TEXT pour un texte libre)."""
+    name = message.split('|', 1)[0]
+    return name if name in CommandType.__members__ else _FREE_TEXT
+
+
+class _Segment:
+    """
+    Un message du serveur non sollicité (NOM_EQUIPE, DEBUT_TOUR, FIN...) et les échanges qui le suivent.
+    """
+    __slots__ = ('opening', 'replies', 'last_reply', 'actions', 'decision_us')
+
+    def __init__(self, opening: str):
+        self.opening = opening
+        self.replies: Dict[str, Deque[str]] = {}
+        self.last_reply: Dict[str, str] = {}
+        self.actions: List[str] = []
+        self.decision_us: Optional[int] = None
+
+
+def _segments(game: RecordedGame) -> List[_Segment]:
+    """Découpe une partie en segments, en associant chaque réponse à la demande qui l'attendait."""
+    segments: List[_Segment] = []
+    pending: Deque[str] = deque()
+    for record in game.records:
+        if record.kind == SEND:
+            message = record.text
+            pending.append(message)
+            if segments and _command(message) in ACTIONS:
+                segments[-1].actions.append(message)
+        elif record.kind == RECV:
+            message = record.text
+            if pending:
+                request = pending.popleft()
+                segment = segments[-1]
+                segment.replies.setdefault(request, deque()).append(message)
+                segment.last_reply[_command(request)] = message
+            else:
+                segments.append(_Segment(message))
+        elif record.kind == DECISION and segments:
+            segments[-1].decision_us = record.decision()[0]
+    return segments
+
+
+class Divergence(NamedTuple):
+    """
+    Un tour où les actions du client diffèrent de celles de l'enregistrement.
+    """
+    opening: str
+    expected: List[str]
+    actual: List[str]
+
+
+class ReplayResult(NamedTuple):
+    """
+    Résultat de la relecture d'une partie.
+    """
+    turns: int
+    divergences: List[Divergence]
+    turn_times: List[float]
+    recorded_decision_us: List[int]
+
+
+class ReplayConnection:
+    """
+    Connexion qui rejoue une partie enregistrée, avec l'interface de Connection.
+    Les demandes du client reçoivent la réponse enregistrée à la même demande pendant le même tour,
+    à défaut la dernière réponse connue à la même commande (par exemple DEGATS, servi par le cache
+    du tour lors de l'enregistrement), à défaut OK pour une action.
+    """
+
+    def __init__(self, game: RecordedGame):
+        """
+        Initialise la connexion.
+
+        Args:
+            game: La partie à rejouer
+        """
+        self.game = game
+        self._segments = _segments(game)
+        self._index = -1
+        self._pending: Deque[str] = deque()
+        self._actions: List[str] = []
+        self._known: Dict[str, str] = {}
+        self._turn_start: Optional[float] = None
+        self.turns = 0
+        self.divergences: List[Divergence] = []
+        self.turn_times: List[float] = []
+
+    def _answer(self, request: str) -> str:
+        """Renvoie la réponse à une demande du client."""
+        segment = self._segments[self._index]
+        command = _command(request)
+        replies = segment.replies.get(request)
+        if replies:
+            reply = replies.popleft()
+        elif command in segment.last_reply:
+            reply = segment.last_reply[command]
+        elif command in self._known:
+            reply = self._known[command]
+        elif command in ACTIONS:
+            reply = "OK"
+        else:
+            reply = f"NOK|Pas de réponse enregistrée pour {request}"
+        self._known[command] = reply
+        return reply
+
+    def _close_segment(self):
+        """Compare les actions du client à celles du segment terminé."""
+        if self._index < 0:
+            return
+        segment = self._segments[self._index]
+        if segment.actions != self._actions:
+            self.divergences.append(Divergence(segment.opening, segment.actions, self._actions))
+        self._actions = []
+
+    def receive_message(self) -> str:
+        """
+        Renvoie la réponse à la plus ancienne demande en attente, sinon le prochain message du serveur.
+
+        Returns:
+            str: Le message
+        """
+        if self._pending:
+            return self._answer(self._pending.popleft())
+        self._close_segment()
+        self._index += 1
+        if self._index >= len(self._segments):
+            raise ConnectionError("Fin de la partie enregistrée")
+        opening = self._segments[self._index].opening
+        if opening.startswith(CommandType.DEBUT_TOUR.value):
+            self.turns += 1
+            self._turn_start = time.perf_counter()
+        return opening
+
+    def receive_messages(self, count: int) -> List[str]:
+        """
+        Renvoie exactement `count` messages.
+
+        Args:
+            count: Nombre de messages attendus
+
+        Returns:
+            List[str]: Les messages
+        """
+        return [self.receive_message() for _ in range(count)]
+
+    def receive_pending(self) -> List[str]:
+        """
+        Aucun message n'arrive sans demande pendant une relecture.
+
+        Returns:
+            List[str]: Une liste vide
+        """
+        return []
+
+    def send_message(self, message: str):
+        """
+        Reçoit une demande du client.
+
+        Args:
+            message: La demande
+        """
+        self._pending.append(message)
+        command = _command(message)
+        if command in ACTIONS:
+            self._actions.append(message)
+            if command in TURN_ENDING and self._turn_start is not None:
+                self.turn_times.append(time.perf_counter() - self._turn_start)
+                self._turn_start = None
+
+    def send_messages(self, messages: List[str]):
+        """
+        Reçoit plusieurs demandes du client.
+
+        Args:
+            messages: Les demandes, dans l'ordre
+        """
+        for message in messages:
+            self.send_message(message)
+
+    def stop(self):
+        """
+        Termine la relecture.
+        """
+        self._close_segment()
+        self._index = len(self._segments)
+
+    def result(self) -> ReplayResult:
+        """
+        Renvoie le résultat de la relecture.
+
+        Returns:
+            ReplayResult: Tours rejoués, divergences, durées des tours rejoués et des décisions enregistrées
+        """
+        recorded = [segment.decision_us for segment in self._segments if segment.decision_us is not None]
+        return ReplayResult(self.turns, self.divergences, self.turn_times, recorded)
+
+
+def replay_game(game: RecordedGame, strategy: Optional[Strategy] = None,
+                config: Optional[Config] = None) -> ReplayResult:
+    """
+    Rejoue une partie enregistrée avec un AIClient.
+
+    Args:
+        game: La partie
+        strategy: Stratégie du client (par défaut Strategy)
+        config: Configuration de la session (par défaut une nouvelle instance de Config)
+
+    Returns:
+        ReplayResult: Le résultat de la relecture
+    """
+    connection = ReplayConnection(game)
+    session = GameSession(config, connection=connection, strategy=strategy,
+                          team_name=game.metadata.get("team_name", "BUTiChat"))
+    AIClient(session).run_game_loop()
+    return connection.result()
+
+
+def replay_file(path: str, strategy_factory: Callable[[], Strategy] = Strategy,
+                config: Optional[Config] = None) -> Iterator[ReplayResult]:
+    """
+    Rejoue toutes les parties d'un fichier, chacune avec une nouvelle stratégie.
+
+    Args:
+        path: Chemin du fichier d'enregistrement
+        strategy_factory: Crée la stratégie d'une partie
+        config: Configuration des sessions
+
+    Yields:
+        ReplayResult: Le résultat de chaque partie
+    """
+    for game in read_games(path):
+        yield replay_game(game, strategy_factory(), config)
@@ -0,0 +1,239 @@
+"""
+Scoring vectorisé avec NumPy (optionnel).
+Calcule en une fois les scores de nombreux états (par exemple toutes les feuilles d'une recherche),
+avec exactement les mêmes résultats que Scoring, y compris ses particularités :
+    - une carte DEFENSE négative que l'ennemi le plus savant peut encaisser arrête le scoring
+      des cartes suivantes (les cartes non scorées valent NaN) ;
+    - le score de monstre maximal utilisé pour les cartes ATTAQUE est comparé au dixième retenu ;
+    - le multiplicateur des monstres dépend du premier monstre scoré.
+
+Chaque état est une ligne d'un tableau structuré (voir state_dtype). Monstres et cartes sont
+rangés à la position de leur index ; seuls les monstres marqués dans monstres_vivant sont scorés,
+dans l'ordre des index, comme la liste de monstres vivants passée à Scoring.
+"""
+from typing import Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : seul ce module en a besoin
+    np = None
+
+from ..models import Deck, Joueur, Monstre, Pioche, TypeCarte
+from ..simulation.engine import GameEngine, INDEX_TYPE, NB_TYPES, DEFENSE, ATTAQUE, SAVOIR
+from .params import DEFAULT_PARAMS, StrategyParams
+
+
+# Arguments d'un Scoring : (monstres, cartes, me, deck, fdr, nb_tours, enemies)
+ScoringInputs = Tuple[List[Monstre], List[Pioche], Joueur, Deck, int, int, List[Joueur]]
+
+
+def _require_numpy():
+    """Lève une ImportError explicite si NumPy n'est pas installé."""
+    if np is None:
+        raise ImportError("Le scoring vectorisé nécessite NumPy (pip install numpy)")
+
+
+def state_dtype(nb_monstres: int = 3, nb_cartes: int = 6, nb_enemies: int = 3) -> 'np.dtype':
+    """
+    Renvoie le type structuré d'une ligne d'état.
+
+    Args:
+        nb_monstres: Nombre de places de monstre
+        nb_cartes: Nombre de pioches
+        nb_enemies: Nombre d'ennemis
+
+    Returns:
+        np.dtype: Le type structuré
+    """
+    _require_numpy()
+    return np.dtype([
+        ('vie', np.int64),
+        ('score_defense', np.int64),
+        ('score_attaque', np.int64),
+        ('score_savoir', np.int64),
+        ('deck_defense', np.int64),
+        ('deck_attaque', np.int64),
+        ('fdr', np.int64),
+        ('nb_tours', np.int64),
+        ('monstres_vie', np.int64, (nb_monstres,)),
+        ('monstres_gain', np.int64, (nb_monstres,)),
+        ('monstres_vivant', np.bool_, (nb_monstres,)),
+        ('cartes_type', np.int8, (nb_cartes,)),
+        ('cartes_valeur', np.int64, (nb_cartes,)),
+        ('enemies_savoir', np.int64, (nb_enemies,)),
+        ('enemies_defense', np.int64, (nb_enemies,)),
+    ])
+
+
+def pack_states(rows: Sequence[ScoringInputs], nb_monstres: int = 3, nb_cartes: int = 6,
+                nb_enemies: int = 3) -> 'np.ndarray':
+    """
+    Range des arguments de Scoring dans un tableau structuré.
+    Les cartes et les monstres doivent être donnés dans l'ordre de leurs index, comme les réponses du serveur.
+
+    Args:
+        rows: Les arguments de Scoring, un tuple par état
+        nb_monstres: Nombre de places de monstre
+        nb_cartes: Nombre de pioches
+        nb_enemies: Nombre d'ennemis (tous les états doivent en avoir autant)
+
+    Returns:
+        np.ndarray: Les états
+    """
+    states = np.zeros(len(rows), dtype=state_dtype(nb_monstres, nb_cartes, nb_enemies))
+    monstres_vie = [[0] * nb_monstres for _ in rows]
+    monstres_gain = [[0] * nb_monstres for _ in rows]
+    monstres_vivant = [[False] * nb_monstres for _ in rows]
+    cartes_type = [[0] * nb_cartes for _ in rows]
+    cartes_valeur = [[0] * nb_cartes for _ in rows]
+    for row, (monstres, cartes, _, _, _, _, _) in enumerate(rows):
+        for monstre in monstres:
+            monstres_vie[row][monstre.index] = monstre.vie
+            monstres_gain[row][monstre.index] = monstre.gain_savoir
+            monstres_vivant[row][monstre.index] = True
+        for carte in cartes:
+            cartes_type[row][carte.index] = INDEX_TYPE[carte.type_carte]
+            cartes_valeur[row][carte.index] = carte.valeur
+
+    states['vie'] = [row[2].vie for row in rows]
+    states['score_defense'] = [row[2].score_defense for row in rows]
+    states['score_attaque'] = [row[2].score_attaque for row in rows]
+    states['score_savoir'] = [row[2].score_savoir for row in rows]
+    states['deck_defense'] = [row[3].sum_values_by_type(TypeCarte.DEFENSE) for row in rows]
+    states['deck_attaque'] = [row[3].sum_values_by_type(TypeCarte.ATTAQUE) for row in rows]
+    states['fdr'] = [row[4] for row in rows]
+    states['nb_tours'] = [row[5] for row in rows]
+    states['monstres_vie'] = monstres_vie
+    states['monstres_gain'] = monstres_gain
+    states['monstres_vivant'] = monstres_vivant
+    states['cartes_type'] = cartes_type
+    states['cartes_valeur'] = cartes_valeur
+    states['enemies_savoir'] = [[enemy.score_savoir for enemy in row[6]] for row in rows]
+    states['enemies_defense'] = [[enemy.score_defense for enemy in row[6]] for row in rows]
+    return states
+
+
+def pack_engines(engines: Iterable[GameEngine], player: int) -> 'np.ndarray':
+    """
+    Range les parties données (par exemple les feuilles d'une recherche) dans un tableau structuré,
+    vues par `player` au début de son tour, comme Strategy construit son Scoring.
+
+    Args:
+        engines: Les parties, toutes avec le même nombre de joueurs, de monstres et de pioches
+        player: Numéro du joueur
+
+    Returns:
+        np.ndarray: Les états
+    """
+    engines = list(engines)
+    first = engines[0]
+    others = [index for index in range(first.nb_joueurs) if index != player]
+    states = np.zeros(len(engines), dtype=state_dtype(len(first.monstres_vie), len(first.pioches_valeur), len(others)))
+
+    slot = player * NB_TYPES
+    states['vie'] = [engine.vie[player] for engine in engines]
+    states['score_defense'] = [engine.defense[player] for engine in engines]
+    states['score_attaque'] = [engine.attaque[player] for engine in engines]
+    states['score_savoir'] = [engine.savoir[player] for engine in engines]
+    states['deck_defense'] = [engine.deck_sums[slot + DEFENSE] for engine in engines]
+    states['deck_attaque'] = [engine.deck_sums[slot + ATTAQUE] for engine in engines]
+    states['fdr'] = [engine.degats() for engine in engines]
+    states['nb_tours'] = [engine.sous_tour + 1 for engine in engines]
+    states['monstres_vie'] = [engine.monstres_vie for engine in engines]
+    states['monstres_gain'] = [engine.monstres_gain for engine in engines]
+    states['monstres_vivant'] = states['monstres_vie'] > 0
+    states['cartes_type'] = [engine.pioches_type for engine in engines]
+    states['cartes_valeur'] = [engine.pioches_valeur for engine in engines]
+    states['enemies_savoir'] = [[engine.savoir[index] for index in others] for engine in engines]
+    states['enemies_defense'] = [[engine.defense[index] for index in others] for engine in engines]
+    return states
+
+
+def score_batch(states: 'np.ndarray', params: StrategyParams = DEFAULT_PARAMS) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Calcule les scores des monstres et des cartes de tous les états.
+
+    Args:
+        states: Les états (tableau structuré de type state_dtype)
+        params: Paramètres de la stratégie, comme pour Scoring
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Scores des monstres (états × monstres) et des cartes
+                                       (états × pioches) ; NaN pour ce que Scoring ne score pas
+    """
+    _require_numpy()
+    count = len(states)
+    rows = np.arange(count)
+    vivant = states['monstres_vivant']
+    monstres_vie = states['monstres_vie']
+    gain = states['monstres_gain'].astype(np.float64)
+    nb_monstres = vivant.sum(axis=1)
+
+    # ===== MONSTRES =====
+    attaque = states['score_attaque'] + states['deck_attaque']
+    premier_gain = gain[rows, vivant.argmax(axis=1)] / 4
+    multiplicateur = np.select(
+        [(params.HORIZON_SOUS_TOURS - states['nb_tours']) * params.VIE_PAR_SOUS_TOUR_RESTANT < premier_gain,
+         premier_gain < params.SEUIL_MONSTRE_FAIBLE, premier_gain < params.SEUIL_MONSTRE_MOYEN],
+        [0.0, params.MULTIPLICATEUR_MONSTRE_FAIBLE, params.MULTIPLICATEUR_MONSTRE_MOYEN],
+        0.0
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vie_max = gain / 4
+        multiplicateur_vie_restante = (((monstres_vie - 1) / (vie_max - 1)) * params.POIDS_VIE_RESTANTE - 1) * -1
+    multiplicateur_oneshot = np.where(attaque[:, None] >= monstres_vie, params.MULTIPLICATEUR_ONESHOT, 1.0)
+    scores = (gain * multiplicateur[:, None]) * multiplicateur_vie_restante * multiplicateur_oneshot
+    monstres_scores = np.where(vivant, scores, np.nan)
+
+    # ===== CARTES =====
+    types = states['cartes_type']
+    valeurs = states['cartes_valeur'].astype(np.float64)
+
+    defense = (states['score_defense'] + states['deck_defense'])[:, None]
+    fdr = states['fdr'][:, None]
+    multiplicateur_fdr = np.where(fdr > defense, (1 + (fdr - defense)) / params.DIVISEUR_FDR, 1.0)
+    multiplicateur_hard_danger = np.where(fdr > defense + states['vie'][:, None], params.MULTIPLICATEUR_DANGER, 1.0)
+    score_defense = valeurs * multiplicateur_fdr * multiplicateur_hard_danger * params.MULTIPLICATEUR_DEFENSE
+
+    score_monstre_max = np.zeros(count)
+    for index in range(monstres_scores.shape[1]):
+        meilleur = vivant[:, index] & (monstres_scores[:, index] > score_monstre_max)
+        score_monstre_max = np.where(meilleur, monstres_scores[:, index] / params.DIVISEUR_MONSTRE, score_monstre_max)
+    score_monstre_max = np.where(score_monstre_max == 0, 1.0, score_monstre_max)
+    multiplicateur_no_attaque = np.where(attaque == 0, params.MULTIPLICATEUR_SANS_ATTAQUE, 1.0)
+    multiplicateur_no_monstre = np.where(nb_monstres == 0, 0.0, 1.0)
+    score_attaque = (valeurs * multiplicateur_no_attaque[:, None] * multiplicateur_no_monstre[:, None]
+                     * score_monstre_max[:, None])
+
+    multiplicateur_savoir = np.where(nb_monstres == 0, params.MULTIPLICATEUR_SAVOIR_SANS_MONSTRE, 1 / np.maximum(nb_monstres, 1))
+    score_savoir = valeurs * multiplicateur_savoir[:, None]
+
+    cartes_scores = np.select([types == DEFENSE, types == ATTAQUE, types == SAVOIR],
+                              [score_defense, score_attaque, score_savoir], 0.0)
+
+    # Carte DEFENSE négative que l'ennemi le plus savant peut encaisser : Scoring s'arrête après elle
+    if states['enemies_savoir'].shape[1]:
+        plus_savant = states['enemies_savoir'].argmax(axis=1)
+        ennemi_savoir = states['enemies_savoir'][rows, plus_savant]
+        ennemi_defense = states['enemies_defense'][rows, plus_savant]
+        arret = ((types == DEFENSE) & (valeurs < 0) & (ennemi_savoir > states['score_savoir'])[:, None]
+                 & (ennemi_defense[:, None] >= valeurs * -1))
+        deja = np.cumsum(arret, axis=1)
+        premier_arret = arret & (deja == 1)
+        cartes_scores = np.where(premier_arret, (valeurs * -1) * params.MULTIPLICATEUR_MALUS_DEFENSE, cartes_scores)
+        cartes_scores = np.where(deja - arret > 0, np.nan, cartes_scores)
+
+    return monstres_scores, cartes_scores
+
+
+def to_scored(scores_row: 'np.ndarray') -> List[dict]:
+    """
+    Convertit une ligne de scores au format de Scoring.get_scored_monstres / get_scored_cartes.
+
+    Args:
+        scores_row: Les scores d'un état (NaN pour les éléments non scorés)
+
+    Returns:
+        List[dict]: Liste de dictionnaires contenant l'index et le score
+    """
+    return [{"index": index, "score": float(score)} for index, score in enumerate(scores_row) if not np.isnan(score)]
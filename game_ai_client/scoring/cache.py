@@ -0,0 +1,143 @@
+"""
+Table de transposition du Scoring.
+Mémorise les scores déjà calculés, avec une éviction LRU et une taille bornée, pour que les
+recherches (et les tours successifs) ne recalculent pas les scores d'états déjà vus.
+
+La clé ne retient que ce que Scoring lit réellement, pour que deux états différents mais
+équivalents pour le scoring partagent leurs scores :
+    - les monstres (index, vie, gain de savoir) et les cartes (index, type, valeur) ;
+    - l'attaque et la défense totales du joueur (score + cartes du deck) ;
+    - les dégâts de fin de tour, le nombre de tours et le danger mortel (dégâts > défense + vie) ;
+    - pour l'ennemi le plus savant : s'il nous dépasse en savoir, et sa défense.
+Les paramètres de la stratégie ne font pas partie de la clé : un cache ne sert qu'un jeu de paramètres.
+"""
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Any, Dict, Hashable, List, Tuple
+
+from ..models import Deck, Joueur, Monstre, Pioche, TypeCarte
+from .params import DEFAULT_PARAMS, StrategyParams
+from .scoring import Scoring
+
+
+# Nombre d'états mémorisés par défaut
+SCORING_CACHE_SIZE = 4096
+
+_monstre_key = attrgetter('index', 'vie', 'gain_savoir')
+_carte_key = attrgetter('index', 'type_carte', 'valeur')
+_savoir = attrgetter('score_savoir')
+
+
+def scoring_key(monstres: List[Monstre], cartes: List[Pioche], me: Joueur, deck: Deck, fdr: int,
+                nb_tours: int, enemies: List[Joueur]) -> Hashable:
+    """
+    Renvoie la clé compacte des arguments d'un Scoring.
+
+    Args:
+        monstres, cartes, me, deck, fdr, nb_tours, enemies: Les arguments de Scoring
+
+    Returns:
+        Hashable: La clé ; deux états de même clé ont les mêmes scores
+    """
+    defense = me.score_defense + deck.sum_values_by_type(TypeCarte.DEFENSE)
+    enemy = max(enemies, key=_savoir, default=None)
+    return (
+        tuple(map(_monstre_key, monstres)),
+        tuple(map(_carte_key, cartes)),
+        me.score_attaque + deck.sum_values_by_type(TypeCarte.ATTAQUE),
+        defense,
+        fdr > defense + me.vie,
+        fdr,
+        nb_tours,
+        None if enemy is None else (enemy.score_savoir > me.score_savoir, enemy.score_defense),
+    )
+
+
+class ScoringCache:
+    """
+    Cache LRU borné de scores, partagé par toutes les décisions d'une stratégie.
+    Les listes de scores renvoyées sont partagées entre les appels et ne doivent pas être modifiées.
+    """
+
+    def __init__(self, maxsize: int = SCORING_CACHE_SIZE, params: StrategyParams = DEFAULT_PARAMS):
+        """
+        Initialise le cache.
+
+        Args:
+            maxsize: Nombre maximal d'états mémorisés
+            params: Paramètres de la stratégie, utilisés pour tous les scores du cache
+        """
+        self.maxsize = maxsize
+        self.params = params
+        self._entries: 'OrderedDict[Hashable, Tuple[list, list]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, monstres: List[Monstre], cartes: List[Pioche], me: Joueur, deck: Deck, fdr: int,
+            nb_tours: int, enemies: List[Joueur]) -> Scoring:
+        """
+        Renvoie le Scoring de ces arguments, calculé ou retrouvé dans le cache.
+
+        Args:
+            monstres, cartes, me, deck, fdr, nb_tours, enemies: Les arguments de Scoring
+
+        Returns:
+            Scoring: Le scoring, dont les listes de scores peuvent être partagées
+        """
+        key = scoring_key(monstres, cartes, me, deck, fdr, nb_tours, enemies)
+        entries = self._entries
+        scores = entries.get(key)
+        if scores is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            scoring = Scoring.__new__(Scoring)
+            scoring.monstres = monstres
+            scoring.cartes = cartes
+            scoring.me = me
+            scoring.fdr = fdr
+            scoring.deck = deck
+            scoring.nb_tours = nb_tours
+            scoring.enemies = enemies
+            scoring.params = self.params
+            scoring.scored_monstres, scoring.scored_cartes = scores
+            return scoring
+
+        self.misses += 1
+        scoring = Scoring(monstres, cartes, me, deck, fdr, nb_tours, enemies, self.params)
+        entries[key] = (scoring.scored_monstres, scoring.scored_cartes)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return scoring
+
+    @property
+    def hit_rate(self) -> float:
+        """Part des demandes servies par le cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Renvoie les compteurs du cache.
+
+        Returns:
+            Dict[str, Any]: Succès, échecs, taux de succès, nombre d'états mémorisés et taille maximale
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """
+        Vide le cache et remet ses compteurs à zéro.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Nombre d'états mémorisés."""
+        return len(self._entries)
@@ -0,0 +1,113 @@
+"""
+Module contenant le choix de la victime d'une carte négative piochée (argument malus_player_number de PIOCHER).
+"""
+from typing import List, Optional, Tuple
+
+from ..models import Pioche, TypeCarte
+from .opponents import OpponentTracker, Projection
+
+
+class MalusTargeting:
+    """
+    Choisit à qui donner une carte négative : l'adversaire dont la pénalité fait le plus baisser
+    le savoir final du rival qui mène.
+
+    Pour chaque adversaire vivant, la fin de la partie est simulée tour par tour à partir des projections
+    du suivi des adversaires, avec et sans la carte : la défense (qui grandit à son rythme estimé)
+    encaisse les dégâts de chaque fin de tour, et un joueur mort perd le savoir gardé dans son deck.
+    Une carte DEFENSE négative baisse la défense de la victime jusqu'à la fin de la partie (et peut la tuer),
+    une carte SAVOIR négative son savoir final, une carte ATTAQUE négative le savoir de ses prochains monstres.
+    La victime retenue est celle qui minimise le meilleur savoir final adverse ; à égalité, celle qui perd le plus.
+    Deux simulations de 20 tours au plus par adversaire : moins de 0,2 ms par choix (benchmarks/bench_malus.py).
+    """
+
+    def __init__(self, tracker: OpponentTracker):
+        """
+        Initialise le choix des victimes.
+
+        Args:
+            tracker: Suivi des adversaires de la partie, dont les règles (durée, dégâts de fin de tour) sont suivies
+        """
+        self.tracker = tracker
+
+    def final_savoir(self, projection: Projection, defense_malus: float = 0.0, savoir_malus: float = 0.0,
+                     attaque_malus: float = 0.0) -> float:
+        """
+        Simule la fin de la partie d'un joueur et renvoie son savoir final.
+
+        Args:
+            projection: Projection du joueur
+            defense_malus: Défense retirée par une carte négative
+            savoir_malus: Savoir retiré par une carte négative
+            attaque_malus: Attaque retirée par une carte négative
+
+        Returns:
+            float: Le savoir à la FIN (celui acquis avant sa mort, s'il meurt)
+        """
+        rules = self.tracker.rules
+        nb_sous_tours, degats = rules.NB_SOUS_TOURS, rules.DEGATS_PAR_TOUR
+        instant = self.tracker.instant
+        tour = instant // nb_sous_tours + 1
+        vie = projection.vie
+        defense = projection.defense + projection.hidden_defense - defense_malus
+        # Sous-tours joués d'ici la prochaine fin de tour, puis un tour complet à chaque fois
+        step = nb_sous_tours - instant % nb_sous_tours
+        elapsed = 0
+        while tour <= rules.NB_TOURS:
+            elapsed += step
+            defense += projection.defense_rate * step
+            vie -= max(degats * tour - defense, 0)
+            if vie <= 0:
+                return projection.savoir + projection.kill_rate * elapsed
+            tour += 1
+            step = nb_sous_tours
+        remaining = self.tracker.remaining_turns()
+        return (projection.savoir + projection.hidden_savoir
+                + remaining * (projection.savoir_rate + projection.kill_rate)
+                - savoir_malus - attaque_malus * projection.savoir_per_attack)
+
+    def evaluate(self, pioche: Pioche) -> List[Tuple[int, float, float]]:
+        """
+        Évalue chaque victime possible d'une carte négative.
+
+        Args:
+            pioche: La carte négative
+
+        Returns:
+            List[Tuple[int, float, float]]: Pour chaque adversaire vivant, (numéro, meilleur savoir final
+                adverse s'il reçoit la carte, savoir qu'il perd)
+        """
+        tracker = self.tracker
+        opponents = tracker.opponents()
+        if not opponents or pioche.valeur >= 0:
+            return []
+        penalty = -pioche.valeur
+        malus = {
+            TypeCarte.DEFENSE: {"defense_malus": penalty},
+            TypeCarte.SAVOIR: {"savoir_malus": penalty},
+            TypeCarte.ATTAQUE: {"attaque_malus": penalty},
+        }.get(pioche.type_carte, {})
+
+        projections = {player: tracker.projection(player) for player in opponents}
+        baseline = {player: self.final_savoir(projection) for player, projection in projections.items()}
+        results = []
+        for victim in opponents:
+            hit = self.final_savoir(projections[victim], **malus)
+            best_other = max((baseline[player] for player in opponents if player != victim), default=hit)
+            results.append((victim, max(best_other, hit), baseline[victim] - hit))
+        return results
+
+    def choose(self, pioche: Pioche) -> Optional[int]:
+        """
+        Choisit la victime d'une carte négative.
+
+        Args:
+            pioche: La carte négative
+
+        Returns:
+            Optional[int]: Le numéro de la victime, None sans adversaire vivant (la carte est alors gardée)
+        """
+        results = self.evaluate(pioche)
+        if not results:
+            return None
+        return min(results, key=lambda result: (result[1], -result[2]))[0]
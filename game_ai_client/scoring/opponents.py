@@ -0,0 +1,268 @@
+"""
+Module contenant le suivi des adversaires au fil d'une partie.
+Garde l'historique des réponses JOUEURS dans un tampon circulaire et en déduit, pour chaque adversaire,
+la répartition probable de ses pioches et son savoir et sa défense attendus à la FIN de la partie.
+"""
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from ..models import GameRules, Joueur, TurnState, TypeCarte
+
+
+# Statistiques d'un joueur dans une ligne du tampon, dans l'ordre de la réponse JOUEURS
+VIE, DEFENSE, ATTAQUE, SAVOIR = range(4)
+NB_STATS = 4
+
+# Types de carte dont les valeurs sont cumulées, dans l'ordre des accumulateurs
+TYPES = (TypeCarte.DEFENSE, TypeCarte.ATTAQUE, TypeCarte.SAVOIR)
+NB_TYPES = len(TYPES)
+
+# Valeur moyenne d'une pioche positive avant la première observation des pioches (randint(1, 5))
+VALEUR_PIOCHE_INITIALE = 3.0
+
+
+class Projection(NamedTuple):
+    """
+    Dernières statistiques d'un joueur et rythmes estimés, par sous-tour, pour projeter la fin de la partie.
+    """
+    vie: int
+    defense: int
+    savoir: int
+    hidden_defense: float
+    hidden_savoir: float
+    defense_rate: float
+    savoir_rate: float
+    kill_rate: float
+    savoir_per_attack: float
+
+
+class OpponentTracker:
+    """
+    Suivi des adversaires pendant une partie, mis à jour une fois par tour en O(joueurs).
+
+    Les pioches des adversaires ne sont pas visibles : seules leurs statistiques le sont, et une carte ne
+    se révèle que lorsqu'elle est utilisée. Chaque hausse de défense, d'attaque ou de savoir entre deux
+    observations est comptée comme valeur de cartes utilisées de ce type ; une baisse de l'attaque signale
+    une attaque, et le savoir gagné en même temps est compté comme savoir de monstre.
+
+    Chaque adversaire pioche une carte par sous-tour, d'une valeur moyenne estimée sur les pioches observées.
+    La valeur piochée mais pas encore révélée est encore dans son deck : la défense piochée depuis le début
+    du tour (utilisée en général au dernier sous-tour) au rythme de ses défenses passées, le reste étant du
+    savoir gardé pour la fin de la partie.
+    """
+
+    def __init__(self, capacity: int = 64, rules: Optional[GameRules] = None):
+        """
+        Initialise le suivi.
+
+        Args:
+            capacity: Nombre de réponses JOUEURS gardées dans le tampon circulaire
+            rules: Règles de la partie, pour sa durée (par défaut GameRules)
+        """
+        self.capacity = capacity
+        self.rules = rules if rules is not None else GameRules()
+        self.team_number: Optional[int] = None
+        self.nb_joueurs = 0
+        self.observations = 0
+        self.instant = 0
+        self.valeur_pioche = VALEUR_PIOCHE_INITIALE
+        self._pioches_vues = 0
+        self._rows = array('i')
+        self._instants = array('i', [0] * capacity)
+        self._revealed: List[float] = []
+        self._attack_savoir: List[int] = []
+        self._attacks: List[int] = []
+
+    def _reset(self, nb_joueurs: int):
+        """Remet le suivi à zéro pour une partie de `nb_joueurs` joueurs."""
+        self.nb_joueurs = nb_joueurs
+        self.observations = 0
+        self._rows = array('i', [0] * (self.capacity * nb_joueurs * NB_STATS))
+        self._revealed = [0] * (nb_joueurs * NB_TYPES)
+        self._attack_savoir = [0] * nb_joueurs
+        self._attacks = [0] * nb_joueurs
+
+    def observe(self, state: TurnState, team_number: Optional[int]):
+        """
+        Ajoute la réponse JOUEURS d'un tour à l'historique et met à jour les estimations.
+
+        Args:
+            state: État du jeu au début de notre tour
+            team_number: Numéro de notre équipe
+        """
+        joueurs = state.joueurs
+        if len(joueurs) != self.nb_joueurs:
+            self._reset(len(joueurs))
+        self.team_number = team_number
+        self.instant = (state.tour - 1) * self.rules.NB_SOUS_TOURS + state.sous_tour
+
+        for pioche in state.pioches:
+            if pioche.valeur > 0:
+                self._pioches_vues += 1
+                self.valeur_pioche += (pioche.valeur - self.valeur_pioche) / self._pioches_vues
+
+        rows = self._rows
+        width = self.nb_joueurs * NB_STATS
+        slot = self.observations % self.capacity
+        base = slot * width
+        previous = ((self.observations - 1) % self.capacity) * width if self.observations else -1
+        revealed = self._revealed
+        for index, joueur in enumerate(joueurs):
+            offset = base + index * NB_STATS
+            rows[offset + VIE] = joueur.vie
+            rows[offset + DEFENSE] = joueur.score_defense
+            rows[offset + ATTAQUE] = joueur.score_attaque
+            rows[offset + SAVOIR] = joueur.score_savoir
+            if previous < 0:
+                continue
+            before = previous + index * NB_STATS
+            types = index * NB_TYPES
+            defense = joueur.score_defense - rows[before + DEFENSE]
+            if defense:
+                revealed[types] += defense
+            attaque = joueur.score_attaque - rows[before + ATTAQUE]
+            savoir = joueur.score_savoir - rows[before + SAVOIR]
+            if attaque < 0:
+                self._attacks[index] += 1
+                if savoir > 0:
+                    self._attack_savoir[index] += savoir
+                    savoir = 0
+            elif attaque:
+                revealed[types + 1] += attaque
+            if savoir:
+                revealed[types + 2] += savoir
+        self._instants[slot] = self.instant
+        self.observations += 1
+
+    def history(self, player: int) -> List[Tuple[int, Joueur]]:
+        """
+        Renvoie la trajectoire d'un joueur gardée dans le tampon, de la plus ancienne à la plus récente.
+
+        Args:
+            player: Numéro du joueur
+
+        Returns:
+            List[Tuple[int, Joueur]]: (sous-tours écoulés depuis le début de la partie, statistiques)
+        """
+        trajectory = []
+        width = self.nb_joueurs * NB_STATS
+        for observation in range(max(self.observations - self.capacity, 0), self.observations):
+            slot = observation % self.capacity
+            offset = slot * width + player * NB_STATS
+            stats = self._rows[offset:offset + NB_STATS]
+            joueur = Joueur(*stats)
+            joueur.set_index(player)
+            trajectory.append((self._instants[slot], joueur))
+        return trajectory
+
+    def _latest(self, player: int, stat: int) -> int:
+        """Dernière valeur observée d'une statistique d'un joueur."""
+        slot = (self.observations - 1) % self.capacity
+        return self._rows[slot * self.nb_joueurs * NB_STATS + player * NB_STATS + stat]
+
+    def _hidden(self, player: int) -> Tuple[float, float, float]:
+        """Valeur piochée par un joueur mais pas encore révélée : (totale, dont défense, dont savoir)."""
+        picks = self.instant + 1
+        types = player * NB_TYPES
+        revealed = self._revealed[types:types + NB_TYPES]
+        hidden = max(picks * self.valeur_pioche - sum(revealed), 0.0)
+        defense_per_pick = max(revealed[0], 0) / picks
+        hidden_defense = min(hidden, defense_per_pick * (self.instant % self.rules.NB_SOUS_TOURS))
+        return hidden, hidden_defense, hidden - hidden_defense
+
+    def pick_pattern(self, player: int) -> Dict[TypeCarte, float]:
+        """
+        Renvoie la répartition probable des pioches d'un joueur par type, en part de la valeur piochée.
+
+        Args:
+            player: Numéro du joueur
+
+        Returns:
+            Dict[TypeCarte, float]: Part de chaque type (somme 1 ; un tiers chacun sans observation)
+        """
+        if not self.observations:
+            return {type_carte: 1 / NB_TYPES for type_carte in TYPES}
+        types = player * NB_TYPES
+        _, hidden_defense, hidden_savoir = self._hidden(player)
+        values = (max(self._revealed[types], 0) + hidden_defense,
+                  max(self._revealed[types + 1], 0),
+                  max(self._revealed[types + 2], 0) + hidden_savoir)
+        total = sum(values)
+        if total <= 0:
+            return {type_carte: 1 / NB_TYPES for type_carte in TYPES}
+        return {type_carte: value / total for type_carte, value in zip(TYPES, values)}
+
+    def remaining_turns(self) -> int:
+        """
+        Renvoie le nombre de sous-tours restant à jouer après l'observation la plus récente.
+
+        Returns:
+            int: Les sous-tours restants (un par joueur vivant)
+        """
+        return max(self.rules.NB_TOURS * self.rules.NB_SOUS_TOURS - 1 - self.instant, 0)
+
+    def projection(self, player: int) -> Projection:
+        """
+        Renvoie les dernières statistiques d'un joueur et ses rythmes estimés.
+
+        Args:
+            player: Numéro du joueur
+
+        Returns:
+            Projection: Statistiques, valeur cachée dans son deck et gains attendus par sous-tour
+        """
+        vie, defense, savoir = (self._latest(player, VIE), self._latest(player, DEFENSE),
+                                self._latest(player, SAVOIR))
+        _, hidden_defense, hidden_savoir = self._hidden(player)
+        pattern = self.pick_pattern(player)
+        picks = self.instant + 1
+        revealed_attaque = self._revealed[player * NB_TYPES + 1]
+        return Projection(vie, defense, savoir, hidden_defense, hidden_savoir,
+                          self.valeur_pioche * pattern[TypeCarte.DEFENSE],
+                          self.valeur_pioche * pattern[TypeCarte.SAVOIR],
+                          self._attack_savoir[player] / picks,
+                          self._attack_savoir[player] / revealed_attaque if revealed_attaque > 0 else 0.0)
+
+    def expected_at_fin(self, player: int) -> Tuple[float, float]:
+        """
+        Renvoie le savoir et la défense attendus d'un joueur à la FIN de la partie.
+        Un joueur mort garde son savoir et perd son deck.
+
+        Args:
+            player: Numéro du joueur
+
+        Returns:
+            Tuple[float, float]: (savoir attendu, défense attendue)
+        """
+        if not self.observations:
+            return 0.0, 0.0
+        projection = self.projection(player)
+        if projection.vie <= 0:
+            return float(projection.savoir), float(projection.defense)
+        remaining = self.remaining_turns()
+        return (projection.savoir + projection.hidden_savoir
+                + remaining * (projection.savoir_rate + projection.kill_rate),
+                projection.defense + projection.hidden_defense + remaining * projection.defense_rate)
+
+    def opponents(self) -> List[int]:
+        """
+        Renvoie les numéros des adversaires encore en vie.
+
+        Returns:
+            List[int]: Les adversaires vivants
+        """
+        if not self.observations:
+            return []
+        return [player for player in range(self.nb_joueurs)
+                if player != self.team_number and self._latest(player, VIE) > 0]
+
+    def leader(self) -> Optional[int]:
+        """
+        Renvoie l'adversaire vivant de meilleur savoir attendu à la FIN.
+
+        Returns:
+            Optional[int]: Son numéro, None sans adversaire vivant ou sans numéro d'équipe
+        """
+        if self.team_number is None:
+            return None
+        return max(self.opponents(), key=lambda player: self.expected_at_fin(player)[0], default=None)
@@ -0,0 +1,172 @@
+"""
+Module contenant les paramètres de la stratégie heuristique (Scoring et règles de décision de Strategy).
+Un jeu de paramètres s'enregistre dans un profil JSON, produit par le réglage hors ligne (tune.py)
+et chargé par main.py avec --profile.
+"""
+from typing import Any, Dict, Hashable, Tuple
+
+
+class StrategyParams:
+    """
+    Paramètres de la stratégie heuristique.
+    Les attributs de classe servent de valeurs par défaut, comme pour GameRules ; une instance ne garde
+    que ses valeurs, converties dans le type annoté de chaque paramètre.
+    """
+    # ===== SCORING DES MONSTRES =====
+    # Multiplicateur d'un monstre que l'attaque du joueur (score + deck) achève en une fois
+    MULTIPLICATEUR_ONESHOT: float = 1.5
+    # Poids de la vie restante : un monstre blessé vaut jusqu'à (1 + POIDS_VIE_RESTANTE) fois plus
+    POIDS_VIE_RESTANTE: float = 0.5
+    # Monstres ignorés si leur vie max dépasse (HORIZON_SOUS_TOURS - sous-tour) * VIE_PAR_SOUS_TOUR_RESTANT
+    HORIZON_SOUS_TOURS: int = 16
+    # 2 * 4, où 4 correspond au nombre de joueurs vivants
+    VIE_PAR_SOUS_TOUR_RESTANT: float = 8
+    # Multiplicateur des monstres de vie max inférieure à SEUIL_MONSTRE_FAIBLE, puis à SEUIL_MONSTRE_MOYEN
+    SEUIL_MONSTRE_FAIBLE: float = 40
+    MULTIPLICATEUR_MONSTRE_FAIBLE: float = 4
+    SEUIL_MONSTRE_MOYEN: float = 110
+    MULTIPLICATEUR_MONSTRE_MOYEN: float = 2
+
+    # ===== SCORING DES CARTES =====
+    # Carte DEFENSE négative que l'ennemi le plus savant peut encaisser
+    MULTIPLICATEUR_MALUS_DEFENSE: float = 2
+    # Carte DEFENSE : (1 + dégâts non couverts) / DIVISEUR_FDR, fois MULTIPLICATEUR_DANGER si les dégâts tuent
+    DIVISEUR_FDR: float = 10
+    MULTIPLICATEUR_DANGER: float = 100
+    MULTIPLICATEUR_DEFENSE: float = 2
+    # Carte ATTAQUE : multipliée sans attaque, et par le meilleur score de monstre / DIVISEUR_MONSTRE
+    MULTIPLICATEUR_SANS_ATTAQUE: float = 5
+    DIVISEUR_MONSTRE: float = 10
+    # Carte SAVOIR quand il n'y a plus de monstre vivant
+    MULTIPLICATEUR_SAVOIR_SANS_MONSTRE: float = 5
+
+    # ===== RÈGLES DE DÉCISION =====
+    # Tour et sous-tour où tout le savoir du deck est utilisé avant la FIN (dernier sous-tour de la partie)
+    TOUR_FINAL: int = 20
+    SOUS_TOUR_FINAL: int = 15
+    # Sous-tour où la défense du deck est utilisée, avant les dégâts de fin de tour
+    SOUS_TOUR_DEFENSE: int = 15
+    # Savoir (score + deck) au-delà duquel le savoir du deck est utilisé tous les CADENCE_SAVOIR sous-tours
+    SEUIL_SAVOIR: float = 2000
+    CADENCE_SAVOIR: int = 4
+    # Un sous-tour sur CADENCE_ATTAQUE est consacré à attaquer
+    CADENCE_ATTAQUE: int = 4
+
+    def __init__(self, **values: Any):
+        """
+        Crée un jeu de paramètres.
+        Les paramètres non fournis reprennent les valeurs par défaut de la classe.
+
+        Args:
+            values: Paramètres à surcharger, par nom
+
+        Raises:
+            ValueError: Si un nom n'est pas un paramètre
+        """
+        types = self.types()
+        unknown = sorted(set(values) - set(types))
+        if unknown:
+            raise ValueError(f"Paramètres inconnus: {unknown} (disponibles: {sorted(types)})")
+        for name, value in values.items():
+            setattr(self, name, types[name](round(value) if types[name] is int else value))
+
+    @classmethod
+    def types(cls) -> Dict[str, type]:
+        """
+        Renvoie le type de chaque paramètre, dans l'ordre de déclaration.
+
+        Returns:
+            Dict[str, type]: Le type annoté de chaque paramètre
+        """
+        return dict(cls.__annotations__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Renvoie les valeurs de tous les paramètres.
+
+        Returns:
+            Dict[str, Any]: Les paramètres, par nom
+        """
+        return {name: getattr(self, name) for name in self.types()}
+
+    def key(self) -> Hashable:
+        """
+        Renvoie une clé qui identifie le jeu de paramètres.
+
+        Returns:
+            Hashable: Les valeurs de tous les paramètres
+        """
+        return tuple(getattr(self, name) for name in self.types())
+
+    def save(self, path: str):
+        """
+        Enregistre les paramètres dans un profil JSON.
+
+        Args:
+            path: Chemin du profil
+        """
+        import json
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+            file.write("\n")
+
+    @classmethod
+    def load(cls, path: str) -> 'StrategyParams':
+        """
+        Charge un profil JSON ; les paramètres absents du profil gardent leur valeur par défaut.
+
+        Args:
+            path: Chemin du profil
+
+        Returns:
+            StrategyParams: Les paramètres du profil
+
+        Raises:
+            ValueError: Si le profil n'est pas un objet JSON de paramètres connus
+        """
+        # json n'est importé que pour un profil, pour que le démarrage d'un client par défaut reste rapide
+        import json
+        with open(path, encoding="utf-8") as file:
+            values = json.load(file)
+        if not isinstance(values, dict):
+            raise ValueError(f"Profil invalide: {path} (objet JSON attendu)")
+        return cls(**values)
+
+    def __eq__(self, other: object) -> bool:
+        """Deux jeux de paramètres sont égaux si toutes leurs valeurs le sont."""
+        return isinstance(other, StrategyParams) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __repr__(self) -> str:
+        """Retourne les paramètres différents des valeurs par défaut."""
+        changed = ", ".join(f"{name}={value!r}" for name, value in self.to_dict().items()
+                            if value != getattr(StrategyParams, name))
+        return f"StrategyParams({changed})"
+
+
+# Bornes explorées par le réglage, par paramètre : (minimum, maximum).
+# Les paramètres liés aux règles (durée de la partie, dernier sous-tour) ne sont pas réglés.
+BORNES: Dict[str, Tuple[float, float]] = {
+    "MULTIPLICATEUR_ONESHOT": (1.0, 4.0),
+    "POIDS_VIE_RESTANTE": (0.0, 1.0),
+    "VIE_PAR_SOUS_TOUR_RESTANT": (2, 24),
+    "SEUIL_MONSTRE_FAIBLE": (10, 100),
+    "MULTIPLICATEUR_MONSTRE_FAIBLE": (1, 8),
+    "SEUIL_MONSTRE_MOYEN": (60, 300),
+    "MULTIPLICATEUR_MONSTRE_MOYEN": (0, 6),
+    "MULTIPLICATEUR_MALUS_DEFENSE": (0.5, 8),
+    "DIVISEUR_FDR": (2, 40),
+    "MULTIPLICATEUR_DANGER": (1, 400),
+    "MULTIPLICATEUR_DEFENSE": (0.5, 8),
+    "MULTIPLICATEUR_SANS_ATTAQUE": (1, 20),
+    "DIVISEUR_MONSTRE": (2, 40),
+    "MULTIPLICATEUR_SAVOIR_SANS_MONSTRE": (1, 20),
+    "SEUIL_SAVOIR": (200, 4000),
+    "CADENCE_SAVOIR": (2, 8),
+    "CADENCE_ATTAQUE": (2, 8),
+}
+
+# Paramètres par défaut, partagés par les Scoring créés sans paramètres
+DEFAULT_PARAMS = StrategyParams()
@@ -3,15 +3,18 @@ from ..models import Pioche
 from ..models import Joueur
 from ..models import TypeCarte
 from ..models import Deck
+from .params import DEFAULT_PARAMS, StrategyParams
 
 class Scoring:
-    def __init__(self, monstres: list[Monstre], cartes: list[Pioche], me: Joueur, deck: Deck, fdr: int, nb_tours: int, enemies: list[Joueur]):
+    def __init__(self, monstres: list[Monstre], cartes: list[Pioche], me: Joueur, deck: Deck, fdr: int, nb_tours: int, enemies: list[Joueur],
+                 params: StrategyParams = DEFAULT_PARAMS):
         """
         Initialise le système de scoring pour le jeu.
 
         Args:
             monstres: Liste d'instances de la classe Monstre
             Pioche: Instance de la classe Pioche
+            params: Paramètres de la stratégie (par défaut DEFAULT_PARAMS)
         """
         self.monstres = monstres
         self.cartes = cartes
@@ -22,6 +25,7 @@ class Scoring:
         self.scored_monstres = []
         self.scored_cartes = []
         self.enemies = enemies
+        self.params = params
         self.set_score_monstres()
         self.set_score_cartes()
 
@@ -50,13 +54,14 @@ class Scoring:
         Args:
             monstre: Instance de la classe Monstre
         """
+        params = self.params
         for monstre in self.monstres:
             vie_max = monstre.gain_savoir / 4
-            multiplicateur_vie_restante = (((monstre.vie - 1) / (vie_max -1)) * 0.5 - 1) * -1
+            multiplicateur_vie_restante = (((monstre.vie - 1) / (vie_max -1)) * params.POIDS_VIE_RESTANTE - 1) * -1
 
             multiplicateur_monstre_oneshot = 1
             if (self.me.score_attaque + self.deck.sum_values_by_type(TypeCarte.ATTAQUE)) >= monstre.vie:
-                multiplicateur_monstre_oneshot = 1.5
+                multiplicateur_monstre_oneshot = params.MULTIPLICATEUR_ONESHOT
 
             score = (monstre.gain_savoir * self.get_monstres_multiplicateurs()) * multiplicateur_vie_restante * multiplicateur_monstre_oneshot
             
@@ -72,16 +77,17 @@ class Scoring:
         Args:
             carte: Instance de la classe Pioche
         """
+        params = self.params
         for carte in self.cartes:
 
             score_valeur = 0
 
             if carte.type_carte == TypeCarte.DEFENSE:
                 if carte.valeur < 0:
-                    enemy_with_most_knowledge = max(self.enemies, key=lambda enemy: enemy.savoir, default=None)
-                    if enemy_with_most_knowledge is not None and enemy_with_most_knowledge.savoir > self.me.savoir:
+                    enemy_with_most_knowledge = max(self.enemies, key=lambda enemy: enemy.score_savoir, default=None)
+                    if enemy_with_most_knowledge is not None and enemy_with_most_knowledge.score_savoir > self.me.score_savoir:
                         if enemy_with_most_knowledge.score_defense >= carte.valeur*-1:
-                            score_valeur = (carte.valeur * -1) * 2
+                            score_valeur = (carte.valeur * -1) * params.MULTIPLICATEUR_MALUS_DEFENSE
                             self.scored_cartes.append({
                                 "index": carte.index,
                                 "score": score_valeur
@@ -91,18 +97,18 @@ class Scoring:
                 multiplicateur_fdr = 1
                 if self.fdr > (self.me.score_defense + self.deck.sum_values_by_type(TypeCarte.DEFENSE)):
                     defense = self.fdr - (self.me.score_defense + self.deck.sum_values_by_type(TypeCarte.DEFENSE))
-                    multiplicateur_fdr = (1 + defense) / 10
+                    multiplicateur_fdr = (1 + defense) / params.DIVISEUR_FDR
 
                 multiplicateur_hard_danger = 1
                 if self.fdr > (self.me.score_defense + self.deck.sum_values_by_type(TypeCarte.DEFENSE)) + self.me.vie:
-                    multiplicateur_hard_danger = 100
+                    multiplicateur_hard_danger = params.MULTIPLICATEUR_DANGER
 
-                score_valeur = carte.valeur * multiplicateur_fdr * multiplicateur_hard_danger * 2
+                score_valeur = carte.valeur * multiplicateur_fdr * multiplicateur_hard_danger * params.MULTIPLICATEUR_DEFENSE
 
             elif carte.type_carte == TypeCarte.ATTAQUE:
                 multiplicateur_no_attaque = 1
                 if (self.me.score_attaque + self.deck.sum_values_by_type(TypeCarte.ATTAQUE)) == 0:
-                    multiplicateur_no_attaque = 5
+                    multiplicateur_no_attaque = params.MULTIPLICATEUR_SANS_ATTAQUE
                 
                 multiplicateur_no_monstre = 1
                 if self.scored_monstres.__len__() == 0:
@@ -111,7 +117,7 @@ class Scoring:
                 score_monstre_max = 0
                 for monstre in self.scored_monstres:
                     if monstre["score"] > score_monstre_max:
-                        score_monstre_max = monstre["score"]/10
+                        score_monstre_max = monstre["score"]/params.DIVISEUR_MONSTRE
                     
                 if score_monstre_max == 0:
                     score_monstre_max = 1
@@ -121,7 +127,7 @@ class Scoring:
             elif carte.type_carte == TypeCarte.SAVOIR:
                 multiplicateur_no_monstre = 1
                 if self.scored_monstres.__len__() == 0:
-                    multiplicateur_no_monstre = 5
+                    multiplicateur_no_monstre = params.MULTIPLICATEUR_SAVOIR_SANS_MONSTRE
                 else:
                     multiplicateur_no_monstre = 1/self.scored_monstres.__len__()
 
@@ -133,12 +139,13 @@ class Scoring:
             })
     
     def get_monstres_multiplicateurs(self):
-        # TODO: Dans (16 - self.nb_tours) * 2 * 4, 4 correspond aun ombre de joueur vivant
-        if (16 - self.nb_tours) * 2 * 4 < self.monstres[0].gain_savoir / 4:
+        params = self.params
+        # TODO: Dans (HORIZON_SOUS_TOURS - self.nb_tours) * VIE_PAR_SOUS_TOUR_RESTANT, VIE_PAR_SOUS_TOUR_RESTANT dépend du nombre de joueurs vivants
+        if (params.HORIZON_SOUS_TOURS - self.nb_tours) * params.VIE_PAR_SOUS_TOUR_RESTANT < self.monstres[0].gain_savoir / 4:
             return 0
-        elif self.monstres[0].gain_savoir / 4 < 40:
-            return 4
-        elif self.monstres[0].gain_savoir / 4 < 110:
-            return 2
+        elif self.monstres[0].gain_savoir / 4 < params.SEUIL_MONSTRE_FAIBLE:
+            return params.MULTIPLICATEUR_MONSTRE_FAIBLE
+        elif self.monstres[0].gain_savoir / 4 < params.SEUIL_MONSTRE_MOYEN:
+            return params.MULTIPLICATEUR_MONSTRE_MOYEN
         else:
             return 0
\ No newline at end of file
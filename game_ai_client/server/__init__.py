@@ -0,0 +1,11 @@
+"""
+Serveur de jeu local pour le client IA.
+Implémente le protocole du serveur officiel pour jouer et mesurer hors ligne.
+"""
+from ..simulation.engine import GameRules
+from .game import LocalGame
+from .transport import LocalServer, MemoryConnection
+from .match import play_memory_game
+from .faults import FaultyProxy
+
+__all__ = ['GameRules', 'LocalGame', 'LocalServer', 'MemoryConnection', 'play_memory_game', 'FaultyProxy']
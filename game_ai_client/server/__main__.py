@@ -0,0 +1,38 @@
+"""
+Point d'entrée du serveur local.
+
+Usage:
+    python -m game_ai_client.server --port 1234 --clients 2 --players 4 --seed 42
+"""
+import argparse
+import sys
+
+from ..utils import Config, Logger
+from .game import LocalGame
+from .transport import LocalServer
+
+
+def main() -> int:
+    """
+    Lance un serveur local pour une partie.
+    """
+    parser = argparse.ArgumentParser(description='Serveur de jeu local')
+    parser.add_argument('--host', type=str, default=Config.HOSTNAME_SERVER)
+    parser.add_argument('--port', type=int, default=Config.PORT_SERVER)
+    parser.add_argument('--clients', type=int, default=1, help='Nombre de clients attendus')
+    parser.add_argument('--players', type=int, default=4, help='Nombre total de joueurs (les places libres sont jouées par le serveur)')
+    parser.add_argument('--seed', type=int, default=0, help='Graine de la partie')
+    parser.add_argument('--timeout', type=float, default=Config.GAME_SETTINGS["timeout"], help='Délai de réponse maximal en secondes')
+    args = parser.parse_args()
+
+    server = LocalServer(LocalGame(args.players, args.seed), args.clients, args.host, args.port, args.timeout)
+    Logger.info(f"Serveur local en attente de {args.clients} client(s) sur {args.host}:{server.address[1]}")
+    server.serve()
+    engine = server.game.engine
+    for rank, index in enumerate(server.game.ranking(), start=1):
+        Logger.info(f"{rank}. {server.game.names[index]} (équipe {index}) : savoir={engine.savoir[index]}, vie={engine.vie[index]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
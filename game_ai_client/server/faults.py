@@ -0,0 +1,177 @@
+"""
+Module contenant un relais TCP qui injecte des pannes entre un client et un serveur local.
+Sert à mesurer la reprise d'un client après une coupure ou une réponse lente.
+"""
+import random
+import socket
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from ..utils.line_reader import LineReader
+from ..utils.logger import Logger
+
+
+class FaultyProxy:
+    """
+    Relais entre un client et un serveur (par exemple un LocalServer).
+    La connexion au serveur est gardée pendant toute la partie : un client qui se reconnecte au relais
+    retrouve sa place, comme auprès d'un serveur qui garde la place d'un joueur déconnecté.
+
+    Pannes injectées :
+    - coupure du client après chaque `drop_every` lignes reçues de lui, la dernière étant perdue
+      (jamais transmise au serveur) ou transmise et sa réponse perdue, au hasard ;
+    - réponse retardée de `delay` secondes toutes les `slow_every` réponses ;
+    - silence de `idle` secondes avant tous les `idle_every` messages spontanés, quand le client n'attend
+      aucune réponse (comme la salle d'attente d'un vrai serveur ou l'attente de la FIN).
+    Les réponses aux demandes d'une connexion coupée sont perdues ; ses messages spontanés
+    (DEBUT_TOUR, FIN...) sont gardés et remis au client suivant.
+    """
+
+    def __init__(self, upstream: Tuple[str, int], drop_every: int = 0, slow_every: int = 0,
+                 delay: float = 0.0, seed: Optional[int] = None, host: str = "localhost", port: int = 0,
+                 idle_every: int = 0, idle: float = 0.0):
+        """
+        Initialise le relais et ouvre le socket d'écoute.
+
+        Args:
+            upstream: Adresse du serveur
+            drop_every: Lignes du client entre deux coupures (0 : pas de coupure)
+            slow_every: Réponses entre deux réponses retardées (0 : pas de retard)
+            delay: Retard d'une réponse lente, en secondes
+            seed: Graine du choix entre demande perdue et réponse perdue
+            host: Adresse d'écoute
+            port: Port d'écoute (0 pour un port libre choisi par le système)
+            idle_every: Messages spontanés entre deux silences (0 : pas de silence)
+            idle: Durée d'un silence, en secondes
+        """
+        self.upstream = upstream
+        self.drop_every = drop_every
+        self.slow_every = slow_every
+        self.delay = delay
+        self.idle_every = idle_every
+        self.idle = idle
+        self.drops = 0
+        self.slow_replies = 0
+        self.idle_gaps = 0
+        self.connections = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._client: Optional[socket.socket] = None
+        self._server: Optional[socket.socket] = None
+        self._outstanding: Deque[socket.socket] = deque()
+        self._replies = 0
+        self._prompts: List[bytes] = []
+        self._finished = False
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((host, port))
+        self._listener.listen(4)
+        self.address = self._listener.getsockname()
+        self._thread: Optional[threading.Thread] = None
+
+    def _forward_server(self):
+        """Transmet les lignes du serveur au client courant, jusqu'à la fin de la partie."""
+        reader = LineReader(self._server)
+        prompts = 0
+        try:
+            while True:
+                line = reader.read_line() + b'\n'
+                with self._lock:
+                    # Une réponse va à la connexion qui a envoyé la demande, perdue si elle est fermée
+                    reply = bool(self._outstanding)
+                    if reply:
+                        owner = self._outstanding.popleft()
+                        self._replies += 1
+                    client = self._client
+                    if client is None or (reply and owner is not client):
+                        if not reply:
+                            self._prompts.append(line)
+                        continue
+                if reply and self.slow_every and self._replies % self.slow_every == 0:
+                    self.slow_replies += 1
+                    time.sleep(self.delay)
+                if not reply:
+                    prompts += 1
+                    if self.idle_every and prompts % self.idle_every == 0:
+                        self.idle_gaps += 1
+                        time.sleep(self.idle)
+                try:
+                    client.sendall(line)
+                except OSError:
+                    if not reply:
+                        with self._lock:
+                            self._prompts.append(line)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            with self._lock:
+                self._finished = True
+                client, self._client = self._client, None
+            if client is not None:
+                client.close()
+            self._listener.close()
+
+    def _forward_client(self, client: socket.socket):
+        """Transmet les lignes d'un client au serveur, jusqu'à sa déconnexion ou une coupure injectée."""
+        reader = LineReader(client)
+        received = 0
+        while True:
+            try:
+                line = reader.read_line() + b'\n'
+            except (ConnectionError, OSError):
+                break
+            received += 1
+            drop = self.drop_every and received % self.drop_every == 0
+            if not drop or self._random.random() < 0.5:
+                with self._lock:
+                    self._outstanding.append(client)
+                self._server.sendall(line)
+            if drop:
+                self.drops += 1
+                break
+        with self._lock:
+            if self._client is client:
+                self._client = None
+        client.close()
+
+    def serve(self):
+        """
+        Relaie la partie : se connecte au serveur puis accepte les connexions successives du client.
+        """
+        self._server = socket.create_connection(self.upstream)
+        self._server.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        threading.Thread(target=self._forward_server, daemon=True).start()
+        try:
+            while True:
+                client, _ = self._listener.accept()
+                client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with self._lock:
+                    if self._finished:
+                        client.close()
+                        break
+                    self.connections += 1
+                    self._client = client
+                    prompts, self._prompts = self._prompts, []
+                    # Remis sous le verrou : le serveur ne peut rien envoyer avant ces messages
+                    for line in prompts:
+                        client.sendall(line)
+                self._forward_client(client)
+        except OSError:
+            pass
+        finally:
+            self._server.close()
+        Logger.info(f"Relais : {self.connections} connexions, {self.drops} coupures, "
+                    f"{self.slow_replies} réponses retardées, {self.idle_gaps} silences")
+
+    def start(self) -> threading.Thread:
+        """
+        Lance le relais dans un thread démon.
+
+        Returns:
+            threading.Thread: Le thread du relais
+        """
+        self._thread = threading.Thread(target=self.serve, daemon=True)
+        self._thread.start()
+        return self._thread
@@ -0,0 +1,163 @@
+"""
+Module contenant la partie jouée par le serveur local.
+Traduit le protocole texte vu par les clients en opérations du GameEngine.
+
+Règles implémentées (déduites du protocole et de game_client.log) :
+    - Une partie dure NB_TOURS tours de NB_SOUS_TOURS sous-tours ; à chaque sous-tour,
+      chaque joueur vivant reçoit DEBUT_TOUR|tour|sous_tour et joue une fois.
+    - Le joueur peut envoyer autant de demandes (MOI, JOUEURS, MONSTRES, PIOCHES, DEGATS)
+      et de UTILISER qu'il veut ; PIOCHER ou ATTAQUER termine son tour.
+    - Six pioches : les trois premières sont positives (DEFENSE, ATTAQUE, SAVOIR),
+      les trois suivantes négatives. Une pioche prise est remplacée par une nouvelle
+      carte du même type et du même signe.
+    - Une carte piochée va dans le deck du joueur ; une carte négative va dans le deck du
+      joueur ciblé par le malus s'il est donné, sinon dans celui du joueur qui pioche.
+      Sa valeur est multipliée par 2 si le deck contient déjà plus de 8 cartes de ce type,
+      par 1.5 s'il en contient au moins 5 (comme le suppose Deck.add_card).
+    - UTILISER|TYPE ajoute la somme du deck de ce type au score correspondant et vide ce deck.
+    - ATTAQUER|n inflige tout le score d'attaque au monstre n (le score d'attaque est consommé) ;
+      le joueur qui l'achève gagne son savoir.
+    - À la fin de chaque tour, chaque joueur subit DEGATS : la part qui dépasse son score de défense
+      est retirée de sa vie. Un joueur à 0 de vie est mort et ne joue plus.
+      Les monstres réapparaissent, plus forts, au tour suivant.
+    - Le classement final se fait au score de savoir, morts compris.
+"""
+from typing import Generator, List, Optional, Tuple
+
+from ..models.pioche import TypeCarte
+from ..simulation.engine import GameEngine, GameRules, TYPES_CARTE
+
+
+# Événements du protocole produits par LocalGame.protocol
+SEND = 0
+RECV = 1
+
+# Un événement du protocole : (SEND ou RECV, numéro du joueur, message à envoyer ou None)
+ProtocolEvent = Tuple[int, int, Optional[str]]
+
+
+class LocalGame:
+    """
+    Partie déterministe du serveur local.
+    Deux parties créées avec la même graine et recevant les mêmes commandes évoluent à l'identique.
+    """
+
+    def __init__(self, nb_joueurs: int = 4, seed: int = 0, rules: Optional[GameRules] = None):
+        """
+        Initialise une partie.
+
+        Args:
+            nb_joueurs: Nombre de joueurs
+            seed: Graine du générateur aléatoire
+            rules: Règles à appliquer (par défaut GameRules)
+        """
+        self.engine = GameEngine(nb_joueurs, seed, rules)
+        self.rules = self.engine.rules
+        self.names = [f"Joueur{index}" for index in range(nb_joueurs)]
+
+    def ranking(self) -> List[int]:
+        """
+        Renvoie les numéros des joueurs, du meilleur au moins bon score de savoir.
+
+        Returns:
+            List[int]: Le classement
+        """
+        return self.engine.ranking()
+
+    def _joueur_response(self, index: int) -> str:
+        """Renvoie les statistiques d'un joueur au format de la réponse MOI."""
+        engine = self.engine
+        return f"{engine.vie[index]}|{engine.defense[index]}|{engine.attaque[index]}|{engine.savoir[index]}"
+
+    # ===== PROTOCOLE =====
+
+    def handle(self, index: int, line: str) -> Tuple[str, bool]:
+        """
+        Traite une commande envoyée par un joueur pendant son tour.
+
+        Args:
+            index: Numéro du joueur
+            line: La commande reçue
+
+        Returns:
+            Tuple[str, bool]: La réponse à envoyer et True si la commande termine le tour
+        """
+        engine = self.engine
+        parts = line.strip().split('|')
+        command = parts[0]
+
+        if command == "MOI":
+            return self._joueur_response(index), False
+        if command == "JOUEURS":
+            return "|".join(self._joueur_response(player) for player in range(engine.nb_joueurs)), False
+        if command == "MONSTRES":
+            return "|".join(f"{vie}|{gain}" for vie, gain in zip(engine.monstres_vie, engine.monstres_gain)), False
+        if command == "PIOCHES":
+            return "|".join(f"{TYPES_CARTE[type_index].value}|{valeur}"
+                            for type_index, valeur in zip(engine.pioches_type, engine.pioches_valeur)), False
+        if command == "DEGATS":
+            return str(engine.degats()), False
+
+        try:
+            if command == "PIOCHER" and len(parts) in (2, 3):
+                malus = int(parts[2]) if len(parts) == 3 else None
+                if engine.piocher(index, int(parts[1]), malus):
+                    return "OK", True
+            elif command == "UTILISER" and len(parts) == 2:
+                if engine.utiliser(index, TypeCarte(parts[1])):
+                    return "OK", False
+            elif command == "ATTAQUER" and len(parts) == 2:
+                if engine.attaquer(index, int(parts[1])):
+                    return "OK", True
+            else:
+                return f"NOK|Commande inconnue : {line.strip()}", False
+        except ValueError:
+            pass
+        return f"NOK|Problème avec le(s) argument(s) de la commande {command}", False
+
+    def protocol(self, clients: List[int]) -> Generator[ProtocolEvent, Optional[str], None]:
+        """
+        Déroule une partie complète, vue par les joueurs de `clients`.
+        Produit des événements (SEND, joueur, message) pour les messages à envoyer et
+        (RECV, joueur, None) quand une ligne du joueur est attendue ; la ligne est alors
+        transmise par generator.send(). Une ligne None signifie que le joueur n'a pas répondu.
+
+        Args:
+            clients: Numéros des joueurs tenus par des clients
+
+        Yields:
+            ProtocolEvent: Les événements du protocole
+        """
+        engine = self.engine
+        for index in clients:
+            yield (SEND, index, "NOM_EQUIPE")
+            name = yield (RECV, index, None)
+            if name is None:
+                engine.kill(index)
+                continue
+            self.names[index] = name.strip()
+            yield (SEND, index, f"Bonjour {self.names[index]} vous êtes l'équipe |{index}")
+
+        engine.start()
+        while not engine.is_over():
+            index = engine.joueur_courant
+            if index not in clients:
+                engine.play_house_turn(index)
+                engine.advance()
+                continue
+
+            yield (SEND, index, f"DEBUT_TOUR|{engine.tour}|{engine.sous_tour}")
+            for _ in range(self.rules.MAX_COMMANDES_PAR_TOUR):
+                line = yield (RECV, index, None)
+                if line is None:
+                    engine.kill(index)
+                    yield (SEND, index, "Temps de réponse trop long, joueur mort")
+                    break
+                reply, turn_over = self.handle(index, line)
+                yield (SEND, index, reply)
+                if turn_over:
+                    break
+            engine.advance()
+
+        for index in clients:
+            yield (SEND, index, "FIN")
@@ -0,0 +1,33 @@
+"""
+Module contenant des raccourcis pour jouer une partie complète contre le serveur local.
+"""
+from typing import Optional
+
+from ..ai_client import AIClient
+from ..session import GameSession
+from ..strategy import Strategy
+from ..simulation.engine import GameRules
+from .game import LocalGame
+from .transport import MemoryConnection
+
+
+def play_memory_game(seed: int = 0, nb_joueurs: int = 4, player: int = 0,
+                     strategy: Optional[Strategy] = None, rules: Optional[GameRules] = None) -> LocalGame:
+    """
+    Joue une partie complète en mémoire : un AIClient tient la place `player`,
+    les autres places sont jouées par le serveur.
+
+    Args:
+        seed: Graine de la partie
+        nb_joueurs: Nombre de joueurs
+        player: Place tenue par le client
+        strategy: Stratégie du client (par défaut Strategy)
+        rules: Règles de la partie (par défaut GameRules)
+
+    Returns:
+        LocalGame: La partie terminée, pour en lire le classement
+    """
+    game = LocalGame(nb_joueurs, seed, rules)
+    session = GameSession(connection=MemoryConnection(game, player), strategy=strategy)
+    AIClient(session).run_game_loop()
+    return game
@@ -0,0 +1,197 @@
+"""
+Module contenant les transports du serveur local : TCP et en mémoire.
+"""
+import socket
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from ..utils.line_reader import LineReader
+from ..utils.logger import Logger
+from .game import LocalGame, SEND
+
+
+class MemoryConnection:
+    """
+    Connexion en mémoire vers une LocalGame, sans socket ni thread.
+    Offre la même interface que Connection ; le serveur avance de façon synchrone
+    chaque fois que le client envoie une commande ou attend un message.
+    """
+
+    def __init__(self, game: LocalGame, player: int = 0):
+        """
+        Initialise la connexion et démarre la partie.
+
+        Args:
+            game: La partie à jouer
+            player: Numéro du joueur tenu par ce client ; les autres sont joués par le serveur
+        """
+        self.game = game
+        self.player = player
+        self._inbox: Deque[str] = deque()
+        self._outbox: Deque[str] = deque()
+        self._protocol = game.protocol([player])
+        self._event = next(self._protocol, None)
+
+    def _advance(self, line: Optional[str]):
+        """Fait avancer le protocole d'un pas."""
+        try:
+            self._event = self._protocol.send(line)
+        except StopIteration:
+            self._event = None
+
+    def _pump(self):
+        """Fait avancer le protocole tant qu'il n'attend pas une ligne encore non envoyée."""
+        while self._event is not None:
+            kind, _, message = self._event
+            if kind == SEND:
+                self._outbox.append(message)
+                self._advance(None)
+            elif self._inbox:
+                self._advance(self._inbox.popleft())
+            else:
+                break
+
+    def receive_message(self) -> str:
+        """
+        Reçoit le prochain message du serveur.
+
+        Returns:
+            str: Le message reçu
+        """
+        if not self._outbox:
+            self._pump()
+        if not self._outbox:
+            raise ConnectionError("Connexion fermée par le serveur")
+        return self._outbox.popleft()
+
+    def receive_messages(self, count: int) -> List[str]:
+        """
+        Reçoit exactement `count` messages du serveur.
+
+        Args:
+            count: Nombre de messages attendus
+
+        Returns:
+            List[str]: Les messages reçus
+        """
+        return [self.receive_message() for _ in range(count)]
+
+    def receive_pending(self) -> List[str]:
+        """
+        Renvoie les messages déjà produits par le serveur.
+
+        Returns:
+            List[str]: Les messages en attente
+        """
+        messages = list(self._outbox)
+        self._outbox.clear()
+        return messages
+
+    def send_message(self, message: str):
+        """
+        Envoie un message au serveur.
+
+        Args:
+            message: Le message à envoyer
+        """
+        self._inbox.append(message)
+        self._pump()
+
+    def send_messages(self, messages: List[str]):
+        """
+        Envoie plusieurs messages au serveur.
+
+        Args:
+            messages: Les messages à envoyer, dans l'ordre
+        """
+        self._inbox.extend(messages)
+        self._pump()
+
+    def stop(self):
+        """
+        Ferme la connexion.
+        """
+        self._protocol.close()
+        self._event = None
+
+
+class LocalServer:
+    """
+    Serveur TCP local : attend `nb_clients` connexions puis joue une LocalGame.
+    Les places non occupées par un client sont jouées par le serveur.
+    """
+
+    def __init__(self, game: LocalGame, nb_clients: int = 1, host: str = "localhost", port: int = 0,
+                 timeout: Optional[float] = 30):
+        """
+        Initialise le serveur et ouvre le socket d'écoute.
+
+        Args:
+            game: La partie à jouer
+            nb_clients: Nombre de clients attendus (ils prennent les places 0 à nb_clients - 1)
+            host: Adresse d'écoute
+            port: Port d'écoute (0 pour un port libre choisi par le système)
+            timeout: Délai de réponse maximal d'un client, en secondes
+        """
+        self.game = game
+        self.nb_clients = nb_clients
+        self.timeout = timeout
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((host, port))
+        self._listener.listen(nb_clients)
+        self.address = self._listener.getsockname()
+        self._thread: Optional[threading.Thread] = None
+
+    def _accept_clients(self) -> Dict[int, socket.socket]:
+        """Attend la connexion de tous les clients."""
+        clients = {}
+        for index in range(self.nb_clients):
+            client, address = self._listener.accept()
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client.settimeout(self.timeout)
+            clients[index] = client
+            Logger.info(f"Serveur local : joueur {index} connecté depuis {address}")
+        return clients
+
+    def serve(self):
+        """
+        Accepte les clients et joue la partie jusqu'au bout.
+        """
+        clients = self._accept_clients()
+        readers = {index: LineReader(client) for index, client in clients.items()}
+        protocol = self.game.protocol(list(clients))
+        line = None
+        try:
+            while True:
+                kind, index, message = protocol.send(line)
+                line = None
+                if kind == SEND:
+                    try:
+                        clients[index].sendall((message + '\n').encode('utf-8'))
+                    except OSError:
+                        self.game.engine.kill(index)
+                    continue
+                try:
+                    line = readers[index].read_line().decode('utf-8', errors='replace')
+                except OSError:
+                    line = None
+        except StopIteration:
+            pass
+        finally:
+            for client in clients.values():
+                client.close()
+            self._listener.close()
+        Logger.info(f"Serveur local : partie terminée, classement {self.game.ranking()}")
+
+    def start(self) -> threading.Thread:
+        """
+        Lance le serveur dans un thread démon.
+
+        Returns:
+            threading.Thread: Le thread du serveur
+        """
+        self._thread = threading.Thread(target=self.serve, daemon=True)
+        self._thread.start()
+        return self._thread
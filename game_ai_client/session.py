@@ -0,0 +1,81 @@
+"""
+Module de session de jeu pour le client IA.
+Regroupe tout l'état propre à une partie, pour pouvoir en jouer plusieurs dans un même processus.
+"""
+from typing import TYPE_CHECKING, List, Optional
+
+from .connection import Connection
+from .supervisor import SupervisedConnection
+from .utils.config import Config
+from .utils.action import Action
+from .utils.latency import LatencyStats
+from .models.deck import Deck
+from .strategy import Strategy
+from .scoring.params import StrategyParams
+
+# La recherche (multiprocessing) et l'enregistrement ne sont importés que si la configuration
+# les demande, pour que le démarrage d'un client par défaut reste rapide
+if TYPE_CHECKING:
+    from .recording.recorder import MatchRecorder
+
+
+class GameSession:
+    """
+    Session de jeu : possède sa propre configuration, sa connexion, son Action, son deck et sa stratégie.
+    Plusieurs sessions peuvent tourner côte à côte dans des threads, des processus ou une boucle asyncio.
+    """
+
+    def __init__(self, config: Optional[Config] = None, connection: Optional[Connection] = None,
+                 strategy: Optional[Strategy] = None, team_name: str = "BUTiChat",
+                 recorder: Optional['MatchRecorder'] = None):
+        """
+        Initialise la session.
+
+        Args:
+            config: Configuration de la session (par défaut une nouvelle instance de Config)
+            connection: Connexion à utiliser (par défaut une SupervisedConnection vers config)
+            strategy: Stratégie de décision (par défaut celle choisie par config.GAME_SETTINGS["strategy"])
+            team_name: Nom d'équipe envoyé en réponse à NOM_EQUIPE
+            recorder: Enregistreur de la partie (par défaut selon config.GAME_SETTINGS["record_file"])
+        """
+        self.config = config if config is not None else Config()
+        connection = connection if connection is not None else SupervisedConnection(self.config)
+        record_file = self.config.GAME_SETTINGS.get("record_file")
+        if recorder is None and record_file:
+            from .recording.recorder import MatchRecorder
+            recorder = MatchRecorder(record_file)
+        self.recorder = recorder
+        if recorder is not None:
+            from .recording.recorder import RecordingConnection
+            connection = RecordingConnection(connection, recorder)
+        self.connection = connection
+        self.action = Action(self.connection, cache=self.config.GAME_SETTINGS.get("turn_cache", True))
+        # Après une reconnexion, l'état du tour est redemandé au serveur plutôt que servi par le cache
+        on_reconnect = getattr(self.connection, "on_reconnect", None)
+        if on_reconnect is not None:
+            on_reconnect(self.action.invalidate)
+        self.deck = Deck()
+        self.latency = LatencyStats(self.config.GAME_SETTINGS.get("turn_deadline"))
+        self.strategy = strategy if strategy is not None else self._create_strategy()
+        self.team_name = team_name
+        self.team_number: Optional[int] = None
+        self.game_state: List[str] = []
+
+    def _create_strategy(self) -> Strategy:
+        """
+        Crée la stratégie demandée par la configuration.
+
+        Returns:
+            Strategy: La stratégie de la session
+        """
+        settings = self.config.GAME_SETTINGS
+        params = StrategyParams.load(settings["profile"]) if settings.get("profile") else None
+        policy = Strategy(settings.get("scoring_cache_size", 0), params)
+        if settings.get("strategy") == "montecarlo":
+            from .simulation.search import MonteCarloStrategy
+            from .simulation.parallel import ParallelMonteCarloStrategy
+            if settings.get("search_workers"):
+                return ParallelMonteCarloStrategy(budget=settings["decision_budget"], policy=policy,
+                                                  workers=settings["search_workers"])
+            return MonteCarloStrategy(budget=settings["decision_budget"], policy=policy)
+        return policy
@@ -0,0 +1,9 @@
+"""
+Moteur de simulation du jeu pour l'auto-apprentissage et la recherche.
+"""
+from .engine import GameEngine, GameRules
+from .selfplay import play_game
+from .search import MonteCarloStrategy
+from .parallel import ParallelMonteCarloStrategy
+
+__all__ = ['GameEngine', 'GameRules', 'MonteCarloStrategy', 'ParallelMonteCarloStrategy', 'play_game']
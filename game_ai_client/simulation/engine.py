@@ -0,0 +1,473 @@
+"""
+Module contenant le moteur de simulation du jeu.
+L'état d'une partie est stocké dans des listes d'entiers parallèles pour être copié
+très rapidement (recherche, auto-apprentissage), sans socket ni formatage de texte.
+Les règles sont décrites dans le module game_ai_client.server.game.
+"""
+import random
+from typing import Any, List, Optional, Tuple
+
+from ..models.deck import Deck
+from ..models.joueur import Joueur
+from ..models.monstre import Monstre
+from ..models.pioche import Pioche, TypeCarte
+from ..models.rules import GameRules
+from ..models.turn_state import TurnState
+from ..utils.action import CommandType
+
+
+# Ordre des types de carte dans les pioches et les tableaux du moteur
+TYPES_CARTE = [TypeCarte.DEFENSE, TypeCarte.ATTAQUE, TypeCarte.SAVOIR]
+DEFENSE, ATTAQUE, SAVOIR = range(len(TYPES_CARTE))
+INDEX_TYPE = {type_carte: index for index, type_carte in enumerate(TYPES_CARTE)}
+NB_TYPES = len(TYPES_CARTE)
+NB_PIOCHES = 2 * NB_TYPES
+
+
+class GameEngine:
+    """
+    Moteur de jeu en mémoire, à état compact.
+    Les decks ne sont stockés que sous forme de nombre de cartes et de somme des valeurs par type,
+    ce qui suffit aux règles. Le tableau deck_counts (et deck_sums) est indexé par
+    joueur * NB_TYPES + type. nb_coups compte les tours de joueur déjà joués.
+    """
+    __slots__ = (
+        'rules', 'random', 'nb_joueurs', 'tour', 'sous_tour', 'joueur_courant', 'nb_coups',
+        'vie', 'defense', 'attaque', 'savoir', 'deck_counts', 'deck_sums',
+        'monstres_vie', 'monstres_gain', 'pioches_type', 'pioches_valeur',
+    )
+
+    def __init__(self, nb_joueurs: int = 4, seed: Optional[int] = 0, rules: Optional[GameRules] = None):
+        """
+        Initialise une partie.
+
+        Args:
+            nb_joueurs: Nombre de joueurs
+            seed: Graine du générateur aléatoire
+            rules: Règles à appliquer (par défaut GameRules)
+        """
+        self.rules = rules if rules is not None else GameRules()
+        self.random = random.Random(seed)
+        self.nb_joueurs = nb_joueurs
+        self.tour = 1
+        self.sous_tour = 0
+        self.joueur_courant = 0
+        self.nb_coups = 0
+        self.vie = [self.rules.VIE_INITIALE] * nb_joueurs
+        self.defense = [0] * nb_joueurs
+        self.attaque = [0] * nb_joueurs
+        self.savoir = [0] * nb_joueurs
+        self.deck_counts = [0] * (nb_joueurs * NB_TYPES)
+        self.deck_sums = [0] * (nb_joueurs * NB_TYPES)
+        self.monstres_vie: List[int] = []
+        self.monstres_gain: List[int] = []
+        self._reset_monstres()
+        self.pioches_type = [index % NB_TYPES for index in range(NB_PIOCHES)]
+        self.pioches_valeur = [self._nouvelle_valeur(index) for index in range(NB_PIOCHES)]
+
+    @classmethod
+    def from_turn_state(cls, state: TurnState, deck: Deck, player: int, seed: Optional[int] = None,
+                        rules: Optional[GameRules] = None) -> 'GameEngine':
+        """
+        Reconstruit une partie à partir de l'état observé par un client au début de son tour.
+        Les decks adverses ne sont pas visibles et sont considérés vides.
+
+        Args:
+            state: État du tour observé
+            deck: Deck du joueur
+            player: Numéro du joueur dont c'est le tour
+            seed: Graine du générateur des cartes à venir
+            rules: Règles à appliquer (par défaut GameRules)
+
+        Returns:
+            GameEngine: La partie, au tour du joueur
+        """
+        engine = cls.__new__(cls)
+        engine.rules = rules if rules is not None else GameRules()
+        engine.random = random.Random(seed)
+        engine.nb_joueurs = max(len(state.joueurs), player + 1)
+        engine.tour = state.tour
+        engine.sous_tour = state.sous_tour
+        engine.joueur_courant = player
+        engine.nb_coups = 0
+        engine.vie = [0] * engine.nb_joueurs
+        engine.defense = [0] * engine.nb_joueurs
+        engine.attaque = [0] * engine.nb_joueurs
+        engine.savoir = [0] * engine.nb_joueurs
+        for position, joueur in enumerate(state.joueurs):
+            index = joueur.index if joueur.index is not None else position
+            engine.vie[index] = joueur.vie
+            engine.defense[index] = joueur.score_defense
+            engine.attaque[index] = joueur.score_attaque
+            engine.savoir[index] = joueur.score_savoir
+        me = state.moi
+        engine.vie[player] = me.vie
+        engine.defense[player] = me.score_defense
+        engine.attaque[player] = me.score_attaque
+        engine.savoir[player] = me.score_savoir
+        engine.deck_counts = [0] * (engine.nb_joueurs * NB_TYPES)
+        engine.deck_sums = [0] * (engine.nb_joueurs * NB_TYPES)
+        for type_index, type_carte in enumerate(TYPES_CARTE):
+            engine.deck_counts[player * NB_TYPES + type_index] = deck.count_cards_by_type(type_carte)
+            engine.deck_sums[player * NB_TYPES + type_index] = deck.sum_values_by_type(type_carte)
+        engine.monstres_vie = [monstre.vie for monstre in state.monstres]
+        engine.monstres_gain = [monstre.gain_savoir for monstre in state.monstres]
+        engine.pioches_type = [INDEX_TYPE[pioche.type_carte] for pioche in state.pioches]
+        engine.pioches_valeur = [pioche.valeur for pioche in state.pioches]
+        return engine
+
+    def clone(self, seed: Optional[int] = None) -> 'GameEngine':
+        """
+        Copie l'état de la partie.
+
+        Args:
+            seed: Graine du générateur de la copie ; par défaut la copie reprend l'état exact
+                  du générateur et tirera donc les mêmes cartes que l'original
+
+        Returns:
+            GameEngine: Une copie indépendante
+        """
+        copy = GameEngine.__new__(GameEngine)
+        copy.rules = self.rules
+        if seed is None:
+            copy.random = random.Random()
+            copy.random.setstate(self.random.getstate())
+        else:
+            copy.random = random.Random(seed)
+        copy.nb_joueurs = self.nb_joueurs
+        copy.tour = self.tour
+        copy.sous_tour = self.sous_tour
+        copy.joueur_courant = self.joueur_courant
+        copy.nb_coups = self.nb_coups
+        copy.vie = self.vie[:]
+        copy.defense = self.defense[:]
+        copy.attaque = self.attaque[:]
+        copy.savoir = self.savoir[:]
+        copy.deck_counts = self.deck_counts[:]
+        copy.deck_sums = self.deck_sums[:]
+        copy.monstres_vie = self.monstres_vie[:]
+        copy.monstres_gain = self.monstres_gain[:]
+        copy.pioches_type = self.pioches_type[:]
+        copy.pioches_valeur = self.pioches_valeur[:]
+        return copy
+
+    def pack(self) -> Tuple:
+        """
+        Renvoie l'état de la partie sous forme de tuple d'entiers, compact à sérialiser
+        (envoi à un processus de recherche). Les règles et le générateur ne sont pas inclus.
+
+        Returns:
+            Tuple: L'état compact, relu par GameEngine.unpack
+        """
+        return (self.nb_joueurs, self.tour, self.sous_tour, self.joueur_courant, self.nb_coups,
+                tuple(self.vie), tuple(self.defense), tuple(self.attaque), tuple(self.savoir),
+                tuple(self.deck_counts), tuple(self.deck_sums), tuple(self.monstres_vie),
+                tuple(self.monstres_gain), tuple(self.pioches_type), tuple(self.pioches_valeur))
+
+    @classmethod
+    def unpack(cls, data: Tuple, seed: Optional[int] = None, rules: Optional[GameRules] = None) -> 'GameEngine':
+        """
+        Reconstruit une partie à partir de l'état produit par pack().
+
+        Args:
+            data: L'état compact
+            seed: Graine du générateur de la partie reconstruite
+            rules: Règles à appliquer (par défaut GameRules)
+
+        Returns:
+            GameEngine: La partie
+        """
+        engine = cls.__new__(cls)
+        engine.rules = rules if rules is not None else GameRules()
+        engine.random = random.Random(seed)
+        (engine.nb_joueurs, engine.tour, engine.sous_tour, engine.joueur_courant, engine.nb_coups,
+         vie, defense, attaque, savoir, deck_counts, deck_sums,
+         monstres_vie, monstres_gain, pioches_type, pioches_valeur) = data
+        engine.vie = list(vie)
+        engine.defense = list(defense)
+        engine.attaque = list(attaque)
+        engine.savoir = list(savoir)
+        engine.deck_counts = list(deck_counts)
+        engine.deck_sums = list(deck_sums)
+        engine.monstres_vie = list(monstres_vie)
+        engine.monstres_gain = list(monstres_gain)
+        engine.pioches_type = list(pioches_type)
+        engine.pioches_valeur = list(pioches_valeur)
+        return engine
+
+    # ===== ÉTAT =====
+
+    def _reset_monstres(self):
+        """Fait réapparaître les monstres avec leur vie maximale."""
+        rules = self.rules
+        vie = rules.VIE_MONSTRE_BASE + rules.VIE_MONSTRE_PALIER * ((self.tour - 1) // rules.TOURS_PAR_PALIER)
+        self.monstres_vie = [vie] * rules.NB_MONSTRES
+        self.monstres_gain = [vie * rules.MULTIPLICATEUR_SAVOIR_MONSTRE] * rules.NB_MONSTRES
+
+    def _nouvelle_valeur(self, expedition: int) -> int:
+        """Tire la valeur d'une nouvelle carte pour la pioche `expedition`."""
+        if expedition < NB_TYPES:
+            return self.random.randint(1, self.rules.VALEUR_POSITIVE_MAX)
+        return -(self.random.randint(1, self.rules.VALEUR_NEGATIVE_MAX) + self.rules.MALUS_PAR_TOUR * self.tour)
+
+    def degats(self) -> int:
+        """Dégâts infligés à la fin du tour courant."""
+        return self.rules.DEGATS_PAR_TOUR * self.tour
+
+    def is_over(self) -> bool:
+        """Indique si la partie est terminée."""
+        return self.tour > self.rules.NB_TOURS or max(self.vie) <= 0
+
+    def ranking(self) -> List[int]:
+        """
+        Renvoie les numéros des joueurs, du meilleur au moins bon score de savoir.
+
+        Returns:
+            List[int]: Le classement
+        """
+        return sorted(range(self.nb_joueurs), key=lambda index: self.savoir[index], reverse=True)
+
+    def kill(self, player: int):
+        """
+        Élimine un joueur (par exemple après un délai de réponse dépassé).
+
+        Args:
+            player: Numéro du joueur
+        """
+        self.vie[player] = 0
+
+    # ===== DÉROULEMENT =====
+
+    def _fin_du_tour(self):
+        """Applique les dégâts de fin de tour et prépare le tour suivant."""
+        degats = self.degats()
+        vie = self.vie
+        defense = self.defense
+        for player in range(self.nb_joueurs):
+            if vie[player] > 0:
+                vie[player] = max(vie[player] - max(degats - defense[player], 0), 0)
+        self.tour += 1
+        self.sous_tour = 0
+        self._reset_monstres()
+
+    def start(self):
+        """
+        Place le tour sur le premier joueur vivant (à appeler avant la boucle de jeu).
+        """
+        if self.vie[self.joueur_courant] <= 0:
+            self.advance()
+
+    def advance(self):
+        """
+        Passe au prochain joueur vivant, en changeant de sous-tour et de tour si nécessaire.
+        """
+        vie = self.vie
+        self.nb_coups += 1
+        while True:
+            self.joueur_courant += 1
+            if self.joueur_courant >= self.nb_joueurs:
+                self.joueur_courant = 0
+                self.sous_tour += 1
+                if self.sous_tour >= self.rules.NB_SOUS_TOURS:
+                    self._fin_du_tour()
+                    if self.is_over():
+                        return
+            if vie[self.joueur_courant] > 0:
+                return
+            if max(vie) <= 0:
+                return
+
+    # ===== ACTIONS =====
+
+    def piocher(self, player: int, expedition_number: int, malus_player_number: Optional[int] = None) -> bool:
+        """
+        Fait piocher une carte à un joueur.
+
+        Args:
+            player: Numéro du joueur qui pioche
+            expedition_number: Numéro de la pioche
+            malus_player_number: Numéro du joueur qui reçoit une carte négative (optionnel)
+
+        Returns:
+            bool: True si l'action est valide
+        """
+        if not 0 <= expedition_number < NB_PIOCHES:
+            return False
+        if malus_player_number is not None and not 0 <= malus_player_number < self.nb_joueurs:
+            return False
+
+        valeur = self.pioches_valeur[expedition_number]
+        target = malus_player_number if valeur < 0 and malus_player_number is not None else player
+        slot = target * NB_TYPES + self.pioches_type[expedition_number]
+        self.deck_sums[slot] += int(valeur * self.rules.multiplicateur_deck(self.deck_counts[slot]))
+        self.deck_counts[slot] += 1
+        self.pioches_valeur[expedition_number] = self._nouvelle_valeur(expedition_number)
+        return True
+
+    def utiliser(self, player: int, type_carte: TypeCarte) -> bool:
+        """
+        Fait utiliser à un joueur toutes ses cartes d'un type.
+
+        Args:
+            player: Numéro du joueur
+            type_carte: Type de carte à utiliser
+
+        Returns:
+            bool: True si l'action est valide
+        """
+        type_index = INDEX_TYPE[type_carte]
+        slot = player * NB_TYPES + type_index
+        total = self.deck_sums[slot]
+        self.deck_sums[slot] = 0
+        self.deck_counts[slot] = 0
+        if type_index == DEFENSE:
+            self.defense[player] += total
+        elif type_index == ATTAQUE:
+            self.attaque[player] += total
+        else:
+            self.savoir[player] += total
+        return True
+
+    def attaquer(self, player: int, monster_number: int) -> bool:
+        """
+        Fait attaquer un monstre par un joueur avec tout son score d'attaque.
+
+        Args:
+            player: Numéro du joueur
+            monster_number: Numéro du monstre
+
+        Returns:
+            bool: True si l'action est valide
+        """
+        if not 0 <= monster_number < len(self.monstres_vie) or self.monstres_vie[monster_number] <= 0:
+            return False
+
+        vie = self.monstres_vie[monster_number] - max(self.attaque[player], 0)
+        self.attaque[player] = 0
+        if vie <= 0:
+            vie = 0
+            self.savoir[player] += self.monstres_gain[monster_number]
+        self.monstres_vie[monster_number] = vie
+        return True
+
+    def execute(self, player: int, command: CommandType, args: List[Any] = None) -> Tuple[bool, bool]:
+        """
+        Exécute une commande produite par une Strategy.
+
+        Args:
+            player: Numéro du joueur
+            command: Type de commande (PIOCHER, UTILISER ou ATTAQUER)
+            args: Les arguments de la commande
+
+        Returns:
+            Tuple[bool, bool]: (commande valide, fin du tour du joueur)
+        """
+        args = args or []
+        if command == CommandType.PIOCHER:
+            ok = self.piocher(player, int(args[0]), args[1] if len(args) > 1 else None)
+            return ok, ok
+        if command == CommandType.ATTAQUER:
+            ok = self.attaquer(player, int(args[0]))
+            return ok, ok
+        if command == CommandType.UTILISER:
+            return self.utiliser(player, TypeCarte(args[0])), False
+        return False, False
+
+    def play_house_turn(self, player: int):
+        """
+        Joue le tour d'un joueur tenu par le moteur : une carte positive au hasard,
+        la défense utilisée au dernier sous-tour et le savoir au dernier tour.
+
+        Args:
+            player: Numéro du joueur
+        """
+        if self.sous_tour == self.rules.NB_SOUS_TOURS - 1:
+            self.utiliser(player, TypeCarte.DEFENSE)
+            if self.tour == self.rules.NB_TOURS:
+                self.utiliser(player, TypeCarte.SAVOIR)
+        self.piocher(player, self.random.randrange(NB_TYPES))
+
+    # ===== DEMANDES D'INFORMATIONS =====
+
+    def get_moi(self, player: int) -> Joueur:
+        """
+        Renvoie les statistiques d'un joueur, comme la réponse MOI.
+
+        Args:
+            player: Numéro du joueur
+
+        Returns:
+            Joueur: Les statistiques du joueur
+        """
+        return Joueur(self.vie[player], self.defense[player], self.attaque[player], self.savoir[player])
+
+    def get_joueurs(self) -> List[Joueur]:
+        """
+        Renvoie les statistiques de tous les joueurs, comme la réponse JOUEURS.
+
+        Returns:
+            List[Joueur]: Les joueurs, indexés
+        """
+        joueurs = []
+        for player in range(self.nb_joueurs):
+            joueur = self.get_moi(player)
+            joueur.set_index(player)
+            joueurs.append(joueur)
+        return joueurs
+
+    def get_monstres(self) -> List[Monstre]:
+        """
+        Renvoie les monstres, comme la réponse MONSTRES.
+
+        Returns:
+            List[Monstre]: Les monstres, indexés
+        """
+        monstres = []
+        for index, (vie, gain) in enumerate(zip(self.monstres_vie, self.monstres_gain)):
+            monstre = Monstre(vie, gain)
+            monstre.set_index(index)
+            monstres.append(monstre)
+        return monstres
+
+    def get_pioches(self) -> List[Pioche]:
+        """
+        Renvoie les pioches, comme la réponse PIOCHES.
+
+        Returns:
+            List[Pioche]: Les pioches, indexées
+        """
+        pioches = []
+        for index, (type_index, valeur) in enumerate(zip(self.pioches_type, self.pioches_valeur)):
+            pioche = Pioche(TYPES_CARTE[type_index], valeur)
+            pioche.set_index(index)
+            pioches.append(pioche)
+        return pioches
+
+    def get_degats(self) -> int:
+        """
+        Renvoie les dégâts de fin de tour, comme la réponse DEGATS.
+
+        Returns:
+            int: Les dégâts
+        """
+        return self.degats()
+
+    def snapshot(self, player: int) -> TurnState:
+        """
+        Renvoie l'état du tour vu par un joueur, comme Action.snapshot.
+
+        Args:
+            player: Numéro du joueur
+
+        Returns:
+            TurnState: L'état du jeu
+        """
+        return TurnState(
+            moi=self.get_moi(player),
+            joueurs=self.get_joueurs(),
+            monstres=self.get_monstres(),
+            pioches=self.get_pioches(),
+            degats=self.degats(),
+            tour=self.tour,
+            sous_tour=self.sous_tour
+        )
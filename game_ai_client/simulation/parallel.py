@@ -0,0 +1,191 @@
+"""
+Module contenant la recherche Monte Carlo répartie sur un pool de processus persistant.
+Les processus sont créés et préchauffés une seule fois ; à chaque tour, ils reçoivent l'état
+compact de la partie (GameEngine.pack) et le suivi des adversaires, et renvoient leurs sommes de valeurs
+avant l'échéance.
+
+L'échéance est transmise telle quelle : time.perf_counter est une horloge monotone commune à tous les
+processus de la machine (CLOCK_MONOTONIC sous Linux), pas un compteur propre à chaque processus.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import List, Optional, Tuple
+
+from ..models.deck import Deck
+from ..models.pioche import Pioche
+from ..scoring.opponents import OpponentTracker
+from ..strategy import Command, Strategy
+from ..utils.logger import Logger
+from .engine import GameEngine, GameRules, TYPES_CARTE
+from .search import MonteCarloStrategy
+
+
+# Marge réservée au retour des résultats des processus, en secondes
+RESULT_MARGIN = 0.002
+
+# Deck compact : les valeurs des cartes, par type dans l'ordre de TYPES_CARTE
+PackedDeck = Tuple[Tuple[int, ...], ...]
+
+# Stratégie du processus courant, créée par _init_worker
+_worker: Optional[MonteCarloStrategy] = None
+
+
+def pack_deck(deck: Deck) -> PackedDeck:
+    """
+    Renvoie le deck sous forme compacte.
+
+    Args:
+        deck: Le deck
+
+    Returns:
+        PackedDeck: Les valeurs des cartes, par type
+    """
+    return tuple(tuple(pioche.valeur for pioche in deck.collections[type_carte]) for type_carte in TYPES_CARTE)
+
+
+def unpack_deck(data: PackedDeck) -> Deck:
+    """
+    Reconstruit un deck à partir de sa forme compacte, sans réappliquer les multiplicateurs.
+
+    Args:
+        data: Les valeurs des cartes, par type
+
+    Returns:
+        Deck: Le deck
+    """
+    deck = Deck()
+    for type_carte, valeurs in zip(TYPES_CARTE, data):
+        deck.set_cards(type_carte, [Pioche(type_carte, valeur) for valeur in valeurs])
+    return deck
+
+
+def _init_worker(horizon: int, policy: Strategy, rules: Optional[GameRules], log_level: str):
+    """Prépare la stratégie d'un processus du pool."""
+    global _worker
+    Logger.set_level(log_level)
+    _worker = MonteCarloStrategy(horizon=horizon, policy=policy, rules=rules)
+
+
+def _ping() -> int:
+    """Tâche vide, utilisée pour démarrer les processus du pool."""
+    return os.getpid()
+
+
+def _search_task(packed: Tuple, deck: PackedDeck, player: int, candidates: List[List[Command]],
+                 seed: int, deadline: float, tracker: OpponentTracker) -> Tuple[List[float], List[int]]:
+    """
+    Évalue les candidats dans un processus du pool.
+
+    Args:
+        packed: État compact de la partie
+        deck: Deck compact du joueur
+        player: Numéro du joueur
+        candidates: Les candidats à évaluer
+        seed: Graine des simulations de ce processus
+        deadline: Échéance (time.perf_counter) du processus, même si la tâche démarre en retard
+        tracker: Suivi des adversaires de la politique, à jour au tour courant
+
+    Returns:
+        Tuple[List[float], List[int]]: Somme des valeurs et nombre de simulations, par candidat
+    """
+    # La politique du processus a été copiée à sa création : les victimes des cartes négatives
+    # simulées doivent être choisies avec le suivi du tour courant
+    policy = _worker.policy
+    policy.opponents = tracker
+    policy.malus.tracker = tracker
+    _worker.random.seed(seed)
+    root = GameEngine.unpack(packed, rules=_worker.rules)
+    return _worker.search(root, unpack_deck(deck), player, candidates, deadline)
+
+
+class ParallelMonteCarloStrategy(MonteCarloStrategy):
+    """
+    Recherche Monte Carlo dont les simulations sont réparties entre le processus courant
+    et un pool de processus persistant. Chaque processus évalue tous les candidats avec ses
+    propres graines ; les résultats arrivés avant l'échéance sont additionnés, les autres sont abandonnés.
+    """
+
+    def __init__(self, budget: float = 0.05, horizon: int = 16, policy: Optional[Strategy] = None,
+                 seed: Optional[int] = None, rules: Optional[GameRules] = None,
+                 workers: Optional[int] = None, log_level: str = "WARNING"):
+        """
+        Initialise la stratégie, crée le pool et attend que tous ses processus soient prêts.
+
+        Args:
+            budget: Temps de décision maximal par tour, en secondes
+            horizon: Nombre de tours du joueur simulés après l'action candidate
+            policy: Stratégie jouée pendant les simulations (par défaut Strategy)
+            seed: Graine du générateur des simulations
+            rules: Règles utilisées pour les simulations et par le suivi des adversaires de la politique
+                (par défaut GameRules)
+            workers: Nombre de processus du pool (par défaut un de moins que le nombre de cœurs)
+            log_level: Niveau de journalisation des processus
+        """
+        super().__init__(budget, horizon, policy, seed, rules)
+        self.workers = workers if workers is not None else max((os.cpu_count() or 1) - 1, 1)
+        # Résultats des processus additionnés, et abandonnés faute d'être arrivés avant l'échéance
+        self.merged_results = 0
+        self.late_results = 0
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                        initargs=(horizon, self.policy, rules, log_level))
+        self.warm_up()
+
+    def warm_up(self):
+        """
+        Démarre tous les processus du pool pour qu'aucun tour ne paie leur création.
+        """
+        wait([self.pool.submit(_ping) for _ in range(self.workers)])
+        Logger.info(f"Pool de recherche prêt : {self.workers} processus")
+
+    def search(self, root: GameEngine, deck: Deck, player: int, candidates: List[List[Command]],
+               deadline: float) -> Tuple[List[float], List[int]]:
+        """
+        Répartit les simulations entre le pool et le processus courant jusqu'à l'échéance.
+
+        Args:
+            root: Partie au début du tour, non modifiée
+            deck: Deck du joueur, non modifié
+            player: Numéro du joueur
+            candidates: Les candidats à évaluer
+            deadline: Échéance (time.perf_counter) de la recherche
+
+        Returns:
+            Tuple[List[float], List[int]]: Somme des valeurs et nombre de simulations, par candidat
+        """
+        worker_deadline = deadline - RESULT_MARGIN
+        if worker_deadline <= time.perf_counter():
+            return super().search(root, deck, player, candidates, deadline)
+
+        packed = root.pack()
+        packed_deck = pack_deck(deck)
+        tracker = self.policy.opponents
+        futures = [
+            self.pool.submit(_search_task, packed, packed_deck, player, candidates,
+                             self.random.getrandbits(32), worker_deadline, tracker)
+            for _ in range(self.workers)
+        ]
+        totals, counts = super().search(root, deck, player, candidates, worker_deadline)
+
+        done, late = wait(futures, timeout=max(deadline - time.perf_counter(), 0))
+        # Une tâche en retard s'arrête d'elle-même à l'échéance ; celles pas encore démarrées sont annulées
+        for future in late:
+            future.cancel()
+        self.late_results += len(late)
+        self.merged_results += len(done)
+        for future in done:
+            if future.exception() is not None:
+                Logger.warning(f"Recherche parallèle : {future.exception()}")
+                continue
+            worker_totals, worker_counts = future.result()
+            for index in range(len(candidates)):
+                totals[index] += worker_totals[index]
+                counts[index] += worker_counts[index]
+        return totals, counts
+
+    def close(self):
+        """
+        Arrête les processus du pool.
+        """
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        super().close()
@@ -0,0 +1,282 @@
+"""
+Module contenant la stratégie de recherche Monte Carlo.
+Chaque action candidate du tour est évaluée par des simulations de plusieurs tours sur le GameEngine,
+la Strategy heuristique (basée sur Scoring) servant de politique de simulation.
+"""
+import random
+import time
+from typing import List, Optional, Tuple
+
+from ..models.deck import Deck
+from ..models.pioche import Pioche, TypeCarte
+from ..models.turn_state import TurnState
+from ..strategy import Command, Strategy
+from ..utils.action import CommandType
+from ..utils.logger import Logger
+from .engine import GameEngine, GameRules, TYPES_CARTE, NB_TYPES, SAVOIR
+
+
+class MonteCarloStrategy(Strategy):
+    """
+    Stratégie de recherche à budget de temps fixe.
+    Les candidats (le choix de la Strategy heuristique, chaque pioche, une carte négative étant donnée à la
+    victime choisie par la politique, chaque UTILISER et chaque monstre)
+    sont simulés à tour de rôle avec les mêmes graines jusqu'à l'échéance (la fin du budget, ou celle
+    du tour fixée par le client si elle est plus proche) ; le candidat de meilleure
+    valeur moyenne est joué. Si le budget est épuisé avant toute simulation, le choix heuristique est joué.
+    """
+
+    def __init__(self, budget: float = 0.05, horizon: int = 16, policy: Optional[Strategy] = None,
+                 seed: Optional[int] = None, rules: Optional[GameRules] = None):
+        """
+        Initialise la stratégie.
+
+        Args:
+            budget: Temps de décision maximal par tour, en secondes
+            horizon: Nombre de tours du joueur simulés après l'action candidate
+            policy: Stratégie jouée pendant les simulations (par défaut Strategy)
+            seed: Graine du générateur des simulations
+            rules: Règles utilisées pour les simulations et par le suivi des adversaires de la politique
+                (par défaut GameRules)
+        """
+        super().__init__(scoring_cache_size=0, rules=rules)
+        self.budget = budget
+        self.horizon = horizon
+        self.policy = policy if policy is not None else Strategy()
+        if rules is not None:
+            # Les victimes des cartes négatives sont choisies avec la durée et les dégâts des simulations
+            self.policy.opponents.rules = rules
+        self.random = random.Random(seed)
+        self.rules = rules
+        self.rollouts = 0
+
+    def observe(self, state: TurnState, team_number: Optional[int]):
+        """
+        Transmet l'état observé à la politique, qui choisit les cibles des cartes négatives.
+
+        Args:
+            state: État du jeu au début du tour
+            team_number: Numéro de notre équipe
+        """
+        self.policy.observe(state, team_number)
+
+    def decide(self, state: TurnState, deck: Deck, team_number: Optional[int]) -> List[Command]:
+        """
+        Choisit les commandes à jouer pour le tour courant et met à jour le deck en conséquence.
+
+        Args:
+            state: État du jeu au début du tour
+            deck: Deck du joueur, modifié selon les cartes piochées et utilisées
+            team_number: Numéro de notre équipe
+
+        Returns:
+            List[Command]: Les commandes à envoyer, dans l'ordre
+        """
+        deadline = time.perf_counter() + self.budget
+        if self.deadline is not None:
+            deadline = min(deadline, self.deadline)
+        if team_number is None or state.moi.vie <= 0:
+            return self.policy.decide(state, deck, team_number)
+
+        root = GameEngine.from_turn_state(state, deck, team_number, rules=self.rules)
+        baseline = self.policy.decide(self._copy_state(state), deck.copy(), team_number)
+        candidates = self.candidates(state, deck, baseline)
+        totals, counts = self.search(root, deck, team_number, candidates, deadline)
+
+        best = 0
+        for index in range(len(candidates)):
+            if counts[index] and (not counts[best] or totals[index] / counts[index] > totals[best] / counts[best]):
+                best = index
+        self.rollouts += sum(counts)
+        Logger.debug(f"Monte Carlo : {sum(counts)} simulations, candidat {candidates[best]} "
+                     f"({totals[best] / max(counts[best], 1):.1f})")
+
+        return self.apply(deck, state.pioches, candidates[best])
+
+    # ===== CANDIDATS =====
+
+    def candidates(self, state: TurnState, deck: Deck, baseline: List[Command]) -> List[List[Command]]:
+        """
+        Énumère les suites de commandes envisagées pour le tour ; la première est le choix heuristique.
+        Les UTILISER imposés par l'heuristique (défense en fin de tour, savoir en fin de partie) sont gardés.
+
+        Args:
+            state: État du jeu au début du tour
+            deck: Deck du joueur
+            baseline: Commandes choisies par la politique heuristique
+
+        Returns:
+            List[List[Command]]: Les candidats, sans doublon
+        """
+        prefix = [command for command in baseline
+                  if command[0] == CommandType.UTILISER and command[1] != [TypeCarte.ATTAQUE.value]]
+        used = {args[0] for _, args in prefix}
+        ending = baseline[-1]
+        if ending[0] != CommandType.PIOCHER:
+            best = max(state.pioches, key=lambda pioche: pioche.valeur)
+            ending = (CommandType.PIOCHER, [best.index])
+
+        candidates = [baseline]
+        for pioche in state.pioches:
+            target = self.policy.malus.choose(pioche) if pioche.valeur < 0 else None
+            args = [pioche.index] if target is None else [pioche.index, target]
+            candidates.append(prefix + [(CommandType.PIOCHER, args)])
+        for type_carte in TYPES_CARTE:
+            if type_carte.value not in used and deck.count_cards_by_type(type_carte):
+                candidates.append([(CommandType.UTILISER, [type_carte.value])] + prefix + [ending])
+        if state.moi.score_attaque + deck.sum_values_by_type(TypeCarte.ATTAQUE) > 0:
+            for monstre in state.get_monstres_vivants():
+                candidates.append(prefix + [(CommandType.UTILISER, [TypeCarte.ATTAQUE.value]),
+                                            (CommandType.ATTAQUER, [monstre.index])])
+
+        unique = []
+        seen = set()
+        for commands in candidates:
+            key = tuple((command, tuple(args)) for command, args in commands)
+            if key not in seen:
+                seen.add(key)
+                unique.append(commands)
+        return unique
+
+    # ===== SIMULATION =====
+
+    def search(self, root: GameEngine, deck: Deck, player: int, candidates: List[List[Command]],
+               deadline: float) -> Tuple[List[float], List[int]]:
+        """
+        Simule les candidats à tour de rôle, avec une même graine par passe, jusqu'à l'échéance.
+
+        Args:
+            root: Partie au début du tour, non modifiée
+            deck: Deck du joueur, non modifié
+            player: Numéro du joueur
+            candidates: Les candidats à évaluer
+            deadline: Échéance (time.perf_counter) de la recherche
+
+        Returns:
+            Tuple[List[float], List[int]]: Somme des valeurs et nombre de simulations, par candidat
+        """
+        totals = [0.0] * len(candidates)
+        counts = [0] * len(candidates)
+        while True:
+            seed = self.random.getrandbits(32)
+            for index, commands in enumerate(candidates):
+                value = self.rollout(root, deck, player, commands, seed, deadline)
+                if value is None:
+                    return totals, counts
+                totals[index] += value
+                counts[index] += 1
+
+    def rollout(self, root: GameEngine, deck: Deck, player: int, commands: List[Command],
+                seed: int, deadline: float) -> Optional[float]:
+        """
+        Joue un candidat puis simule la suite de la partie sur `horizon` tours du joueur.
+        Les adversaires sont joués par le joueur du moteur.
+
+        Args:
+            root: Partie au début du tour, non modifiée
+            deck: Deck du joueur, non modifié
+            player: Numéro du joueur
+            commands: Commandes candidates pour le tour courant
+            seed: Graine des cartes tirées pendant la simulation
+            deadline: Échéance (time.perf_counter) au-delà de laquelle la simulation est abandonnée
+
+        Returns:
+            Optional[float]: La valeur de la position atteinte, ou None si l'échéance est dépassée
+        """
+        if time.perf_counter() >= deadline:
+            return None
+        engine = root.clone(seed)
+        rollout_deck = deck.copy()
+        self._play(engine, rollout_deck, player, commands)
+        engine.advance()
+
+        policy = self.policy
+        turns = 0
+        while not engine.is_over() and engine.vie[player] > 0:
+            current = engine.joueur_courant
+            if current == player:
+                if turns >= self.horizon:
+                    break
+                if time.perf_counter() >= deadline:
+                    return None
+                turns += 1
+                self._play(engine, None, player, policy.decide(engine.snapshot(player), rollout_deck, player))
+            else:
+                engine.play_house_turn(current)
+            engine.advance()
+        return self.evaluate(engine, player)
+
+    def evaluate(self, engine: GameEngine, player: int) -> float:
+        """
+        Évalue une position : savoir acquis ou encore utilisable, moins le meilleur savoir adverse.
+        Le savoir resté dans le deck d'un joueur mort est perdu.
+
+        Args:
+            engine: Partie simulée
+            player: Numéro du joueur
+
+        Returns:
+            float: La valeur de la position pour le joueur
+        """
+        savoir = engine.savoir[player]
+        if engine.vie[player] > 0:
+            savoir += engine.deck_sums[player * NB_TYPES + SAVOIR]
+        others = [engine.savoir[index] for index in range(engine.nb_joueurs) if index != player]
+        return savoir - max(others, default=0)
+
+    @staticmethod
+    def _play(engine: GameEngine, deck: Optional[Deck], player: int, commands: List[Command]):
+        """
+        Exécute des commandes sur le moteur jusqu'à la fin du tour.
+        Si `deck` est donné, il est mis à jour comme le ferait Strategy.decide.
+        """
+        for command, args in commands:
+            if deck is not None:
+                if command == CommandType.PIOCHER:
+                    expedition = int(args[0])
+                    if len(args) == 1 or engine.pioches_valeur[expedition] >= 0:
+                        deck.add_card(Pioche(TYPES_CARTE[engine.pioches_type[expedition]],
+                                             engine.pioches_valeur[expedition]))
+                elif command == CommandType.UTILISER:
+                    deck.remove_cards_by_type(TypeCarte(args[0]))
+            ok, turn_over = engine.execute(player, command, args)
+            if turn_over:
+                break
+
+    # ===== OUTILS =====
+
+    @staticmethod
+    def _copy_state(state: TurnState) -> TurnState:
+        """Copie l'état du tour avec des pioches neuves, que Deck.add_card peut modifier."""
+        pioches = [pioche.copy() for pioche in state.pioches]
+        return TurnState(state.moi, state.joueurs, state.monstres, pioches, state.degats,
+                         state.tour, state.sous_tour)
+
+    def apply(self, deck: Deck, pioches: List[Pioche], commands: List[Command]) -> List[Command]:
+        """
+        Met à jour le deck selon les commandes retenues, comme Strategy.decide.
+
+        Args:
+            deck: Deck du joueur
+            pioches: Pioches du tour
+            commands: Commandes retenues
+
+        Returns:
+            List[Command]: Les commandes, inchangées
+        """
+        for command, args in commands:
+            if command == CommandType.UTILISER:
+                deck.remove_cards_by_type(TypeCarte(args[0]))
+            elif command == CommandType.PIOCHER:
+                for pioche in pioches:
+                    if pioche.index == args[0]:
+                        if len(args) == 1 or pioche.valeur >= 0:
+                            deck.add_card(pioche)
+                        break
+        return commands
+
+    def close(self):
+        """
+        Ferme la politique des simulations, qui journalise son cache de scoring.
+        """
+        self.policy.close()
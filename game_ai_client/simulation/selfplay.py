@@ -0,0 +1,42 @@
+"""
+Module contenant la boucle d'auto-apprentissage sur le moteur de jeu, sans serveur.
+"""
+from typing import List, Optional
+
+from ..models.deck import Deck
+from ..strategy import Strategy
+from .engine import GameEngine, GameRules
+
+
+def play_game(strategies: List[Optional[Strategy]], seed: int = 0,
+              rules: Optional[GameRules] = None) -> GameEngine:
+    """
+    Joue une partie complète sur le moteur.
+    Chaque place est tenue par une Strategy (qui garde son propre Deck, comme un vrai client)
+    ou, si elle vaut None, par le joueur du moteur.
+
+    Args:
+        strategies: Une stratégie (ou None) par joueur
+        seed: Graine de la partie
+        rules: Règles de la partie (par défaut GameRules)
+
+    Returns:
+        GameEngine: La partie terminée, pour en lire le classement et les scores
+    """
+    engine = GameEngine(len(strategies), seed, rules)
+    decks = [Deck() for _ in strategies]
+    engine.start()
+    while not engine.is_over():
+        player = engine.joueur_courant
+        strategy = strategies[player]
+        if strategy is None:
+            engine.play_house_turn(player)
+        else:
+            state = engine.snapshot(player)
+            strategy.observe(state, player)
+            for command, args in strategy.decide(state, decks[player], player):
+                ok, turn_over = engine.execute(player, command, args)
+                if turn_over:
+                    break
+        engine.advance()
+    return engine
@@ -0,0 +1,198 @@
+"""
+Module de stratégie pour le client IA du jeu.
+Contient la logique de décision, indépendante du transport utilisé pour parler au serveur.
+"""
+from typing import Any, List, Optional, Tuple
+
+from .utils.action import CommandType
+from .utils.logger import Logger
+from .models import Deck, GameRules, TurnState, TypeCarte
+from .scoring.scoring import Scoring
+from .scoring.params import DEFAULT_PARAMS, StrategyParams
+from .scoring.cache import ScoringCache
+from .scoring.opponents import OpponentTracker
+from .scoring.malus import MalusTargeting
+
+
+# Une commande de jeu : (type de commande, arguments)
+Command = Tuple[CommandType, List[Any]]
+
+
+class Strategy:
+    """
+    Stratégie de jeu par défaut, basée sur le scoring heuristique.
+    Produit la liste des commandes à envoyer pour un tour, sans effectuer d'entrée/sortie.
+    """
+
+    def __init__(self, scoring_cache_size: int = 0, params: Optional[StrategyParams] = None,
+                 rules: Optional[GameRules] = None):
+        """
+        Initialise la stratégie.
+
+        Args:
+            scoring_cache_size: Nombre d'états dont les scores sont mémorisés (0 : sans cache).
+                La clé coûte environ un quart d'un Scoring : le cache n'est rentable qu'au-delà
+                d'environ 30 % de succès (voir benchmarks/bench_scoring_cache.py).
+            params: Paramètres du scoring et des règles de décision (par défaut DEFAULT_PARAMS)
+            rules: Règles de la partie, suivies par le suivi des adversaires (par défaut GameRules)
+        """
+        self.params = params if params is not None else DEFAULT_PARAMS
+        self.scoring_cache = ScoringCache(scoring_cache_size, self.params) if scoring_cache_size > 0 else None
+        # Échéance du tour en cours (time.perf_counter), fixée par le client ; None : sans échéance
+        self.deadline: Optional[float] = None
+        # Suivi des adversaires de la partie, alimenté par observe, et choix des victimes des cartes négatives
+        self.opponents = OpponentTracker(rules=rules)
+        self.malus = MalusTargeting(self.opponents)
+
+    def observe(self, state: TurnState, team_number: Optional[int]):
+        """
+        Enregistre l'état observé au début d'un vrai tour de jeu (pas d'un tour simulé), avant decide ou fallback.
+
+        Args:
+            state: État du jeu au début du tour
+            team_number: Numéro de notre équipe
+        """
+        self.opponents.observe(state, team_number)
+
+    def decide(self, state: TurnState, deck: Deck, team_number: Optional[int]) -> List[Command]:
+        """
+        Choisit les commandes à jouer pour le tour courant et met à jour le deck en conséquence.
+
+        Args:
+            state: État du jeu au début du tour
+            deck: Deck du joueur, modifié selon les cartes piochées et utilisées
+            team_number: Numéro de notre équipe
+
+        Returns:
+            List[Command]: Les commandes à envoyer, dans l'ordre
+        """
+        commands: List[Command] = []
+        params = self.params
+        me = state.moi
+        other_players = state.get_autres_joueurs(team_number)
+        monstres = state.get_monstres_vivants()
+        pioches = state.pioches
+        degats = state.degats
+        scoring = self.score(monstres, pioches, me, deck, degats, state.sous_tour + 1, other_players)
+
+        if state.tour == params.TOUR_FINAL and state.sous_tour == params.SOUS_TOUR_FINAL:
+            commands.append(self.utiliser(deck, TypeCarte.SAVOIR))
+
+        if (me.score_savoir + deck.sum_values_by_type(TypeCarte.SAVOIR) >= params.SEUIL_SAVOIR
+                and (state.sous_tour + 1) % params.CADENCE_SAVOIR == 0):
+            commands.append(self.utiliser(deck, TypeCarte.SAVOIR))
+
+        if state.sous_tour == params.SOUS_TOUR_DEFENSE:
+            commands.append(self.utiliser(deck, TypeCarte.DEFENSE))
+
+        Logger.debug("Vie: %s", me.vie)
+        Logger.debug("Score defense: %s", me.score_defense)
+        Logger.debug("Card defense values: %s", deck.sum_values_by_type(TypeCarte.DEFENSE))
+        Logger.debug("Degats: %s", degats)
+
+        if state.sous_tour == params.SOUS_TOUR_DEFENSE and me.vie + me.score_defense + deck.sum_values_by_type(TypeCarte.DEFENSE) <= degats:
+            commands.append(self.utiliser(deck, TypeCarte.SAVOIR))
+
+        if (state.sous_tour + 1) % params.CADENCE_ATTAQUE != 0:
+            commands.append(self.piocher(deck, scoring, pioches))
+
+        elif (deck.sum_values_by_type(TypeCarte.ATTAQUE) <= 0 and me.score_attaque <= 0) or len(monstres) == 0:
+            commands.append(self.piocher(deck, scoring, pioches))
+
+        else:
+            commands.append(self.utiliser(deck, TypeCarte.ATTAQUE))
+            monster = scoring.get_scored_monstres()[0]
+            for scored_monster in scoring.get_scored_monstres():
+                if scored_monster["score"] > monster["score"]:
+                    monster = scored_monster
+
+            commands.append((CommandType.ATTAQUER, [monster["index"]]))
+
+        return commands
+
+    def fallback(self, state: TurnState, deck: Deck) -> List[Command]:
+        """
+        Action de repli, jouée quand l'échéance du tour est dépassée avant la décision :
+        la commande valide la moins coûteuse à choisir, piocher la carte de plus grande valeur.
+        Si toutes les cartes sont négatives, elle est donnée à la victime choisie par self.malus, comme dans piocher.
+
+        Args:
+            state: État du jeu au début du tour
+            deck: Deck du joueur, modifié selon la carte piochée
+
+        Returns:
+            List[Command]: La commande PIOCHER
+        """
+        if not state.pioches:
+            return [(CommandType.PIOCHER, [0])]
+        best = max(state.pioches, key=lambda pioche: pioche.valeur)
+        if best.valeur < 0:
+            target = self.malus.choose(best)
+            if target is not None:
+                return [(CommandType.PIOCHER, [best.index, target])]
+        deck.add_card(best)
+        return [(CommandType.PIOCHER, [best.index])]
+
+    def score(self, monstres: list, cartes: list, me, deck: Deck, fdr: int, nb_tours: int, enemies: list) -> Scoring:
+        """
+        Calcule le scoring d'un état, en passant par le cache de la stratégie s'il est activé.
+
+        Args:
+            monstres, cartes, me, deck, fdr, nb_tours, enemies: Les arguments de Scoring
+
+        Returns:
+            Scoring: Le scoring de l'état
+        """
+        if self.scoring_cache is None:
+            return Scoring(monstres, cartes, me, deck, fdr, nb_tours, enemies, self.params)
+        return self.scoring_cache.get(monstres, cartes, me, deck, fdr, nb_tours, enemies)
+
+    def utiliser(self, deck: Deck, type_carte: TypeCarte) -> Command:
+        """
+        Prépare l'utilisation des cartes d'un type et les retire du deck.
+
+        Args:
+            deck: Deck du joueur
+            type_carte: Type de carte à utiliser
+
+        Returns:
+            Command: La commande UTILISER correspondante
+        """
+        deck.remove_cards_by_type(type_carte)
+        return (CommandType.UTILISER, [type_carte.value])
+
+    def piocher(self, deck: Deck, scoring: Scoring, pioches: list) -> Command:
+        """
+        Choisit la pioche de meilleur score et l'ajoute au deck.
+        Une carte négative est donnée à la victime choisie par self.malus, s'il y a un adversaire vivant.
+
+        Args:
+            deck: Deck du joueur
+            scoring: Scoring calculé pour le tour
+            pioches: Pioches disponibles
+
+        Returns:
+            Command: La commande PIOCHER correspondante
+        """
+        card = scoring.get_scored_cartes()[0]
+        for scored_carte in scoring.get_scored_cartes():
+            if scored_carte["score"] > card["score"]:
+                card = scored_carte
+
+        for p in pioches:
+            if p.index == card["index"]:
+                if p.valeur < 0:
+                    target = self.malus.choose(p)
+                    if target is not None:
+                        return (CommandType.PIOCHER, [card["index"], target])
+                deck.add_card(p)
+                break
+
+        return (CommandType.PIOCHER, [card["index"]])
+
+    def close(self):
+        """
+        Libère les ressources de la stratégie (processus, fichiers) à la fin de la partie.
+        """
+        if self.scoring_cache is not None:
+            Logger.info(f"Cache du scoring : {self.scoring_cache.stats()}")
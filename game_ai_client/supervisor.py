@@ -0,0 +1,307 @@
+"""
+Module de supervision de la connexion au serveur.
+Règle le socket (délai d'attente, TCP_NODELAY, keepalive), reconnecte avec un délai exponentiel
+et resynchronise le tour en cours après une coupure.
+"""
+import random
+import socket
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from .connection import Connection
+from .utils.action import CommandType
+from .utils.config import Config
+from .utils.logger import Logger
+
+
+# Demandes qui agissent sur la partie : elles ne sont jamais renvoyées sans savoir si le serveur les a appliquées
+ACTIONS = (CommandType.PIOCHER.value, CommandType.UTILISER.value, CommandType.ATTAQUER.value)
+
+# Messages envoyés par le serveur sans demande du client
+PROMPTS = (CommandType.DEBUT_TOUR.value, CommandType.FIN.value, "NOM_EQUIPE")
+
+# Demande sans effet envoyée après une coupure pour savoir si la dernière action a été appliquée
+PROBE = CommandType.MOI.value
+
+# Réponse donnée à une action dont l'acquittement est perdu et dont l'effet ne peut pas être vérifié
+LOST_ACK = "NOK|Acquittement perdu pendant une reconnexion"
+
+# Keepalive TCP : inactivité avant la première sonde, intervalle entre sondes et nombre de sondes (secondes)
+KEEPALIVE_IDLE = 10
+KEEPALIVE_INTERVAL = 5
+KEEPALIVE_COUNT = 3
+
+# Reprises successives sans qu'aucune ligne ne soit reçue du serveur avant d'abandonner la partie
+MAX_STALLED_RECOVERIES = 3
+
+
+class SupervisedConnection(Connection):
+    """
+    Connexion supervisée, avec l'interface de Connection.
+    Chaque demande envoyée reste en attente jusqu'à sa réponse. Après une coupure (erreur du socket,
+    fermeture ou délai dépassé), la connexion est rétablie jusqu'à GAME_SETTINGS["retry_attempts"] fois,
+    avec un délai doublé à chaque tentative, puis les demandes restées sans réponse sont reprises :
+    - les demandes d'état (MOI, JOUEURS...) sont renvoyées, ce qui reconstruit l'état du tour ;
+    - une action sans acquittement n'est renvoyée que si le serveur ne l'a pas appliquée ;
+      faute de pouvoir le vérifier, un UTILISER sans acquittement n'est jamais renvoyé (réponse LOST_ACK).
+    Les actions acquittées ne sont jamais renvoyées.
+
+    Le délai d'attente (GAME_SETTINGS["timeout"]) ne s'applique que si une demande attend sa réponse :
+    sans demande en attente, le serveur peut se taire longtemps sans être perdu (salle d'attente avant
+    le premier DEBUT_TOUR, attente de la FIN) et seul le keepalive TCP détecte sa disparition.
+    Après MAX_STALLED_RECOVERIES reprises successives sans aucune ligne reçue, la partie est abandonnée.
+
+    Pour savoir si PIOCHER ou ATTAQUER a été appliqué, la connexion envoie PROBE : le serveur ne lit un
+    joueur que pendant son tour, donc si l'action a terminé le tour, le DEBUT_TOUR suivant arrive avant la réponse
+    à PROBE ; sinon la réponse arrive tout de suite. Action n'envoie ses actions qu'une à une, en
+    attendant chaque acquittement : une action en attente est toujours la seule demande en attente.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        """
+        Initialise la connexion et se connecte au serveur, en réessayant si le serveur ne répond pas.
+
+        Args:
+            config: Configuration de la session (par défaut une nouvelle instance de Config)
+        """
+        config = config if config is not None else Config()
+        settings = config.GAME_SETTINGS
+        self.timeout: Optional[float] = settings.get("timeout")
+        self.retry_attempts: int = settings.get("retry_attempts", 3)
+        self.retry_delay: float = settings.get("retry_delay", 0.1)
+        self.retry_max_delay: float = settings.get("retry_max_delay", 2.0)
+        self.reconnections = 0
+        self.recovery_times: List[float] = []
+        self._outstanding: Deque[str] = deque()
+        self._inbox: Deque[str] = deque()
+        self._probes = 0
+        self._stalled = 0
+        self._listeners: List[Callable[[], None]] = []
+        super().__init__(config)
+
+    def on_reconnect(self, callback: Callable[[], None]):
+        """
+        Enregistre une fonction appelée après chaque reconnexion (par exemple pour vider un cache).
+
+        Args:
+            callback: La fonction, sans argument
+        """
+        self._listeners.append(callback)
+
+    def _backoff(self, attempt: int) -> float:
+        """Délai avant la tentative `attempt` (0 pour la première) : exponentiel, plafonné et aléatoire."""
+        delay = min(self.retry_delay * 2 ** attempt, self.retry_max_delay)
+        return delay * random.uniform(0.5, 1.0)
+
+    def _configure_socket(self):
+        """Règle le socket connecté : délai d'attente, envoi immédiat et keepalive."""
+        sock = self._client
+        sock.settimeout(self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, value in (("TCP_KEEPIDLE", KEEPALIVE_IDLE), ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+                              ("TCP_KEEPCNT", KEEPALIVE_COUNT)):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+
+    def _open(self):
+        """Ouvre une nouvelle connexion au serveur (une seule tentative)."""
+        super()._connect_to_server()
+        self._configure_socket()
+
+    def _close(self):
+        """Ferme le socket courant sans journaliser."""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except OSError:
+                pass
+        self._client = None
+        self._reader = None
+
+    def _connect_to_server(self):
+        """
+        Établit la connexion au serveur, en réessayant avec un délai exponentiel.
+        """
+        for attempt in range(self.retry_attempts + 1):
+            try:
+                self._open()
+                return
+            except ConnectionError:
+                self._close()
+                if attempt == self.retry_attempts:
+                    raise
+                time.sleep(self._backoff(attempt))
+
+    def _resync(self):
+        """Reprend les demandes restées sans réponse sur la nouvelle connexion."""
+        pending = list(self._outstanding)
+        if not pending:
+            return
+        if not pending[-1].startswith(ACTIONS):
+            super().send_messages(pending)
+            return
+        action = pending[-1]
+        if action.startswith(CommandType.UTILISER.value):
+            # UTILISER ne termine pas le tour : PROBE ne peut pas dire s'il a été appliqué,
+            # et le renvoyer pourrait utiliser une deuxième carte
+            Logger.warning("Reconnexion : %s sans acquittement, considérée comme refusée", action)
+            self._outstanding.clear()
+            self._inbox.append(LOST_ACK)
+            return
+        super().send_message(PROBE)
+        line = super().receive_message()
+        if line.startswith(PROMPTS):
+            # L'action a terminé le tour : seul son acquittement a été perdu. Le serveur a lu PROBE
+            # au début du tour suivant ; sa réponse, qui précède les suivantes, sera écartée
+            Logger.info("Reconnexion : %s déjà appliquée par le serveur", action)
+            self._outstanding.clear()
+            if not line.startswith(CommandType.FIN.value):
+                self._outstanding.append(PROBE)
+                self._probes = 1
+            self._inbox.extend(("OK", line))
+        else:
+            Logger.info("Reconnexion : %s renvoyée", action)
+            super().send_message(action)
+
+    def _recover(self, error: Exception):
+        """
+        Rétablit la connexion après une coupure et reprend les demandes en attente.
+
+        Args:
+            error: L'erreur qui a révélé la coupure
+
+        Raises:
+            ConnectionError: Si la connexion ne peut pas être rétablie
+        """
+        start = time.perf_counter()
+        Logger.warning(f"Connexion perdue ({error}), {len(self._outstanding)} demandes en attente")
+        self._stalled += 1
+        if self._stalled > MAX_STALLED_RECOVERIES:
+            self._close()
+            raise ConnectionError(f"Abandon après {MAX_STALLED_RECOVERIES} reprises sans réponse du serveur: {error}")
+        for attempt in range(self.retry_attempts):
+            self._close()
+            time.sleep(self._backoff(attempt))
+            try:
+                self._open()
+                self._resync()
+                break
+            except ConnectionError as e:
+                error = e
+        else:
+            self._close()
+            raise ConnectionError(f"Reconnexion impossible après {self.retry_attempts} tentatives: {error}")
+        self.reconnections += 1
+        self.recovery_times.append(time.perf_counter() - start)
+        Logger.info(f"Connexion rétablie en {self.recovery_times[-1] * 1000:.1f} ms")
+        for callback in self._listeners:
+            callback()
+
+    def _accept(self, lines: List[str]) -> List[str]:
+        """Retire des demandes en attente celles auxquelles les lignes reçues répondent, et écarte les réponses aux sondes."""
+        if lines:
+            self._stalled = 0
+        messages = []
+        for line in lines:
+            if self._outstanding:
+                self._outstanding.popleft()
+                if self._probes:
+                    self._probes -= 1
+                    continue
+            messages.append(line)
+        return messages
+
+    def _wait_for_replies(self, replies: bool):
+        """Applique le délai d'attente si une demande attend sa réponse, sinon attend sans limite."""
+        timeout = self.timeout if replies else None
+        client = self._client
+        if client is not None and client.gettimeout() != timeout:
+            client.settimeout(timeout)
+
+    def _read(self, count: int) -> List[str]:
+        """Renvoie exactement `count` messages, en se reconnectant si nécessaire."""
+        messages: List[str] = []
+        while len(messages) < count:
+            if self._inbox:
+                messages.append(self._inbox.popleft())
+                continue
+            try:
+                self._get_reader()
+                self._wait_for_replies(bool(self._outstanding))
+                # Les réponses aux sondes précèdent celles attendues par l'appelant
+                received = super().receive_messages(count - len(messages) + self._probes)
+            except ConnectionError as e:
+                self._recover(e)
+                continue
+            messages.extend(self._accept(received))
+        return messages
+
+    def receive_message(self) -> str:
+        """
+        Reçoit un message du serveur, en se reconnectant si nécessaire.
+
+        Returns:
+            str: Le message reçu
+        """
+        return self._read(1)[0]
+
+    def receive_messages(self, count: int) -> List[str]:
+        """
+        Reçoit exactement `count` messages du serveur, en se reconnectant si nécessaire.
+
+        Args:
+            count: Nombre de messages attendus
+
+        Returns:
+            List[str]: Les messages reçus
+        """
+        return self._read(count)
+
+    def receive_pending(self) -> List[str]:
+        """
+        Renvoie les messages déjà reçus et mis en file, sans attendre le serveur.
+
+        Returns:
+            List[str]: Les messages en attente (éventuellement vide)
+        """
+        messages = list(self._inbox)
+        self._inbox.clear()
+        return messages + self._accept(super().receive_pending())
+
+    def send_message(self, message: str):
+        """
+        Envoie un message au serveur ; après une coupure, il est repris avec les autres demandes en attente.
+
+        Args:
+            message: Le message à envoyer
+        """
+        self._outstanding.append(message)
+        try:
+            super().send_message(message)
+        except ConnectionError as e:
+            self._recover(e)
+
+    def send_messages(self, messages: List[str]):
+        """
+        Envoie plusieurs messages au serveur en un seul appel à sendall.
+
+        Args:
+            messages: Les messages à envoyer, dans l'ordre
+        """
+        self._outstanding.extend(messages)
+        try:
+            super().send_messages(messages)
+        except ConnectionError as e:
+            self._recover(e)
+
+    def stop(self):
+        """
+        Ferme la connexion avec le serveur.
+        """
+        self._outstanding.clear()
+        self._inbox.clear()
+        self._probes = 0
+        self._stalled = 0
+        super().stop()
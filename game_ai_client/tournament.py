@@ -0,0 +1,196 @@
+"""
+Module de tournoi en auto-apprentissage.
+Répartit des parties à graine fixe sur plusieurs processus et agrège les résultats par variante de stratégie.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .simulation import GameRules, MonteCarloStrategy, play_game
+from .strategy import Strategy
+from .utils.logger import Logger
+
+
+# Fabriques des variantes de stratégie, par nom. None désigne le joueur intégré au moteur.
+STRATEGIES: Dict[str, Callable[[], Optional[Strategy]]] = {
+    "default": Strategy,
+    "montecarlo": MonteCarloStrategy,
+    "house": lambda: None,
+}
+
+# Résultat d'une place dans une partie : (variante, savoir final, vie finale, part de victoire)
+SeatResult = Tuple[str, int, int, float]
+
+# Quantile de la loi normale pour les intervalles de confiance à 95 %
+Z_95 = 1.96
+
+
+def register_strategy(name: str, factory: Callable[[], Optional[Strategy]]):
+    """
+    Enregistre une variante de stratégie utilisable dans les tournois.
+    La fabrique doit être définie au niveau d'un module pour être disponible dans les processus fils.
+
+    Args:
+        name: Nom de la variante
+        factory: Fonction sans argument qui crée la stratégie (ou None pour le joueur du moteur)
+    """
+    STRATEGIES[name] = factory
+
+
+def play_seeded_game(variants: List[str], seed: int, rules: Optional[GameRules] = None) -> List[SeatResult]:
+    """
+    Joue une partie entre les variantes données.
+    Les places tournent avec la graine pour que personne ne joue toujours en premier.
+
+    Args:
+        variants: Noms des variantes, une par joueur
+        seed: Graine de la partie
+        rules: Règles de la partie (par défaut GameRules)
+
+    Returns:
+        List[SeatResult]: Le résultat de chaque place
+    """
+    offset = seed % len(variants)
+    seats = variants[offset:] + variants[:offset]
+    engine = play_game([STRATEGIES[name]() for name in seats], seed, rules)
+
+    best = max(engine.savoir)
+    winners = engine.savoir.count(best)
+    return [
+        (name, engine.savoir[index], engine.vie[index], 1 / winners if engine.savoir[index] == best else 0.0)
+        for index, name in enumerate(seats)
+    ]
+
+
+def _play_batch(variants: List[str], seeds: List[int], log_level: str) -> List[SeatResult]:
+    """
+    Joue un lot de parties dans un processus du pool.
+
+    Args:
+        variants: Noms des variantes
+        seeds: Graines des parties du lot
+        log_level: Niveau de journalisation du processus
+
+    Returns:
+        List[SeatResult]: Les résultats de toutes les places de toutes les parties
+    """
+    Logger.set_level(log_level)
+    results = []
+    for seed in seeds:
+        results.extend(play_seeded_game(variants, seed))
+    return results
+
+
+class VariantStats:
+    """
+    Statistiques agrégées d'une variante de stratégie sur un tournoi.
+    """
+    def __init__(self, name: str):
+        """
+        Initialise des statistiques vides.
+
+        Args:
+            name: Nom de la variante
+        """
+        self.name = name
+        self.games = 0
+        self.wins = 0.0
+        self.survived = 0
+        self.savoir_sum = 0
+        self.savoir_sq_sum = 0
+
+    def add(self, savoir: int, vie: int, win: float):
+        """
+        Ajoute le résultat d'une place.
+
+        Args:
+            savoir: Savoir final
+            vie: Vie finale
+            win: Part de victoire (1 pour une victoire seule, 1/n pour une égalité à n)
+        """
+        self.games += 1
+        self.wins += win
+        self.survived += vie > 0
+        self.savoir_sum += savoir
+        self.savoir_sq_sum += savoir * savoir
+
+    @property
+    def win_rate(self) -> float:
+        """Taux de victoire."""
+        return self.wins / self.games if self.games else 0.0
+
+    def win_rate_interval(self) -> Tuple[float, float]:
+        """
+        Intervalle de confiance à 95 % du taux de victoire (intervalle de Wilson).
+
+        Returns:
+            Tuple[float, float]: Bornes basse et haute
+        """
+        if not self.games:
+            return 0.0, 1.0
+        n = self.games
+        p = self.win_rate
+        denominator = 1 + Z_95 ** 2 / n
+        center = (p + Z_95 ** 2 / (2 * n)) / denominator
+        margin = Z_95 * math.sqrt(p * (1 - p) / n + Z_95 ** 2 / (4 * n * n)) / denominator
+        return max(center - margin, 0.0), min(center + margin, 1.0)
+
+    @property
+    def mean_savoir(self) -> float:
+        """Savoir final moyen."""
+        return self.savoir_sum / self.games if self.games else 0.0
+
+    def savoir_interval(self) -> Tuple[float, float]:
+        """
+        Intervalle de confiance à 95 % du savoir final moyen (approximation normale).
+
+        Returns:
+            Tuple[float, float]: Bornes basse et haute
+        """
+        if self.games < 2:
+            return self.mean_savoir, self.mean_savoir
+        variance = (self.savoir_sq_sum - self.games * self.mean_savoir ** 2) / (self.games - 1)
+        margin = Z_95 * math.sqrt(max(variance, 0.0) / self.games)
+        return self.mean_savoir - margin, self.mean_savoir + margin
+
+    def __str__(self) -> str:
+        """Retourne une ligne de rapport."""
+        win_low, win_high = self.win_rate_interval()
+        savoir_low, savoir_high = self.savoir_interval()
+        return (f"{self.name:<16} places={self.games:<6} victoires={self.win_rate:6.1%} "
+                f"[{win_low:6.1%}, {win_high:6.1%}]  savoir={self.mean_savoir:8.1f} "
+                f"[{savoir_low:8.1f}, {savoir_high:8.1f}]  survie={self.survived / max(self.games, 1):6.1%}")
+
+
+def run_tournament(variants: List[str], games: int, workers: Optional[int] = None, seed: int = 0,
+                   batch_size: int = 16, log_level: str = "WARNING") -> Iterator[Dict[str, VariantStats]]:
+    """
+    Joue `games` parties entre les variantes sur un pool de processus.
+    Les statistiques cumulées sont renvoyées après chaque lot terminé.
+
+    Args:
+        variants: Noms des variantes, une par joueur (une variante peut apparaître plusieurs fois)
+        games: Nombre de parties
+        workers: Nombre de processus (par défaut le nombre de cœurs)
+        seed: Graine de la première partie ; les suivantes utilisent seed + 1, seed + 2, ...
+        batch_size: Nombre de parties par tâche envoyée à un processus
+        log_level: Niveau de journalisation des processus
+
+    Yields:
+        Dict[str, VariantStats]: Les statistiques cumulées, par variante
+    """
+    unknown = [name for name in variants if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Variantes inconnues: {unknown} (disponibles: {sorted(STRATEGIES)})")
+
+    stats = {name: VariantStats(name) for name in variants}
+    seeds = list(range(seed, seed + games))
+    batches = [seeds[i:i + batch_size] for i in range(0, len(seeds), batch_size)]
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(_play_batch, variants, batch, log_level) for batch in batches]
+        for future in as_completed(futures):
+            for name, savoir, vie, win in future.result():
+                stats[name].add(savoir, vie, win)
+            yield stats
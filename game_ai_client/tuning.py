@@ -0,0 +1,204 @@
+"""
+Module de réglage hors ligne des paramètres de la stratégie.
+Évalue des jeux de paramètres en auto-apprentissage, parties réparties sur plusieurs processus, avec une
+recherche évolutionnaire simple : un premier tirage uniforme dans les bornes (BORNES), puis des tirages
+gaussiens autour du meilleur jeu, dont le pas diminue quand une génération ne l'améliore pas.
+Tous les jeux sont évalués sur les mêmes graines, pour que leurs écarts ne viennent pas du hasard des parties.
+"""
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .scoring.params import BORNES, StrategyParams
+from .simulation import play_game
+from .strategy import Strategy
+from .tournament import STRATEGIES, VariantStats
+from .utils.logger import Logger
+
+
+# Un jeu de paramètres candidat : valeurs des paramètres réglés, par nom
+Candidate = Dict[str, float]
+
+# Nom du candidat parmi les places d'une partie
+CANDIDAT = "candidat"
+
+
+class TuningStep(NamedTuple):
+    """
+    Résultat d'une génération du réglage.
+    """
+    generation: int
+    best: Candidate
+    stats: VariantStats
+    improved: bool
+    sigma: float
+
+
+def default_candidate() -> Candidate:
+    """
+    Renvoie les valeurs par défaut des paramètres réglés.
+
+    Returns:
+        Candidate: Les paramètres par défaut
+    """
+    return {name: getattr(StrategyParams, name) for name in BORNES}
+
+
+def play_candidate(values: Candidate, opponents: List[str], seed: int) -> Tuple[int, int, float]:
+    """
+    Joue une partie d'une Strategy aux paramètres donnés contre des variantes du tournoi.
+    Les places tournent avec la graine, comme dans play_seeded_game.
+
+    Args:
+        values: Paramètres du candidat
+        opponents: Noms des variantes adverses, une par joueur
+        seed: Graine de la partie
+
+    Returns:
+        Tuple[int, int, float]: Savoir final, vie finale et part de victoire du candidat
+    """
+    names = [CANDIDAT] + opponents
+    offset = seed % len(names)
+    seats = names[offset:] + names[:offset]
+    strategies = [Strategy(params=StrategyParams(**values)) if name == CANDIDAT else STRATEGIES[name]()
+                  for name in seats]
+    engine = play_game(strategies, seed)
+
+    index = seats.index(CANDIDAT)
+    best = max(engine.savoir)
+    win = 1 / engine.savoir.count(best) if engine.savoir[index] == best else 0.0
+    return engine.savoir[index], engine.vie[index], win
+
+
+def _play_batch(candidate: int, values: Candidate, opponents: List[str], seeds: List[int],
+                log_level: str) -> Tuple[int, List[Tuple[int, int, float]]]:
+    """
+    Joue un lot de parties d'un candidat dans un processus du pool.
+
+    Args:
+        candidate: Position du candidat dans sa génération
+        values: Paramètres du candidat
+        opponents: Noms des variantes adverses
+        seeds: Graines des parties du lot
+        log_level: Niveau de journalisation du processus
+
+    Returns:
+        Tuple[int, List[Tuple[int, int, float]]]: La position du candidat et ses résultats
+    """
+    Logger.set_level(log_level)
+    return candidate, [play_candidate(values, opponents, seed) for seed in seeds]
+
+
+def evaluate(candidates: List[Candidate], opponents: List[str], seeds: List[int], workers: Optional[int] = None,
+             batch_size: int = 16, log_level: str = "WARNING", names: Optional[List[str]] = None) -> List[VariantStats]:
+    """
+    Évalue des candidats sur les mêmes parties, réparties sur un pool de processus.
+
+    Args:
+        candidates: Paramètres des candidats
+        opponents: Noms des variantes adverses, une par joueur
+        seeds: Graines des parties jouées par chaque candidat
+        workers: Nombre de processus (par défaut le nombre de cœurs)
+        batch_size: Nombre de parties par tâche envoyée à un processus
+        log_level: Niveau de journalisation des processus
+        names: Noms des candidats dans les statistiques (par défaut leur position)
+
+    Returns:
+        List[VariantStats]: Les statistiques de chaque candidat, dans l'ordre des candidats
+
+    Raises:
+        ValueError: Si une variante adverse est inconnue
+    """
+    unknown = [name for name in opponents if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Variantes inconnues: {unknown} (disponibles: {sorted(STRATEGIES)})")
+
+    stats = [VariantStats(names[index] if names else f"{CANDIDAT} {index}") for index in range(len(candidates))]
+    batches = [seeds[i:i + batch_size] for i in range(0, len(seeds), batch_size)]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(_play_batch, index, values, opponents, batch, log_level)
+                   for index, values in enumerate(candidates) for batch in batches]
+        for future in as_completed(futures):
+            index, results = future.result()
+            for savoir, vie, win in results:
+                stats[index].add(savoir, vie, win)
+    return stats
+
+
+def fitness(stats: VariantStats) -> Tuple[float, float]:
+    """
+    Renvoie la valeur à maximiser d'un candidat : le taux de victoire, puis le savoir final moyen.
+
+    Args:
+        stats: Statistiques du candidat
+
+    Returns:
+        Tuple[float, float]: Taux de victoire et savoir final moyen
+    """
+    return stats.win_rate, stats.mean_savoir
+
+
+def sample(rng: random.Random, center: Optional[Candidate] = None, sigma: float = 0.0) -> Candidate:
+    """
+    Tire un candidat dans les bornes, uniformément, ou autour d'un centre.
+
+    Args:
+        rng: Générateur aléatoire de la recherche
+        center: Candidat autour duquel tirer (None : tirage uniforme)
+        sigma: Écart type du tirage gaussien, en part de la largeur des bornes
+
+    Returns:
+        Candidate: Les paramètres tirés, dans le type de chaque paramètre
+    """
+    types = StrategyParams.types()
+    values = {}
+    for name, (low, high) in BORNES.items():
+        if center is None:
+            value = rng.uniform(low, high)
+        else:
+            value = min(max(center[name] + rng.gauss(0.0, sigma) * (high - low), low), high)
+        values[name] = types[name](round(value) if types[name] is int else value)
+    return values
+
+
+def tune(opponents: List[str], generations: int = 10, population: int = 16, games: int = 200,
+         workers: Optional[int] = None, seed: int = 0, batch_size: int = 16, log_level: str = "WARNING",
+         sigma: float = 0.3, shrink: float = 0.7, search_seed: Optional[int] = None) -> Iterator[TuningStep]:
+    """
+    Règle les paramètres de la stratégie contre des variantes du tournoi.
+    La première génération contient les paramètres par défaut, pour que le réglage ne fasse jamais moins bien
+    qu'eux sur les parties d'évaluation ; le meilleur jeu est renvoyé après chaque génération.
+
+    Args:
+        opponents: Noms des variantes adverses, une par joueur
+        generations: Nombre de générations
+        population: Nombre de candidats par génération
+        games: Nombre de parties jouées par chaque candidat
+        workers: Nombre de processus (par défaut le nombre de cœurs)
+        seed: Graine de la première partie ; les suivantes utilisent seed + 1, seed + 2, ...
+        batch_size: Nombre de parties par tâche envoyée à un processus
+        log_level: Niveau de journalisation des processus
+        sigma: Écart type initial des tirages autour du meilleur jeu, en part de la largeur des bornes
+        shrink: Facteur appliqué à sigma après une génération sans amélioration
+        search_seed: Graine des tirages de la recherche
+
+    Yields:
+        TuningStep: Le meilleur jeu après chaque génération
+    """
+    rng = random.Random(search_seed)
+    seeds = list(range(seed, seed + games))
+    best: Optional[Candidate] = None
+    best_stats: Optional[VariantStats] = None
+    for generation in range(generations):
+        if best is None:
+            candidates = [default_candidate()] + [sample(rng) for _ in range(population - 1)]
+        else:
+            candidates = [sample(rng, best, sigma) for _ in range(population)]
+        improved = False
+        for values, stats in zip(candidates, evaluate(candidates, opponents, seeds, workers, batch_size, log_level)):
+            if best_stats is None or fitness(stats) > fitness(best_stats):
+                best, best_stats, improved = values, stats, True
+        if generation and not improved:
+            sigma *= shrink
+        yield TuningStep(generation, best, best_stats, improved, sigma)
@@ -3,5 +3,6 @@ Utility modules for the Game AI Client.
 """
 from .config import Config
 from .logger import Logger, LogLevel
+from .line_reader import LineReader
 
-__all__ = ['Config', 'Logger', 'LogLevel']
+__all__ = ['Config', 'Logger', 'LogLevel', 'LineReader']
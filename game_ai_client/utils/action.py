@@ -7,7 +7,9 @@ from typing import List, Optional, Dict, Any, Tuple
 from ..models.joueur import Joueur
 from ..models.monstre import Monstre
 from ..models.pioche import Pioche, TypeCarte
+from ..models.turn_state import TurnState
 from .logger import Logger
+from . import fast_parser
 
 
 class CommandType(Enum):
@@ -37,14 +39,29 @@ class Action:
     Permet de formater les commandes, les envoyer au serveur, et d'analyser les réponses.
     """
     
-    def __init__(self, connection=None):
+    # Réponses rendues obsolètes par chacune de nos actions acceptées par le serveur.
+    # PIOCHER et ATTAQUER terminent le tour : les autres joueurs jouent ensuite, seul DEGATS
+    # (qui ne dépend que du tour) reste valable.
+    INVALIDATED_BY = {
+        CommandType.PIOCHER: (CommandType.MOI, CommandType.JOUEURS, CommandType.MONSTRES, CommandType.PIOCHES),
+        CommandType.UTILISER: (CommandType.MOI, CommandType.JOUEURS),
+        CommandType.ATTAQUER: (CommandType.MOI, CommandType.JOUEURS, CommandType.MONSTRES, CommandType.PIOCHES),
+    }
+    
+    def __init__(self, connection=None, cache: bool = True):
         """
         Initialise une instance d'Action avec une connexion.
         
         Args:
             connection: Instance de Connection à utiliser (optionnel)
+            cache: Sert localement les réponses qui n'ont pas pu changer depuis la dernière demande
         """
         self._connection = connection
+        self.cache_enabled = cache
+        self._cache: Dict[CommandType, str] = {}
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def set_connection(self, connection):
         """
@@ -83,6 +100,110 @@ class Action:
         """
         return response.strip().split('|')
     
+    # ===== CACHE DU TOUR =====
+    
+    def begin_turn(self, tour: int, sous_tour: int):
+        """
+        Place le cache sur le tour annoncé par DEBUT_TOUR.
+        Un nouveau sous-tour invalide toutes les réponses sauf DEGATS ; un nouveau tour invalide tout.
+        Un DEBUT_TOUR répété sans action de notre part entre-temps garde le cache intact.
+        
+        Args:
+            tour: Numéro du tour
+            sous_tour: Numéro du sous-tour
+        """
+        key = (tour, sous_tour)
+        if self._cache_key is not None and self._cache_key != key:
+            degats = self._cache.get(CommandType.DEGATS) if self._cache_key[0] == tour else None
+            self._cache.clear()
+            if degats is not None:
+                self._cache[CommandType.DEGATS] = degats
+        self._cache_key = key
+    
+    def invalidate(self, command: Optional[CommandType] = None):
+        """
+        Invalide les réponses rendues obsolètes par une action (ou tout le cache).
+        
+        Args:
+            command: Action acceptée par le serveur (None pour vider le cache)
+        """
+        if command is None:
+            self._cache.clear()
+            self._cache_key = None
+            return
+        for stale in self.INVALIDATED_BY.get(command, ()):
+            self._cache.pop(stale, None)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Renvoie les compteurs du cache.
+        
+        Returns:
+            Dict[str, Any]: Demandes servies localement (hits), envoyées au serveur (misses) et taux de succès
+        """
+        total = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / total if total else 0.0,
+        }
+    
+    def _cached(self, command: CommandType) -> Optional[str]:
+        """Renvoie la réponse en cache pour une demande (None si elle doit être envoyée), en la comptant."""
+        response = self._cache.get(command) if self.cache_enabled and self._cache_key is not None else None
+        if response is None:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+        return response
+    
+    def _store(self, command: CommandType, response: str) -> str:
+        """Met en cache la réponse brute à une demande et la renvoie."""
+        if self.cache_enabled and self._cache_key is not None:
+            self._cache[command] = response
+        return response
+    
+    def _record(self, command: CommandType, ok: bool) -> bool:
+        """Invalide le cache après une action acceptée et renvoie son résultat."""
+        if ok:
+            self.invalidate(command)
+        return ok
+    
+    def _lookup(self, commands: List[CommandType]) -> Tuple[List[Optional[str]], List[CommandType]]:
+        """
+        Sert depuis le cache les demandes qui peuvent l'être.
+        
+        Args:
+            commands: Les demandes
+            
+        Returns:
+            Tuple[List[Optional[str]], List[CommandType]]: Les réponses (None si absente) et les demandes à envoyer
+        """
+        responses = [self._cached(command) for command in commands]
+        return responses, [command for command, response in zip(commands, responses) if response is None]
+    
+    def _fill(self, commands: List[CommandType], responses: List[Optional[str]], received: List[str]) -> List[str]:
+        """Complète, dans l'ordre, les réponses absentes par celles reçues du serveur et les met en cache."""
+        received = iter(received)
+        return [response if response is not None else self._store(command, next(received))
+                for command, response in zip(commands, responses)]
+    
+    def _query(self, command: CommandType) -> str:
+        """
+        Renvoie la réponse brute à une demande d'information, depuis le cache si possible.
+        
+        Args:
+            command: Type de demande
+            
+        Returns:
+            str: La réponse du serveur
+        """
+        response = self._cached(command)
+        if response is None:
+            self._connection.send_message(self.format_command(command.value))
+            response = self._store(command, self._connection.receive_message())
+        return response
+    
     # ===== ACTIONS =====
 
     def send_team_name(self, team_name: str) -> int:
@@ -113,7 +234,7 @@ class Action:
         
         self._connection.send_message(self.format_command(CommandType.PIOCHER.value, [expedition_number, malus_player_number]))
         
-        return self.parse_response(self._connection.receive_message())[0] == "OK"
+        return self._record(CommandType.PIOCHER, self.parse_response(self._connection.receive_message())[0] == "OK")
     
     def utiliser(self, type_carte: TypeCarte) -> bool:
         """
@@ -128,7 +249,7 @@ class Action:
         
         self._connection.send_message(self.format_command(CommandType.UTILISER.value, [type_carte.value]))
         
-        return self.parse_response(self._connection.receive_message())[0] == "OK"
+        return self._record(CommandType.UTILISER, self.parse_response(self._connection.receive_message())[0] == "OK")
     
     def attaquer(self, monster_number: int) -> bool:
         """
@@ -143,7 +264,23 @@ class Action:
         
         self._connection.send_message(self.format_command(CommandType.ATTAQUER.value, [str(monster_number)]))
         
-        return self.parse_response(self._connection.receive_message())[0] == "OK"
+        return self._record(CommandType.ATTAQUER, self.parse_response(self._connection.receive_message())[0] == "OK")
+    
+    def execute(self, command: CommandType, args: List[Any] = None) -> bool:
+        """
+        Envoie une commande d'action quelconque et lit sa réponse.
+        
+        Args:
+            command: Type de commande (PIOCHER, UTILISER ou ATTAQUER)
+            args: Les arguments de la commande (optionnel)
+            
+        Returns:
+            bool: True si le serveur a répondu OK, False sinon
+        """
+        
+        self._connection.send_message(self.format_command(command.value, args))
+        
+        return self._record(command, self.parse_response(self._connection.receive_message())[0] == "OK")
     
     # ===== DEMANDES D'INFORMATIONS =====
     
@@ -155,9 +292,7 @@ class Action:
             Dict[str, Any]: Demande formatée
         """
         
-        self._connection.send_message(self.format_command(CommandType.JOUEURS.value))
-        
-        return Joueur.from_server_response(self.parse_response(self._connection.receive_message()))
+        return fast_parser.parse_joueurs(self._query(CommandType.JOUEURS)).to_list()
     
     def get_moi(self) -> Joueur:
         """
@@ -167,9 +302,7 @@ class Action:
             Dict[str, Any]: Demande formatée
         """
         
-        self._connection.send_message(self.format_command(CommandType.MOI.value))
-        
-        return Joueur.from_array(self.parse_response(self._connection.receive_message()))
+        return fast_parser.parse_moi(self._query(CommandType.MOI))
     
     def get_monstres(self) -> List[Monstre]:
         """
@@ -179,9 +312,7 @@ class Action:
             Dict[str, Any]: Demande formatée
         """
         
-        self._connection.send_message(self.format_command(CommandType.MONSTRES.value))
-        
-        return Monstre.from_server_response(self.parse_response(self._connection.receive_message()))
+        return fast_parser.parse_monstres(self._query(CommandType.MONSTRES)).to_list()
     
     def get_pioches(self) -> List[Pioche]:
         """
@@ -191,9 +322,7 @@ class Action:
             Dict[str, Any]: Demande formatée
         """
         
-        self._connection.send_message(self.format_command(CommandType.PIOCHES.value))
-        
-        return Pioche.from_server_response(self.parse_response(self._connection.receive_message()))
+        return fast_parser.parse_pioches(self._query(CommandType.PIOCHES)).to_list()
 
     def get_degats(self) -> int:
         """
@@ -203,6 +332,70 @@ class Action:
             Dict[str, Any]: Demande formatée
         """
         
-        self._connection.send_message(self.format_command(CommandType.DEGATS.value))
+        return int(self.parse_response(self._query(CommandType.DEGATS))[0])
+
+    # Demandes envoyées par snapshot, dans l'ordre de lecture des réponses
+    SNAPSHOT_COMMANDS = [
+        CommandType.MOI,
+        CommandType.JOUEURS,
+        CommandType.MONSTRES,
+        CommandType.PIOCHES,
+        CommandType.DEGATS,
+    ]
+
+    def snapshot(self, tour: int = 0, sous_tour: int = 0) -> TurnState:
+        """
+        Envoie en un seul envoi les demandes d'information du tour qui ne sont pas en cache,
+        puis lit leurs réponses dans l'ordre (au plus un aller-retour réseau).
+        
+        Args:
+            tour: Numéro du tour (premier argument de DEBUT_TOUR)
+            sous_tour: Numéro du sous-tour (second argument de DEBUT_TOUR)
+            
+        Returns:
+            TurnState: L'état du jeu au début du tour
+        """
+        return self.build_turn_state(self.fetch_snapshot(tour, sous_tour), tour, sous_tour)
+
+    def fetch_snapshot(self, tour: int = 0, sous_tour: int = 0) -> List[str]:
+        """
+        Partie réseau de snapshot : renvoie les réponses brutes, sans les analyser.
+        
+        Args:
+            tour: Numéro du tour (premier argument de DEBUT_TOUR)
+            sous_tour: Numéro du sous-tour (second argument de DEBUT_TOUR)
+            
+        Returns:
+            List[str]: Les réponses, dans l'ordre de SNAPSHOT_COMMANDS
+        """
+        self.begin_turn(tour, sous_tour)
+        responses, missing = self._lookup(self.SNAPSHOT_COMMANDS)
+        received = []
+        if missing:
+            self._connection.send_messages([self.format_command(command.value) for command in missing])
+            received = self._connection.receive_messages(len(missing))
+        return self._fill(self.SNAPSHOT_COMMANDS, responses, received)
+
+    def build_turn_state(self, responses: List[str], tour: int = 0, sous_tour: int = 0) -> TurnState:
+        """
+        Construit l'état du tour à partir des réponses aux demandes de SNAPSHOT_COMMANDS.
+        
+        Args:
+            responses: Les cinq réponses du serveur, dans l'ordre de SNAPSHOT_COMMANDS
+            tour: Numéro du tour
+            sous_tour: Numéro du sous-tour
+            
+        Returns:
+            TurnState: L'état du jeu au début du tour
+        """
+        moi, joueurs, monstres, pioches, degats = responses
         
-        return int(self.parse_response(self._connection.receive_message())[0])
+        return TurnState(
+            moi=fast_parser.parse_moi(moi),
+            joueurs=fast_parser.parse_joueurs(joueurs).to_list(),
+            monstres=fast_parser.parse_monstres(monstres).to_list(),
+            pioches=fast_parser.parse_pioches(pioches).to_list(),
+            degats=int(self.parse_response(degats)[0]),
+            tour=tour,
+            sous_tour=sous_tour
+        )
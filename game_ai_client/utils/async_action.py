@@ -0,0 +1,155 @@
+"""
+Module contenant la classe AsyncAction, version asynchrone de Action.
+"""
+from typing import Any, List, Optional
+
+from ..models.joueur import Joueur
+from ..models.monstre import Monstre
+from ..models.pioche import Pioche, TypeCarte
+from ..models.turn_state import TurnState
+from .action import Action, CommandType
+from . import fast_parser
+
+
+class AsyncAction(Action):
+    """
+    Version asynchrone de Action, à utiliser avec une AsyncConnection.
+    Réutilise le formatage des commandes et l'analyse des réponses de Action.
+    """
+
+    # ===== ACTIONS =====
+
+    async def send_team_name(self, team_name: str) -> int:
+        """
+        Envoie le nom de l'équipe.
+
+        Args:
+            team_name: Le nom de l'équipe
+
+        Returns:
+            team number
+        """
+        await self._connection.send_message(team_name)
+        return int(self.parse_response(await self._connection.receive_message())[1])
+
+    async def execute(self, command: CommandType, args: List[Any] = None) -> bool:
+        """
+        Envoie une commande d'action quelconque et lit sa réponse.
+
+        Args:
+            command: Type de commande (PIOCHER, UTILISER ou ATTAQUER)
+            args: Les arguments de la commande (optionnel)
+
+        Returns:
+            bool: True si le serveur a répondu OK, False sinon
+        """
+        await self._connection.send_message(self.format_command(command.value, args))
+        return self._record(command, self.parse_response(await self._connection.receive_message())[0] == "OK")
+
+    async def piocher(self, expedition_number: int, malus_player_number: Optional[int] = None) -> bool:
+        """
+        Pioche une carte.
+
+        Args:
+            expedition_number: Numéro de l'expédition (entre 0 et 5)
+            malus_player_number: Numéro du joueur sur lequel appliquer le malus (entre 0 et 3, optionnel)
+
+        Returns:
+            bool: True si la commande a été acceptée, False sinon
+        """
+        return await self.execute(CommandType.PIOCHER, [expedition_number, malus_player_number])
+
+    async def utiliser(self, type_carte: TypeCarte) -> bool:
+        """
+        Utilise les cartes d'un type.
+
+        Args:
+            type_carte: Type de carte à utiliser (DEFENSE, ATTAQUE ou SAVOIR)
+
+        Returns:
+            bool: True si la commande a été acceptée, False sinon
+        """
+        return await self.execute(CommandType.UTILISER, [type_carte.value])
+
+    async def attaquer(self, monster_number: int) -> bool:
+        """
+        Attaque un monstre.
+
+        Args:
+            monster_number: Numéro du monstre à attaquer (entre 0 et 2)
+
+        Returns:
+            bool: True si la commande a été acceptée, False sinon
+        """
+        return await self.execute(CommandType.ATTAQUER, [monster_number])
+
+    # ===== DEMANDES D'INFORMATIONS =====
+
+    async def _query(self, command: CommandType) -> str:
+        """
+        Renvoie la réponse brute à une demande d'information, depuis le cache si possible.
+
+        Args:
+            command: Type de demande
+
+        Returns:
+            str: La réponse du serveur
+        """
+        response = self._cached(command)
+        if response is None:
+            await self._connection.send_message(self.format_command(command.value))
+            response = self._store(command, await self._connection.receive_message())
+        return response
+
+    async def get_joueurs(self) -> List[Joueur]:
+        """Obtient les informations sur tous les joueurs."""
+        return fast_parser.parse_joueurs(await self._query(CommandType.JOUEURS)).to_list()
+
+    async def get_moi(self) -> Joueur:
+        """Obtient les informations sur le joueur actuel."""
+        return fast_parser.parse_moi(await self._query(CommandType.MOI))
+
+    async def get_monstres(self) -> List[Monstre]:
+        """Obtient les informations sur les monstres."""
+        return fast_parser.parse_monstres(await self._query(CommandType.MONSTRES)).to_list()
+
+    async def get_pioches(self) -> List[Pioche]:
+        """Obtient les informations sur les expéditions."""
+        return fast_parser.parse_pioches(await self._query(CommandType.PIOCHES)).to_list()
+
+    async def get_degats(self) -> int:
+        """Obtient les dégâts de fin de manche."""
+        return int(self.parse_response(await self._query(CommandType.DEGATS))[0])
+
+    async def snapshot(self, tour: int = 0, sous_tour: int = 0) -> TurnState:
+        """
+        Envoie en une seule écriture les demandes d'information du tour qui ne sont pas en cache,
+        puis lit leurs réponses dans l'ordre.
+
+        Args:
+            tour: Numéro du tour (premier argument de DEBUT_TOUR)
+            sous_tour: Numéro du sous-tour (second argument de DEBUT_TOUR)
+
+        Returns:
+            TurnState: L'état du jeu au début du tour
+        """
+        return self.build_turn_state(await self.fetch_snapshot(tour, sous_tour), tour, sous_tour)
+
+    async def fetch_snapshot(self, tour: int = 0, sous_tour: int = 0) -> List[str]:
+        """
+        Partie réseau de snapshot : renvoie les réponses brutes, sans les analyser.
+
+        Args:
+            tour: Numéro du tour (premier argument de DEBUT_TOUR)
+            sous_tour: Numéro du sous-tour (second argument de DEBUT_TOUR)
+
+        Returns:
+            List[str]: Les réponses, dans l'ordre de SNAPSHOT_COMMANDS
+        """
+        self.begin_turn(tour, sous_tour)
+        responses, missing = self._lookup(self.SNAPSHOT_COMMANDS)
+        received = []
+        if missing:
+            await self._connection.send_messages([self.format_command(command.value) for command in missing])
+            received = await self._connection.receive_messages(len(missing))
+        return self._fill(self.SNAPSHOT_COMMANDS, responses, received)
@@ -2,13 +2,14 @@
 Module de configuration pour le client IA du jeu.
 Contient les paramètres de connexion au serveur et d'autres paramètres de configuration.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class Config:
     """
     Classe de configuration pour le client IA du jeu.
     Stocke les paramètres de connexion au serveur et d'autres paramètres de configuration.
+    Les attributs de classe servent de valeurs par défaut ; chaque session utilise sa propre instance.
     """
     # Paramètres de connexion au serveur
     HOSTNAME_SERVER: str = "localhost"
@@ -20,16 +21,51 @@ class Config:
     
     # Des paramètres de jeu supplémentaires peuvent être ajoutés ici
     GAME_SETTINGS: Dict[str, Any] = {
-        "timeout": 30,  # secondes
-        "retry_attempts": 3,
+        "timeout": 30,  # secondes sans réponse à une demande avant de considérer la connexion perdue (None : sans limite)
+        "retry_attempts": 3,  # tentatives de reconnexion après une coupure (0 : pas de reconnexion)
+        "retry_delay": 0.1,  # secondes avant la première tentative, doublées à chaque tentative
+        "retry_max_delay": 2.0,  # plafond du délai entre deux tentatives, en secondes
+        "strategy": "default",  # "default" ou "montecarlo"
+        "decision_budget": 0.05,  # secondes, pour la stratégie montecarlo
+        "search_workers": 0,  # processus de recherche supplémentaires (0 : recherche dans le processus courant)
+        "wire_logging": True,  # journalise chaque message échangé avec le serveur (niveau ACTION)
+        "turn_cache": True,  # sert localement les réponses inchangées depuis la dernière demande
+        "scoring_cache_size": 0,  # états dont les scores sont mémorisés par la stratégie (0 : sans cache)
+        "profile": None,  # profil JSON des paramètres de la stratégie, produit par tune.py (None : paramètres par défaut)
+        "turn_deadline": None,  # secondes par tour avant de jouer l'action de repli (None : sans échéance)
+        "record_file": None,  # fichier où enregistrer les parties jouées (None : pas d'enregistrement)
     }
     
-    @classmethod
-    def get_server_address(cls) -> tuple:
+    def __init__(self, hostname_server: Optional[str] = None, port_server: Optional[int] = None,
+                 log_level: Optional[str] = None, log_file: Optional[str] = None,
+                 game_settings: Optional[Dict[str, Any]] = None):
+        """
+        Crée une configuration propre à une session de jeu.
+        Les paramètres non fournis reprennent les valeurs par défaut de la classe.
+        La journalisation est commune au processus : LOG_LEVEL et LOG_FILE ne s'appliquent qu'une fois
+        passés à Logger.set_level et Logger.set_file (ce que fait main.py).
+        
+        Args:
+            hostname_server: Nom d'hôte du serveur
+            port_server: Port du serveur
+            log_level: Niveau de journalisation
+            log_file: Fichier de journalisation
+            game_settings: Paramètres de jeu à surcharger
+        """
+        cls = type(self)
+        self.HOSTNAME_SERVER = hostname_server if hostname_server is not None else cls.HOSTNAME_SERVER
+        self.PORT_SERVER = port_server if port_server is not None else cls.PORT_SERVER
+        self.LOG_LEVEL = log_level if log_level is not None else cls.LOG_LEVEL
+        self.LOG_FILE = log_file if log_file is not None else cls.LOG_FILE
+        self.GAME_SETTINGS = dict(cls.GAME_SETTINGS)
+        if game_settings:
+            self.GAME_SETTINGS.update(game_settings)
+    
+    def get_server_address(self) -> tuple:
         """
         Renvoie l'adresse du serveur sous forme de tuple (nom d'hôte, port).
         
         Returns:
             tuple: Un tuple contenant le nom d'hôte et le port
         """
-        return (cls.HOSTNAME_SERVER, cls.PORT_SERVER)
+        return (self.HOSTNAME_SERVER, self.PORT_SERVER)
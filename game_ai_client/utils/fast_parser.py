@@ -0,0 +1,116 @@
+"""
+Analyseur rapide des réponses du serveur.
+Transforme en une passe une réponse brute (bytes ou str) de MOI, JOUEURS, MONSTRES ou PIOCHES
+en modèle compact (Joueur, JoueurTable, MonstreTable, PiocheTable) : un seul découpage fait en C,
+une conversion directe en array d'entiers, aucun objet intermédiaire par élément.
+Une réponse mal formée est confiée aux méthodes from_server_response, qui en journalisent les défauts.
+"""
+from array import array
+from typing import Union
+
+from ..models.joueur import Joueur
+from ..models.tables import CODE_TYPE, TYPE_INCONNU, JoueurTable, MonstreTable, PiocheTable
+
+
+# Une réponse brute du serveur, telle que lue sur le socket ou déjà décodée
+Raw = Union[bytes, str]
+
+# Table de correspondance précalculée : nom du type (bytes ou str) -> code de PiocheTable
+TYPE_CODES = {**CODE_TYPE, **{name.encode('ascii'): code for name, code in CODE_TYPE.items()}}
+
+
+def _split(raw: Raw) -> list:
+    """Découpe une réponse sur le séparateur du protocole."""
+    return raw.strip().split(b'|' if isinstance(raw, bytes) else '|')
+
+
+def _fallback(raw: Raw) -> list:
+    """Découpe une réponse en chaînes, pour les méthodes tolérantes des modèles."""
+    text = raw.decode('utf-8', errors='replace') if isinstance(raw, bytes) else raw
+    return text.strip().split('|')
+
+
+def _columns(table_class, values: array):
+    """Répartit des valeurs entrelacées dans les colonnes d'une nouvelle table."""
+    table = table_class.__new__(table_class)
+    width = len(table_class.FIELDS)
+    for field, name in enumerate(table_class.FIELDS):
+        setattr(table, name, values[field::width])
+    return table
+
+
+def parse_moi(raw: Raw) -> Joueur:
+    """
+    Analyse la réponse MOI.
+
+    Args:
+        raw: La réponse brute
+
+    Returns:
+        Joueur: Nos statistiques
+    """
+    try:
+        vie, score_defense, score_attaque, score_savoir = map(int, _split(raw))
+    except ValueError:
+        return Joueur.from_array(_fallback(raw))
+    return Joueur(vie, score_defense, score_attaque, score_savoir)
+
+
+def _parse_ints(raw: Raw, table_class):
+    """Analyse une réponse composée uniquement d'entiers en table."""
+    try:
+        values = array('q', map(int, _split(raw)))
+    except ValueError:
+        values = None
+    if values is None or len(values) % len(table_class.FIELDS):
+        return table_class.from_server_response(_fallback(raw))
+    return _columns(table_class, values)
+
+
+def parse_joueurs(raw: Raw) -> JoueurTable:
+    """
+    Analyse la réponse JOUEURS.
+
+    Args:
+        raw: La réponse brute
+
+    Returns:
+        JoueurTable: Les joueurs
+    """
+    return _parse_ints(raw, JoueurTable)
+
+
+def parse_monstres(raw: Raw) -> MonstreTable:
+    """
+    Analyse la réponse MONSTRES.
+
+    Args:
+        raw: La réponse brute
+
+    Returns:
+        MonstreTable: Les monstres
+    """
+    return _parse_ints(raw, MonstreTable)
+
+
+def parse_pioches(raw: Raw) -> PiocheTable:
+    """
+    Analyse la réponse PIOCHES.
+
+    Args:
+        raw: La réponse brute
+
+    Returns:
+        PiocheTable: Les pioches
+    """
+    fields = _split(raw)
+    if len(fields) % 2:
+        return PiocheTable.from_server_response(_fallback(raw))
+    try:
+        valeurs = array('q', map(int, fields[1::2]))
+    except ValueError:
+        return PiocheTable.from_server_response(_fallback(raw))
+    table = PiocheTable.__new__(PiocheTable)
+    table.type_carte = array('b', [TYPE_CODES.get(name, TYPE_INCONNU) for name in fields[0::2]])
+    table.valeur = valeurs
+    return table
@@ -0,0 +1,133 @@
+"""
+Mesure des durées de chaque phase d'un tour et échéance de décision.
+"""
+import math
+import time
+from array import array
+from typing import Dict, Optional
+
+from .logger import Logger
+
+
+# Phases d'un tour, dans l'ordre : demandes au serveur (allers-retours), analyse des réponses,
+# décision de la stratégie, envoi des commandes (avec leurs acquittements), et le tour entier
+PHASES = ("requetes", "analyse", "decision", "envoi", "tour")
+
+# Centiles rapportés
+PERCENTILES = (50, 95, 99)
+
+# Temps réservé, avant l'échéance du tour, à l'envoi des commandes et à leurs acquittements (secondes)
+SEND_MARGIN = 0.002
+
+
+class LatencyStats:
+    """
+    Durées des phases de chaque tour d'une partie, et échéance par tour.
+    Chaque mesure ne coûte qu'un appel à time.perf_counter ; les centiles sont calculés à la demande.
+    """
+
+    def __init__(self, turn_deadline: Optional[float] = None):
+        """
+        Initialise les mesures.
+
+        Args:
+            turn_deadline: Temps maximal par tour en secondes, depuis la réception de DEBUT_TOUR (None : sans échéance)
+        """
+        self.turn_deadline = turn_deadline
+        self.samples: Dict[str, array] = {phase: array('d') for phase in PHASES}
+        self.fallbacks = 0
+        self.overruns = 0
+        self._start = 0.0
+        self._last = 0.0
+
+    def start_turn(self):
+        """
+        Commence la mesure d'un tour.
+        """
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> float:
+        """
+        Termine une phase du tour en cours.
+
+        Args:
+            phase: Nom de la phase (voir PHASES)
+
+        Returns:
+            float: Durée de la phase, en secondes
+        """
+        now = time.perf_counter()
+        duration = now - self._last
+        self.samples[phase].append(duration)
+        self._last = now
+        return duration
+
+    def end_turn(self):
+        """
+        Termine la mesure du tour en cours et compte un dépassement de l'échéance.
+        """
+        duration = time.perf_counter() - self._start
+        self.samples["tour"].append(duration)
+        if self.turn_deadline is not None and duration > self.turn_deadline:
+            self.overruns += 1
+
+    def deadline(self) -> Optional[float]:
+        """
+        Renvoie l'échéance de la décision du tour en cours : celle du tour, moins SEND_MARGIN pour l'envoi.
+
+        Returns:
+            Optional[float]: L'échéance (time.perf_counter), None sans échéance
+        """
+        return None if self.turn_deadline is None else self._start + self.turn_deadline - SEND_MARGIN
+
+    def expired(self) -> bool:
+        """
+        Indique si l'échéance du tour en cours est déjà dépassée.
+
+        Returns:
+            bool: True si le tour n'a plus de temps pour réfléchir
+        """
+        return self.turn_deadline is not None and time.perf_counter() - self._start >= self.turn_deadline
+
+    def percentiles(self, phase: str) -> Dict[str, float]:
+        """
+        Renvoie les centiles d'une phase (rang le plus proche), en secondes.
+
+        Args:
+            phase: Nom de la phase
+
+        Returns:
+            Dict[str, float]: Nombre de mesures, p50, p95, p99 et maximum
+        """
+        values = sorted(self.samples[phase])
+        stats: Dict[str, float] = {"count": len(values)}
+        if values:
+            for percentile in PERCENTILES:
+                stats[f"p{percentile}"] = values[max(math.ceil(percentile / 100 * len(values)) - 1, 0)]
+            stats["max"] = values[-1]
+        return stats
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Renvoie les centiles de toutes les phases.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Les centiles de chaque phase, avec les replis et les dépassements
+        """
+        report = {phase: self.percentiles(phase) for phase in PHASES}
+        report["echeance"] = {"deadline": self.turn_deadline, "fallbacks": self.fallbacks, "overruns": self.overruns}
+        return report
+
+    def log_report(self):
+        """
+        Journalise les centiles de chaque phase, en millisecondes.
+        """
+        for phase in PHASES:
+            stats = self.percentiles(phase)
+            if stats["count"]:
+                Logger.info("Latence %-8s : %s, max %.3f ms (%d tours)", phase,
+                            ", ".join(f"p{p} {stats[f'p{p}'] * 1000:.3f} ms" for p in PERCENTILES),
+                            stats["max"] * 1000, stats["count"])
+        if self.turn_deadline is not None:
+            Logger.info("Échéance de %.0f ms : %d replis, %d dépassements",
+                        self.turn_deadline * 1000, self.fallbacks, self.overruns)
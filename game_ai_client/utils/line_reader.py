@@ -0,0 +1,97 @@
+"""
+Module de lecture tamponnée pour le client IA du jeu.
+Découpe le flux TCP du serveur en lignes terminées par '\\n' en lisant par gros blocs.
+"""
+import socket
+from collections import deque
+from typing import Deque, List
+
+
+class LineReader:
+    """
+    Lecteur de lignes tamponné au-dessus d'un socket.
+    Lit le flux par blocs de `chunk_size` octets, découpe sur '\\n' et conserve
+    les octets restants pour l'appel suivant.
+    """
+
+    # Taille des blocs lus à chaque appel système
+    DEFAULT_CHUNK_SIZE: int = 65536
+
+    def __init__(self, sock: socket.socket, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialise le lecteur.
+
+        Args:
+            sock: Socket connecté à lire
+            chunk_size: Nombre maximal d'octets lus par appel à recv
+        """
+        self._socket = sock
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._lines: Deque[bytes] = deque()
+
+    def _split_buffer(self):
+        """
+        Déplace toutes les lignes complètes du tampon vers la file de lignes.
+        """
+        end = self._buffer.rfind(b'\n')
+        if end < 0:
+            return
+        complete = bytes(self._buffer[:end])
+        del self._buffer[:end + 1]
+        self._lines.extend(complete.split(b'\n'))
+
+    def _fill(self) -> bool:
+        """
+        Lit un bloc depuis le socket et le découpe en lignes.
+
+        Returns:
+            bool: False si la connexion a été fermée par le serveur
+        """
+        chunk = self._socket.recv(self._chunk_size)
+        if not chunk:
+            return False
+        self._buffer.extend(chunk)
+        self._split_buffer()
+        return True
+
+    def read_line(self) -> bytes:
+        """
+        Renvoie la prochaine ligne complète, sans le '\\n' final.
+
+        Returns:
+            bytes: La ligne lue
+
+        Raises:
+            ConnectionError: Si la connexion est fermée avant la fin de la ligne
+        """
+        while not self._lines:
+            if not self._fill():
+                raise ConnectionError("Connexion fermée par le serveur")
+        return self._lines.popleft()
+
+    def read_lines(self, count: int) -> List[bytes]:
+        """
+        Renvoie exactement `count` lignes, en bloquant si nécessaire.
+
+        Args:
+            count: Nombre de lignes attendues
+
+        Returns:
+            List[bytes]: Les lignes lues dans l'ordre
+        """
+        while len(self._lines) < count:
+            if not self._fill():
+                raise ConnectionError("Connexion fermée par le serveur")
+        return [self._lines.popleft() for _ in range(count)]
+
+    def pending_lines(self) -> List[bytes]:
+        """
+        Renvoie toutes les lignes complètes déjà en file, sans appel système.
+
+        Returns:
+            List[bytes]: Les lignes en attente (éventuellement vide)
+        """
+        lines = list(self._lines)
+        self._lines.clear()
+        return lines
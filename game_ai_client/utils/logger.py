@@ -1,11 +1,20 @@
 """
 Module de journalisation pour le client IA du jeu.
 Fournit différents niveaux de journalisation et de formatage pour les messages.
+
+Les messages sont déposés dans une file par le thread qui journalise ; un thread d'écriture
+(QueueListener) les formate et les écrit sur la console et dans le fichier, hors du chemin
+critique du tour. Les arguments sont formatés à la manière de logging (« %s ») et seulement
+si le niveau est actif : un message désactivé ne coûte qu'une comparaison.
 """
+import atexit
 import logging
 import enum
-from datetime import datetime
-from typing import Optional
+import os
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Any, List, Optional
 
 from .config import Config
 
@@ -20,27 +29,58 @@ class LogLevel(enum.Enum):
     CRITICAL = logging.CRITICAL
 
 
+# Valeurs des niveaux, lues sans passer par l'énumération dans les raccourcis de Logger
+_DEBUG = LogLevel.DEBUG.value
+_INFO = LogLevel.INFO.value
+_ACTION = LogLevel.ACTION.value
+_WARNING = LogLevel.WARNING.value
+_ERROR = LogLevel.ERROR.value
+_CRITICAL = LogLevel.CRITICAL.value
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler qui dépose l'enregistrement tel quel : le message et ses arguments sont
+    formatés par le thread d'écriture. Les arguments ne doivent donc plus être modifiés
+    après l'appel (nombres, chaînes, ou listes remplacées plutôt que modifiées).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 class Logger:
     """
     Classe de journalisation pour le client IA du jeu.
     Gère les messages de journalisation avec différents niveaux et formatages.
+    Toutes les méthodes sont des méthodes de classe : le module logging est déjà sûr entre threads,
+    plusieurs sessions de jeu peuvent donc journaliser en parallèle.
     """
-    _instance: Optional['Logger'] = None
     _logger: Optional[logging.Logger] = None
-    
-    def __new__(cls, *args, **kwargs):
-        """Implémente le modèle singleton."""
-        if cls._instance is None:
-            cls._instance = super(Logger, cls).__new__(cls)
-            cls._initialize_logger()
-        return cls._instance
+    _init_lock = threading.Lock()
+    _handlers: List[logging.Handler] = []
+    _file_handler: Optional[logging.FileHandler] = None
+    # Fichier de journalisation choisi par set_file avant la création du logger (None : Config.LOG_FILE)
+    _file: Optional[str] = None
+    _queue_handler: Optional[QueueHandler] = None
+    _listener: Optional[QueueListener] = None
+    # Niveau minimal journalisé, recopié par set_level pour filtrer sans appel de fonction
+    _level: int = logging.DEBUG
     
     @classmethod
     def _initialize_logger(cls):
         """Initialise le logger avec les gestionnaires et formateurs appropriés."""
+        with cls._init_lock:
+            # Une autre session a pu initialiser le logger pendant l'attente du verrou
+            if cls._logger is None:
+                cls._logger = cls._create_logger()
+    
+    @classmethod
+    def _create_logger(cls) -> logging.Logger:
+        """Crée le logger et lui attache ses gestionnaires."""
         # Créer le logger
-        cls._logger = logging.getLogger("GameAIClient")
-        cls._logger.setLevel(logging.DEBUG)
+        logger = logging.getLogger("GameAIClient")
+        logger.setLevel(logging.DEBUG)
         
         # Ajouter un niveau de journalisation personnalisé
         logging.addLevelName(LogLevel.ACTION.value, "ACTION")
@@ -49,9 +89,10 @@ class Logger:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.DEBUG)
         
-        # Créer le gestionnaire de fichier
-        file_handler = logging.FileHandler(Config.LOG_FILE)
+        # Créer le gestionnaire de fichier, ouvert par le thread d'écriture au premier message
+        file_handler = logging.FileHandler(cls._file if cls._file is not None else Config.LOG_FILE, delay=True)
         file_handler.setLevel(logging.DEBUG)
+        cls._file_handler = file_handler
         
         # Créer le formateur
         formatter = logging.Formatter(
@@ -63,50 +104,161 @@ class Logger:
         console_handler.setFormatter(formatter)
         file_handler.setFormatter(formatter)
         
-        # Ajouter les gestionnaires au logger
-        cls._logger.addHandler(console_handler)
-        cls._logger.addHandler(file_handler)
+        # Les gestionnaires sont servis par le thread d'écriture, le logger ne fait que remplir la file
+        cls._handlers = [console_handler, file_handler]
+        cls._start_listener(logger)
+        atexit.register(cls.shutdown)
+        os.register_at_fork(after_in_child=cls._after_fork)
+        return logger
+    
+    @classmethod
+    def _start_listener(cls, logger: logging.Logger):
+        """Branche le logger sur une nouvelle file et démarre le thread d'écriture."""
+        queue = SimpleQueue()
+        cls._queue_handler = _DeferredQueueHandler(queue)
+        logger.addHandler(cls._queue_handler)
+        cls._listener = QueueListener(queue, *cls._handlers, respect_handler_level=True)
+        cls._listener.start()
+    
+    @classmethod
+    def _after_fork(cls):
+        """Relance le thread d'écriture dans un processus fils : les threads ne survivent pas à fork."""
+        if cls._logger is not None and cls._listener is not None:
+            cls._logger.removeHandler(cls._queue_handler)
+            cls._start_listener(cls._logger)
+    
+    @classmethod
+    def flush(cls):
+        """
+        Attend que tous les messages déjà journalisés soient écrits.
+        """
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener.start()
+    
+    @classmethod
+    def shutdown(cls):
+        """
+        Écrit les messages en attente et arrête le thread d'écriture (appelé à la sortie du programme).
+        Les messages suivants sont écrits directement, sans file.
+        """
+        with cls._init_lock:
+            if cls._listener is None:
+                return
+            cls._listener.stop()
+            cls._listener = None
+            cls._logger.removeHandler(cls._queue_handler)
+            for handler in cls._handlers:
+                handler.flush()
+                cls._logger.addHandler(handler)
+    
+    @classmethod
+    def set_level(cls, level: str):
+        """
+        Change le niveau minimal des messages journalisés.
+        
+        Args:
+            level: Nom du niveau (DEBUG, INFO, ACTION, WARNING, ERROR, CRITICAL)
+        """
+        if cls._logger is None:
+            cls._initialize_logger()
+        
+        cls._level = LogLevel[level].value
+        cls._logger.setLevel(cls._level)
+    
+    @classmethod
+    def set_file(cls, path: str):
+        """
+        Change le fichier de journalisation.
+        La journalisation est commune au processus : le fichier s'applique à toutes ses sessions.
+        
+        Args:
+            path: Chemin du fichier, ouvert au premier message
+        """
+        with cls._init_lock:
+            cls._file = path
+            old = cls._file_handler
+            if cls._logger is None or old.baseFilename == os.path.abspath(path):
+                return
+            handler = logging.FileHandler(path, delay=True)
+            handler.setLevel(old.level)
+            handler.setFormatter(old.formatter)
+            if cls._listener is not None:
+                # Les messages déjà en file sont écrits dans l'ancien fichier
+                cls._listener.stop()
+                cls._handlers[cls._handlers.index(old)] = handler
+                cls._listener.handlers = tuple(cls._handlers)
+                cls._listener.start()
+            else:
+                cls._handlers[cls._handlers.index(old)] = handler
+                cls._logger.removeHandler(old)
+                cls._logger.addHandler(handler)
+            cls._file_handler = handler
+            old.close()
+    
+    @classmethod
+    def is_enabled(cls, level: LogLevel) -> bool:
+        """
+        Indique si les messages d'un niveau sont journalisés, pour éviter de calculer les autres.
+        
+        Args:
+            level: Le niveau de journalisation
+            
+        Returns:
+            bool: True si le niveau est actif
+        """
+        if cls._logger is None:
+            cls._initialize_logger()
+        
+        return cls._logger.isEnabledFor(level.value)
     
     @classmethod
-    def log(cls, level: LogLevel, message: str):
+    def log(cls, level: LogLevel, message: str, *args: Any):
         """
         Journalise un message avec le niveau spécifié.
         
         Args:
             level: Le niveau de journalisation à utiliser
-            message: Le message à journaliser
+            message: Le message à journaliser, éventuellement avec des « %s »
+            args: Les valeurs des « %s », formatées seulement si le niveau est actif
         """
         if cls._logger is None:
             cls._initialize_logger()
         
-        cls._logger.log(level.value, message)
+        cls._logger.log(level.value, message, *args)
     
     @classmethod
-    def debug(cls, message: str):
+    def debug(cls, message: str, *args: Any):
         """Journalise un message de débogage."""
-        cls.log(LogLevel.DEBUG, message)
+        if _DEBUG >= cls._level:
+            cls.log(LogLevel.DEBUG, message, *args)
     
     @classmethod
-    def info(cls, message: str):
+    def info(cls, message: str, *args: Any):
         """Journalise un message d'information."""
-        cls.log(LogLevel.INFO, message)
+        if _INFO >= cls._level:
+            cls.log(LogLevel.INFO, message, *args)
     
     @classmethod
-    def action(cls, message: str):
+    def action(cls, message: str, *args: Any):
         """Journalise un message d'action (niveau personnalisé)."""
-        cls.log(LogLevel.ACTION, message)
+        if _ACTION >= cls._level:
+            cls.log(LogLevel.ACTION, message, *args)
     
     @classmethod
-    def warning(cls, message: str):
+    def warning(cls, message: str, *args: Any):
         """Journalise un message d'avertissement."""
-        cls.log(LogLevel.WARNING, message)
+        if _WARNING >= cls._level:
+            cls.log(LogLevel.WARNING, message, *args)
     
     @classmethod
-    def error(cls, message: str):
+    def error(cls, message: str, *args: Any):
         """Journalise un message d'erreur."""
-        cls.log(LogLevel.ERROR, message)
+        if _ERROR >= cls._level:
+            cls.log(LogLevel.ERROR, message, *args)
     
     @classmethod
-    def critical(cls, message: str):
+    def critical(cls, message: str, *args: Any):
         """Journalise un message critique."""
-        cls.log(LogLevel.CRITICAL, message)
+        if _CRITICAL >= cls._level:
+            cls.log(LogLevel.CRITICAL, message, *args)
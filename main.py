@@ -6,7 +6,6 @@ import argparse
 import sys
 from typing import Dict, Any
 
-from game_ai_client import AIClient
 from game_ai_client.utils import Config, Logger, LogLevel
 
 
@@ -41,23 +40,124 @@ def parse_arguments() -> Dict[str, Any]:
         help=f'Niveau de journalisation (par défaut: {Config.LOG_LEVEL})'
     )
     
+    parser.add_argument(
+        '--log-file',
+        type=str,
+        default=Config.LOG_FILE,
+        help=f'Fichier de journalisation (par défaut: {Config.LOG_FILE})'
+    )
+    
+    parser.add_argument(
+        '--strategy',
+        type=str,
+        choices=['default', 'montecarlo'],
+        default=Config.GAME_SETTINGS["strategy"],
+        help=f'Stratégie de décision (par défaut: {Config.GAME_SETTINGS["strategy"]})'
+    )
+    
+    parser.add_argument(
+        '--budget',
+        type=float,
+        default=Config.GAME_SETTINGS["decision_budget"] * 1000,
+        help=f'Temps de décision par tour en millisecondes, pour la stratégie montecarlo (par défaut: {Config.GAME_SETTINGS["decision_budget"] * 1000:g})'
+    )
+    
+    parser.add_argument(
+        '--search-workers',
+        type=int,
+        default=Config.GAME_SETTINGS["search_workers"],
+        help='Processus de recherche préchauffés pour la stratégie montecarlo (par défaut: 0, recherche dans le processus courant)'
+    )
+    
+    parser.add_argument(
+        '--scoring-cache',
+        type=int,
+        default=Config.GAME_SETTINGS["scoring_cache_size"],
+        help='Nombre d\'états dont les scores sont mémorisés (par défaut: 0, sans cache)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        metavar='FICHIER',
+        default=Config.GAME_SETTINGS["profile"],
+        help='Profil JSON des paramètres de la stratégie, produit par tune.py (par défaut: paramètres intégrés)'
+    )
+    
+    parser.add_argument(
+        '--no-wire-log',
+        action='store_true',
+        help='Ne pas journaliser chaque message échangé avec le serveur (production)'
+    )
+    
+    parser.add_argument(
+        '--deadline',
+        type=float,
+        default=None,
+        help='Temps maximal par tour en millisecondes, depuis DEBUT_TOUR ; au-delà la stratégie '
+             'est interrompue ou remplacée par l\'action de repli (par défaut: sans échéance)'
+    )
+    
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=Config.GAME_SETTINGS["timeout"],
+        help=f'Secondes sans réponse à une demande avant de se reconnecter (par défaut: {Config.GAME_SETTINGS["timeout"]})'
+    )
+    
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=Config.GAME_SETTINGS["retry_attempts"],
+        help=f'Tentatives de reconnexion après une coupure, avec un délai doublé à chaque fois '
+             f'(par défaut: {Config.GAME_SETTINGS["retry_attempts"]}, 0 pour abandonner la partie)'
+    )
+    
+    parser.add_argument(
+        '--record',
+        metavar='FICHIER',
+        default=Config.GAME_SETTINGS["record_file"],
+        help='Enregistre la partie dans ce fichier, pour la rejouer avec python -m game_ai_client.recording'
+    )
+    
     args = parser.parse_args()
     return vars(args)
 
 
-def configure_from_args(args: Dict[str, Any]):
+def configure_from_args(args: Dict[str, Any]) -> Config:
     """
     Configure l'application à partir des arguments de ligne de commande.
     
     Args:
         args: Dictionnaire des arguments analysés
+        
+    Returns:
+        Config: La configuration de la session
     """
-    # Mettre à jour la configuration
-    Config.HOSTNAME_SERVER = args['host']
-    Config.PORT_SERVER = args['port']
-    Config.LOG_LEVEL = args['log_level']
+    # Créer la configuration de la session
+    config = Config(
+        hostname_server=args['host'],
+        port_server=args['port'],
+        log_level=args['log_level'],
+        log_file=args['log_file'],
+        game_settings={
+            "strategy": args['strategy'],
+            "decision_budget": args['budget'] / 1000,
+            "search_workers": args['search_workers'],
+            "scoring_cache_size": args['scoring_cache'],
+            "profile": args['profile'],
+            "wire_logging": not args['no_wire_log'],
+            "turn_deadline": args['deadline'] / 1000 if args['deadline'] is not None else None,
+            "record_file": args['record'],
+            "timeout": args['timeout'],
+            "retry_attempts": args['retries'],
+        }
+    )
+    Logger.set_level(config.LOG_LEVEL)
+    Logger.set_file(config.LOG_FILE)
     
-    Logger.info(f"Configuré avec hôte={Config.HOSTNAME_SERVER}, port={Config.PORT_SERVER}")
+    Logger.info(f"Configuré avec hôte={config.HOSTNAME_SERVER}, port={config.PORT_SERVER}, "
+                f"stratégie={config.GAME_SETTINGS['strategy']}")
+    return config
 
 
 def main():
@@ -68,11 +168,14 @@ def main():
     args = parse_arguments()
     
     # Configurer l'application
-    configure_from_args(args)
+    config = configure_from_args(args)
     
     try:
+        # Importé après l'analyse des arguments : --help et les erreurs d'arguments restent instantanés
+        from game_ai_client import AIClient
+        
         # Démarrer le client IA directement via la méthode de classe
-        AIClient.start()
+        AIClient.start(config)
     except KeyboardInterrupt:
         Logger.info("Application terminée par l'utilisateur")
     except Exception as e:
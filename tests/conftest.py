@@ -0,0 +1,7 @@
+"""
+Configuration des tests : rend le package importable sans installation, comme les benchmarks.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,81 @@
+"""
+Tests d'équivalence du scoring vectorisé (score_batch) avec Scoring, sur des états de parties simulées.
+"""
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from game_ai_client import Strategy
+from game_ai_client.models import Deck
+from game_ai_client.scoring import batch
+from game_ai_client.scoring.params import DEFAULT_PARAMS, StrategyParams
+from game_ai_client.scoring.scoring import Scoring
+from game_ai_client.simulation import GameEngine
+from game_ai_client.tuning import sample
+from game_ai_client.utils import Logger
+
+# Graines des parties dont les états sont comparés
+GRAINES = range(4)
+
+
+@pytest.fixture(scope="module")
+def inputs():
+    """Arguments de Scoring rencontrés par le joueur 0 au fil de parties du moteur, avec les parties."""
+    Logger.set_level("ERROR")
+    rows = []
+    engines = []
+    for seed in GRAINES:
+        engine = GameEngine(4, seed)
+        strategies = [Strategy() for _ in range(4)]
+        decks = [Deck() for _ in range(4)]
+        engine.start()
+        while not engine.is_over():
+            player = engine.joueur_courant
+            state = engine.snapshot(player)
+            if player == 0:
+                # Snapshot séparé : Deck.add_card modifie les pioches de l'état joué
+                seen = engine.snapshot(player)
+                rows.append((seen.get_monstres_vivants(), seen.pioches, seen.moi, decks[player].copy(),
+                             seen.degats, seen.sous_tour + 1, seen.get_autres_joueurs(player)))
+                engines.append(engine.clone())
+            for command, args in strategies[player].decide(state, decks[player], player):
+                ok, turn_over = engine.execute(player, command, args)
+                if turn_over:
+                    break
+            engine.advance()
+    yield rows, engines
+    # La console du logger est celle capturée par pytest : tout écrire avant qu'elle ne soit fermée
+    Logger.shutdown()
+
+
+def as_pairs(scored):
+    return [(item["index"], item["score"]) for item in scored]
+
+
+def check_equivalence(rows, engines, params):
+    """Compare score_batch à Scoring état par état ; renvoie le nombre d'états à arrêt anticipé."""
+    monstres_scores, cartes_scores = batch.score_batch(batch.pack_states(rows), params)
+    engine_monstres, engine_cartes = batch.score_batch(batch.pack_engines(engines, 0), params)
+    assert batch.np.array_equal(monstres_scores, engine_monstres, equal_nan=True)
+    assert batch.np.array_equal(cartes_scores, engine_cartes, equal_nan=True)
+    arrets = 0
+    for row, args in enumerate(rows):
+        scoring = Scoring(*args, params)
+        assert as_pairs(batch.to_scored(monstres_scores[row])) == as_pairs(scoring.get_scored_monstres()), row
+        assert as_pairs(batch.to_scored(cartes_scores[row])) == as_pairs(scoring.get_scored_cartes()), row
+        arrets += len(scoring.get_scored_cartes()) < len(args[1])
+    return arrets
+
+
+def test_default_params(inputs):
+    rows, engines = inputs
+    # Le scoring des cartes s'arrête à la première carte DEFENSE mortelle : ces états doivent être couverts
+    assert check_equivalence(rows, engines, DEFAULT_PARAMS) > 0
+
+
+def test_sampled_params(inputs):
+    rows, engines = inputs
+    # Paramètres tirés comme pendant le réglage (tune.py)
+    check_equivalence(rows, engines, StrategyParams(**sample(random.Random(0))))
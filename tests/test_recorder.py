@@ -0,0 +1,81 @@
+"""
+Tests de l'enregistreur de parties : ajout d'une partie après un enregistrement tronqué.
+"""
+import os
+
+import pytest
+
+from game_ai_client import AIClient
+from game_ai_client.recording import MatchRecorder
+from game_ai_client.recording.dataset import convert
+from game_ai_client.recording.format import HEADER, MAGIC, RECV, SEND, complete_length
+from game_ai_client.recording.index import MappedFile
+from game_ai_client.recording.replay import read_games
+from game_ai_client.server.game import LocalGame
+from game_ai_client.server.transport import MemoryConnection
+from game_ai_client.session import GameSession
+from game_ai_client.utils import Logger
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger():
+    Logger.set_level("ERROR")
+    yield
+    # La console du logger est celle capturée par pytest : tout écrire avant qu'elle ne soit fermée
+    Logger.shutdown()
+
+
+def record(path: str, seeds):
+    """Enregistre une partie en mémoire par graine, chacune avec un nouvel enregistreur (nouveau processus)."""
+    for seed in seeds:
+        session = GameSession(connection=MemoryConnection(LocalGame(4, seed), seed % 4),
+                              recorder=MatchRecorder(path))
+        AIClient(session).run_game_loop()
+
+
+def messages(game):
+    return [(record.kind, record.text) for record in game.records if record.kind in (RECV, SEND)]
+
+
+def test_game_after_truncated_tail(tmp_path):
+    path = str(tmp_path / "parties.p24r")
+    record(path, [0])
+    first_game = os.path.getsize(path)
+    record(path, [1])
+    # Programme interrompu au milieu de la deuxième partie, pendant l'écriture d'un enregistrement
+    cut = (first_game + os.path.getsize(path)) // 2
+    with open(path, 'r+b') as stream:
+        stream.truncate(cut)
+        assert complete_length(stream) < cut
+    record(path, [2])
+
+    reference = str(tmp_path / "reference.p24r")
+    record(reference, [2])
+    games = list(read_games(path))
+    assert len(games) == 3
+    assert messages(games[2]) == messages(next(read_games(reference)))
+
+    with MappedFile(path) as mapped, MappedFile(reference) as expected:
+        assert mapped.games == 3
+        assert mapped.turn_count(2) == expected.turn_count(0)
+    assert convert([path], str(tmp_path / "tours.p24d"))["games"] == 3
+
+
+def test_complete_length(tmp_path):
+    path = tmp_path / "parties.p24r"
+    record(str(path), [0])
+    size = os.path.getsize(path)
+    with open(path, 'ab') as stream:
+        stream.write(HEADER.pack(RECV, 0, 100) + b"DEBUT")
+    with open(path, 'rb') as stream:
+        assert complete_length(stream) == size
+
+    path.write_bytes(MAGIC[:3])
+    with open(path, 'rb') as stream:
+        assert complete_length(stream) == 0
+    record(str(path), [0])
+    assert len(list(read_games(str(path)))) == 1
+
+    path.write_bytes(b"pas un enregistrement")
+    with open(path, 'rb') as stream, pytest.raises(ValueError):
+        complete_length(stream)
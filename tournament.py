@@ -0,0 +1,93 @@
+"""
+Point d'entrée du tournoi en auto-apprentissage.
+Oppose des variantes de stratégie sur des parties simulées, réparties sur tous les cœurs.
+
+Usage:
+    python tournament.py --strategies default house house house --games 2000
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict
+
+from game_ai_client.tournament import STRATEGIES, run_tournament
+from game_ai_client.utils import Logger
+
+
+def parse_arguments() -> Dict[str, Any]:
+    """
+    Analyse les arguments de ligne de commande.
+
+    Returns:
+        Dict[str, Any]: Dictionnaire des arguments analysés
+    """
+    parser = argparse.ArgumentParser(description='Tournoi entre variantes de stratégie')
+
+    parser.add_argument(
+        '--strategies',
+        nargs='+',
+        default=['default', 'house', 'house', 'house'],
+        help=f'Variante de chaque joueur (disponibles: {", ".join(sorted(STRATEGIES))})'
+    )
+
+    parser.add_argument(
+        '--games',
+        type=int,
+        default=1000,
+        help='Nombre de parties (par défaut: 1000)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count(),
+        help=f'Nombre de processus (par défaut: {os.cpu_count()})'
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Graine de la première partie (par défaut: 0)'
+    )
+
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=16,
+        help='Parties par tâche envoyée à un processus (par défaut: 16)'
+    )
+
+    return vars(parser.parse_args())
+
+
+def main() -> int:
+    """
+    Point d'entrée principal du tournoi.
+    """
+    args = parse_arguments()
+    Logger.set_level("WARNING")
+
+    start = time.perf_counter()
+    played = 0
+    stats = {}
+    try:
+        for stats in run_tournament(args['strategies'], args['games'], args['workers'], args['seed'], args['batch_size']):
+            played = sum(variant.games for variant in stats.values()) // len(args['strategies'])
+            elapsed = time.perf_counter() - start
+            print(f"\r{played}/{args['games']} parties ({played / elapsed:.0f} parties/s)", end='', file=sys.stderr)
+    except ValueError as e:
+        Logger.error(str(e))
+        return 1
+    print(file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    print(f"{played} parties en {elapsed:.2f} s avec {args['workers']} processus ({played / elapsed:.0f} parties/s)")
+    for variant in stats.values():
+        print(variant)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Point d'entrée du réglage hors ligne des paramètres de la stratégie.
+Cherche le meilleur jeu de paramètres en auto-apprentissage, sur tous les cœurs, l'enregistre dans un profil
+JSON (à charger avec main.py --profile) puis le compare aux paramètres par défaut sur de nouvelles parties.
+
+Usage:
+    python tune.py --opponents house house house --generations 10 --population 16 --games 200 --output profil.json
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict
+
+from game_ai_client.scoring.params import StrategyParams
+from game_ai_client.tournament import STRATEGIES
+from game_ai_client.tuning import default_candidate, evaluate, tune
+from game_ai_client.utils import Logger
+
+
+def parse_arguments() -> Dict[str, Any]:
+    """
+    Analyse les arguments de ligne de commande.
+
+    Returns:
+        Dict[str, Any]: Dictionnaire des arguments analysés
+    """
+    parser = argparse.ArgumentParser(description='Réglage des paramètres de la stratégie')
+
+    parser.add_argument(
+        '--opponents',
+        nargs='+',
+        default=['house', 'house', 'house'],
+        help=f'Variante de chaque adversaire (disponibles: {", ".join(sorted(STRATEGIES))})'
+    )
+
+    parser.add_argument(
+        '--generations',
+        type=int,
+        default=10,
+        help='Nombre de générations (par défaut: 10)'
+    )
+
+    parser.add_argument(
+        '--population',
+        type=int,
+        default=16,
+        help='Jeux de paramètres évalués par génération (par défaut: 16)'
+    )
+
+    parser.add_argument(
+        '--games',
+        type=int,
+        default=200,
+        help='Parties jouées par chaque jeu de paramètres (par défaut: 200)'
+    )
+
+    parser.add_argument(
+        '--validation-games',
+        type=int,
+        default=1000,
+        help='Parties, sur d\'autres graines, pour comparer le profil aux paramètres par défaut (par défaut: 1000)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count(),
+        help=f'Nombre de processus (par défaut: {os.cpu_count()})'
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Graine de la première partie (par défaut: 0)'
+    )
+
+    parser.add_argument(
+        '--search-seed',
+        type=int,
+        default=None,
+        help='Graine des tirages de la recherche (par défaut: aléatoire)'
+    )
+
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=16,
+        help='Parties par tâche envoyée à un processus (par défaut: 16)'
+    )
+
+    parser.add_argument(
+        '--output',
+        metavar='FICHIER',
+        default='profil.json',
+        help='Profil JSON où enregistrer le meilleur jeu de paramètres (par défaut: profil.json)'
+    )
+
+    return vars(parser.parse_args())
+
+
+def main() -> int:
+    """
+    Point d'entrée principal du réglage.
+    """
+    args = parse_arguments()
+    Logger.set_level("WARNING")
+
+    start = time.perf_counter()
+    best = default_candidate()
+    try:
+        for step in tune(args['opponents'], args['generations'], args['population'], args['games'],
+                         args['workers'], args['seed'], args['batch_size'], search_seed=args['search_seed']):
+            best = step.best
+            if step.improved:
+                StrategyParams(**best).save(args['output'])
+            elapsed = time.perf_counter() - start
+            print(f"génération {step.generation + 1}/{args['generations']} ({elapsed:.0f} s, sigma={step.sigma:.3f}) "
+                  f"{'meilleur' if step.improved else 'inchangé'} : victoires={step.stats.win_rate:6.1%} "
+                  f"savoir={step.stats.mean_savoir:8.1f}", file=sys.stderr)
+    except ValueError as e:
+        Logger.error(str(e))
+        return 1
+
+    params = StrategyParams(**best)
+    print(f"profil enregistré dans {args['output']} : {params}")
+    if args['validation_games'] > 0:
+        first = args['seed'] + args['games']
+        seeds = list(range(first, first + args['validation_games']))
+        for stats in evaluate([default_candidate(), best], args['opponents'], seeds, args['workers'],
+                              args['batch_size'], names=['défaut', 'profil']):
+            print(stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())